@@ -1,6 +1,7 @@
-from .main import main, main_short
+from .main import main, main_client, main_short
 
 __all__ = [
     "main",
+    "main_client",
     "main_short",
 ]
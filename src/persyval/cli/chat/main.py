@@ -1,11 +1,15 @@
-import pathlib  # noqa: TC003
+import pathlib
+import sys
 from typing import Annotated, Final
 
 import environs
+import rich.console
 import typer
 
 from persyval.cli.constants import CLI_DOC_NEWLINE, CLI_DOC_NEWLINE_AT_END
+from persyval.services.chat.batch import main_batch
 from persyval.services.chat.main import main_chat
+from persyval.services.data_storage.data_storage import DataStorageMode
 from persyval.services.get_paths.get_app_dirs import get_data_dir_in_user_space
 
 app = typer.Typer(
@@ -16,6 +20,12 @@ ENV_VAR_NAME_I_PREDEFINED_INPUT: Final[str] = "PERSYVAL_I_PREDEFINED_INPUT"
 
 ENV_VAR_NAME_I_NO_PERSISTENCE: Final[str] = "PERSYVAL_I_NO_PERSISTENCE"
 
+ENV_VAR_NAME_I_STORAGE_MODE: Final[str] = "PERSYVAL_I_STORAGE_MODE"
+
+ENV_VAR_NAME_I_LAZY_LOAD: Final[str] = "PERSYVAL_I_LAZY_LOAD"
+
+ENV_VAR_NAME_I_SAVE_WINDOW: Final[str] = "PERSYVAL_I_SAVE_WINDOW"
+
 
 @app.command()
 def run(  # noqa: PLR0913
@@ -91,6 +101,38 @@ def run(  # noqa: PLR0913
             f"{CLI_DOC_NEWLINE_AT_END}",
         ),
     ] = None,
+    storage_mode: Annotated[
+        DataStorageMode | None,
+        typer.Option(
+            help=f"Storage mode. {CLI_DOC_NEWLINE}"
+            f"'{DataStorageMode.SNAPSHOT}' rewrites the whole data file on each change. "
+            f"'{DataStorageMode.JOURNAL}' appends each change to the journal file. "
+            f"'{DataStorageMode.SQLITE}' keeps data in the SQLite database. "
+            f"Useful for big storages. {CLI_DOC_NEWLINE}"
+            f"By default, detected by the storage directory. {CLI_DOC_NEWLINE}"
+            f"Related env var: '{ENV_VAR_NAME_I_STORAGE_MODE}' {CLI_DOC_NEWLINE_AT_END}",
+        ),
+    ] = None,
+    lazy_load: Annotated[
+        bool,
+        typer.Option(
+            "--lazy-load",
+            help=f"Load items from the data file only when they are used. {CLI_DOC_NEWLINE}"
+            "Useful for big storages and single commands. "
+            f"Works for the data file, that is saved with the offsets index. {CLI_DOC_NEWLINE}"
+            f"Related env var: '{ENV_VAR_NAME_I_LAZY_LOAD}' {CLI_DOC_NEWLINE_AT_END}",
+        ),
+    ] = False,
+    save_window: Annotated[
+        float | None,
+        typer.Option(
+            help=f"Window for the background saving in seconds. {CLI_DOC_NEWLINE}"
+            f"Changes inside the window are written at once. Works in the '{DataStorageMode.SNAPSHOT}' mode. "
+            f"Useful for scripted batches of changes. {CLI_DOC_NEWLINE}"
+            f"By default, each change is saved immediately. {CLI_DOC_NEWLINE}"
+            f"Related env var: '{ENV_VAR_NAME_I_SAVE_WINDOW}' {CLI_DOC_NEWLINE_AT_END}",
+        ),
+    ] = None,
     #
     use_advanced_completer: Annotated[
         bool,
@@ -124,6 +166,14 @@ def run(  # noqa: PLR0913
         storage_dir_external=storage_dir,
     )
 
+    persyval_i_storage_mode = environs.env.str(ENV_VAR_NAME_I_STORAGE_MODE, "")
+
+    storage_mode_fact = storage_mode or (DataStorageMode(persyval_i_storage_mode) if persyval_i_storage_mode else None)
+
+    lazy_load = lazy_load or environs.env.bool(ENV_VAR_NAME_I_LAZY_LOAD, False)
+
+    save_window = save_window or environs.env.float(ENV_VAR_NAME_I_SAVE_WINDOW, 0) or None
+
     main_chat(
         show_commands=show_commands,
         hide_intro=hide_intro,
@@ -137,11 +187,119 @@ def run(  # noqa: PLR0913
         predefined_input=predefined_input,
         #
         storage_dir=storage_dir_fact,
+        storage_mode=storage_mode_fact,
+        lazy_load=lazy_load,
+        save_window=save_window,
         #
         use_advanced_completer=use_advanced_completer,
     )
 
 
+BATCH_FILE_I_STDIN: Final[pathlib.Path] = pathlib.Path("-")
+
+
+@app.command()
+def batch(  # noqa: PLR0913
+    *,
+    file: Annotated[
+        pathlib.Path,
+        typer.Option(
+            "--file",
+            help=f"File with commands. One command per line. {CLI_DOC_NEWLINE}"
+            f"Empty lines and lines, that start with '#', are skipped. {CLI_DOC_NEWLINE}"
+            f"Use '{BATCH_FILE_I_STDIN}' to read commands from stdin.{CLI_DOC_NEWLINE_AT_END}",
+        ),
+    ] = BATCH_FILE_I_STDIN,
+    stop_on_error: Annotated[
+        bool,
+        typer.Option(
+            "--stop-on-error",
+            help=f"Skip the rest of commands after the first error.{CLI_DOC_NEWLINE_AT_END}",
+        ),
+    ] = False,
+    hide_report: Annotated[
+        bool,
+        typer.Option(
+            "--hide-report",
+            help=f"Hide the report with the status and the time of each command. {CLI_DOC_NEWLINE}"
+            f"The report is rendered to stderr.{CLI_DOC_NEWLINE_AT_END}",
+        ),
+    ] = False,
+    #
+    show_commands: Annotated[
+        bool,
+        typer.Option(
+            "--show-commands",
+            help=f"Show input commands. {CLI_DOC_NEWLINE}Useful for debugging purposes.{CLI_DOC_NEWLINE_AT_END}",
+        ),
+    ] = False,
+    plain_render: Annotated[
+        bool,
+        typer.Option(
+            "--plain-render",
+            help=f"Render plain text without any special formatting (e.g., colors, styles). {CLI_DOC_NEWLINE}"
+            f"Useful for simple terminals and CLI automation scripts.{CLI_DOC_NEWLINE_AT_END}",
+        ),
+    ] = False,
+    #
+    storage_dir: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            help=f"Storage directory. {CLI_DOC_NEWLINE} "
+            f"Use env var '{ENV_VAR_NAME_I_NO_PERSISTENCE}' if you want to disable storing data to the file system. "
+            f"{CLI_DOC_NEWLINE_AT_END}",
+        ),
+    ] = None,
+    storage_mode: Annotated[
+        DataStorageMode | None,
+        typer.Option(
+            help=f"Storage mode. {CLI_DOC_NEWLINE}"
+            f"By default, detected by the storage directory. {CLI_DOC_NEWLINE}"
+            f"Related env var: '{ENV_VAR_NAME_I_STORAGE_MODE}' {CLI_DOC_NEWLINE_AT_END}",
+        ),
+    ] = None,
+) -> None:
+    """Run the batch of chat commands.
+
+    All commands are run with one load of the storage. Changes are saved at once, after the last command.
+    Commands are non-interactive. So, all required arguments must be in the command.
+
+    Exits with the code 1, if some command fails.
+    """
+    environs.env.read_env()
+
+    storage_dir_fact = get_storage_dir_fact(
+        no_persistence=environs.env.bool(ENV_VAR_NAME_I_NO_PERSISTENCE, False),
+        storage_dir_external=storage_dir,
+    )
+
+    persyval_i_storage_mode = environs.env.str(ENV_VAR_NAME_I_STORAGE_MODE, "")
+
+    storage_mode_fact = storage_mode or (DataStorageMode(persyval_i_storage_mode) if persyval_i_storage_mode else None)
+
+    if file == BATCH_FILE_I_STDIN:
+        lines = sys.stdin.readlines()
+    else:
+        with file.open(encoding="utf-8") as f:
+            lines = f.readlines()
+
+    batch_result = main_batch(
+        lines=lines,
+        console=rich.console.Console(),
+        report_console=None if hide_report else rich.console.Console(stderr=True),
+        #
+        show_commands=show_commands,
+        plain_render=plain_render,
+        stop_on_error=stop_on_error,
+        #
+        storage_dir=storage_dir_fact,
+        storage_mode=storage_mode_fact,
+    )
+
+    if not batch_result.is_successful:
+        raise typer.Exit(code=1)
+
+
 def get_storage_dir_fact(
     *,
     no_persistence: bool,
@@ -5,7 +5,12 @@ import rich.console
 import typer
 
 from persyval.cli.chat.main import get_storage_dir_fact
+from persyval.services.data_storage.convert_data_format import convert_data_format
+from persyval.services.data_storage.data_storage import DataFileFormat  # noqa: TC001
 from persyval.services.data_storage_filler.data_storage_filler import (
+    FILL_SIZE_PRESET_AMOUNTS,
+    FillProfile,
+    FillSizePreset,
     fill_data_storage_by_path,
 )
 from persyval.services.get_paths.get_app_dirs import (
@@ -32,7 +37,7 @@ def clear_storage() -> None:
 
 
 @app.command()
-def fill_storage(
+def fill_storage(  # noqa: PLR0913
     *,
     amount: Annotated[
         int,
@@ -53,6 +58,49 @@ def fill_storage(
             help="Only add data in section, if it doesn't exist.",
         ),
     ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            help="Amount of processes for the data generation.",
+            min=1,
+        ),
+    ] = 1,
+    seed: Annotated[
+        int | None,
+        typer.Option(
+            help="Seed for the data generation. The same seed gives the same data.",
+        ),
+    ] = None,
+    preset: Annotated[
+        FillSizePreset | None,
+        typer.Option(
+            help="Size preset. Overrides the amount.",
+        ),
+    ] = None,
+    birthday_share: Annotated[
+        float,
+        typer.Option(
+            help="Share of contacts with the birthday.",
+            min=0,
+            max=1,
+        ),
+    ] = 0.5,
+    long_note_share: Annotated[
+        float,
+        typer.Option(
+            help="Share of notes with the long content.",
+            min=0,
+            max=1,
+        ),
+    ] = 0.0,
+    common_tag_share: Annotated[
+        float,
+        typer.Option(
+            help="Share of tags, that are taken from the small set of common tags.",
+            min=0,
+            max=1,
+        ),
+    ] = 0.0,
 ) -> None:
     """Fill the storage with some data."""
     fill_data_storage_by_path(
@@ -60,11 +108,52 @@ def fill_storage(
             no_persistence=False,
             storage_dir_external=storage_dir,
         ),
-        amount=amount,
+        amount=FILL_SIZE_PRESET_AMOUNTS[preset] if preset else amount,
         init_only=init_only,
+        workers=workers,
+        seed=seed,
+        profile=FillProfile(
+            birthday_share=birthday_share,
+            long_note_share=long_note_share,
+            common_tag_share=common_tag_share,
+        ),
     )
 
 
+@app.command()
+def convert_storage(
+    *,
+    to: Annotated[
+        DataFileFormat,
+        typer.Option(
+            help="Format of the data file to convert to.",
+        ),
+    ],
+    storage_dir: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            help="Storage directory.",
+        ),
+    ] = None,
+) -> None:
+    """Convert the data file of the storage to another format."""
+    storage_dir_fact = get_storage_dir_fact(
+        no_persistence=False,
+        storage_dir_external=storage_dir,
+    )
+    if storage_dir_fact is None:
+        msg = "Storage directory is not defined."
+        raise ValueError(msg)
+
+    is_converted = convert_data_format(storage_dir_fact, to)
+
+    console = rich.console.Console()
+    if is_converted:
+        console.print(f"Storage has been converted to the '{to}' format.")
+    else:
+        console.print(f"Storage already uses the '{to}' format.")
+
+
 @app.command()
 def debug() -> None:
     """Debug the application."""
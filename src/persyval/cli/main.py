@@ -2,6 +2,7 @@ import typer
 
 from persyval.cli.chat.main import app as app_chat
 from persyval.cli.helpers.main import app as app_helpers
+from persyval.cli.serve.main import app as app_serve
 
 app = typer.Typer(
     pretty_exceptions_enable=False,
@@ -10,3 +11,4 @@ app = typer.Typer(
 
 app.add_typer(app_chat, name="chat")
 app.add_typer(app_helpers, name="helpers")
+app.add_typer(app_serve, name="serve")
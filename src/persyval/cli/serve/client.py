@@ -0,0 +1,86 @@
+"""Thin client CLI of the storage server. Imports only what is needed to send the command."""
+
+import pathlib  # noqa: TC003
+import shutil
+import sys
+from typing import Annotated, Final
+
+import typer
+
+from persyval.cli.constants import CLI_DOC_NEWLINE, CLI_DOC_NEWLINE_AT_END
+from persyval.services.server.client import send_request
+from persyval.services.server.protocol import EXIT_CODE_I_ERROR, ServerRequest, get_default_socket_path
+
+app = typer.Typer(
+    pretty_exceptions_enable=False,
+    pretty_exceptions_show_locals=False,
+)
+
+ENV_VAR_NAME_I_SERVER_SOCKET: Final[str] = "PERSYVAL_I_SERVER_SOCKET"
+
+
+@app.command()
+def send(  # noqa: PLR0913
+    *,
+    predefined_input: Annotated[
+        str,
+        typer.Argument(help=f"Command to run on the server. Like for 'chat run'.{CLI_DOC_NEWLINE_AT_END}"),
+    ],
+    #
+    show_commands: Annotated[
+        bool,
+        typer.Option("--show-commands", help=f"Show input commands.{CLI_DOC_NEWLINE_AT_END}"),
+    ] = False,
+    plain_render: Annotated[
+        bool,
+        typer.Option(
+            "--plain-render",
+            help=f"Render plain text without any special formatting (e.g., colors, styles).{CLI_DOC_NEWLINE_AT_END}",
+        ),
+    ] = False,
+    raise_sys_exit_on_error: Annotated[
+        bool,
+        typer.Option("--raise-sys-exit-on-error", help=f"Exit with code 1 on error.{CLI_DOC_NEWLINE_AT_END}"),
+    ] = False,
+    #
+    storage_dir: Annotated[
+        pathlib.Path | None,
+        typer.Option(help=f"Storage directory of the server. Used to find its socket.{CLI_DOC_NEWLINE_AT_END}"),
+    ] = None,
+    socket_path: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--socket",
+            envvar=ENV_VAR_NAME_I_SERVER_SOCKET,
+            help=f"Socket of the server. {CLI_DOC_NEWLINE}"
+            f"By default, the socket in the storage directory.{CLI_DOC_NEWLINE_AT_END}",
+        ),
+    ] = None,
+) -> None:
+    """Send the command to the running storage server and show its output.
+
+    Works like 'chat run --non-interactive', but without the start of the app and the load of the storage.
+    """
+    is_terminal = sys.stdout.isatty()
+
+    request = ServerRequest(
+        predefined_input=predefined_input,
+        show_commands=show_commands,
+        plain_render=plain_render,
+        raise_sys_exit_on_error=raise_sys_exit_on_error,
+        width=shutil.get_terminal_size().columns if is_terminal else None,
+        is_terminal=is_terminal,
+    )
+
+    try:
+        exit_code = send_request(
+            socket_path=socket_path or get_default_socket_path(storage_dir),
+            request=request,
+            output=sys.stdout,
+        )
+    except ConnectionError as e:
+        typer.secho(str(e), fg=typer.colors.RED, err=True)
+        raise typer.Exit(EXIT_CODE_I_ERROR) from e
+
+    if exit_code:
+        raise typer.Exit(exit_code)
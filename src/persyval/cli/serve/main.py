@@ -0,0 +1,86 @@
+import pathlib  # noqa: TC003
+import signal
+from typing import Annotated
+
+import rich.console
+import typer
+
+from persyval.cli.chat.main import get_storage_dir_fact
+from persyval.cli.constants import CLI_DOC_NEWLINE, CLI_DOC_NEWLINE_AT_END
+from persyval.cli.serve.client import ENV_VAR_NAME_I_SERVER_SOCKET, send
+from persyval.services.data_storage.data_storage import DataStorage, DataStorageMode
+from persyval.services.server.protocol import get_default_socket_path
+from persyval.services.server.server import open_storage_server
+
+app = typer.Typer(
+    pretty_exceptions_show_locals=False,
+)
+
+
+@app.command()
+def run(
+    *,
+    storage_dir: Annotated[
+        pathlib.Path | None,
+        typer.Option(help=f"Storage directory.{CLI_DOC_NEWLINE_AT_END}"),
+    ] = None,
+    storage_mode: Annotated[
+        DataStorageMode | None,
+        typer.Option(
+            help=f"Storage mode. {CLI_DOC_NEWLINE}"
+            f"By default, detected by the storage directory.{CLI_DOC_NEWLINE_AT_END}",
+        ),
+    ] = None,
+    save_window: Annotated[
+        float | None,
+        typer.Option(
+            help=f"Window for the background saving in seconds. {CLI_DOC_NEWLINE}"
+            f"Changes inside the window are written at once. Works in the '{DataStorageMode.SNAPSHOT}' mode. "
+            f"{CLI_DOC_NEWLINE}"
+            f"By default, each change is saved immediately.{CLI_DOC_NEWLINE_AT_END}",
+        ),
+    ] = None,
+    socket_path: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--socket",
+            envvar=ENV_VAR_NAME_I_SERVER_SOCKET,
+            help=f"Socket to listen on. {CLI_DOC_NEWLINE}"
+            f"By default, the socket in the storage directory.{CLI_DOC_NEWLINE_AT_END}",
+        ),
+    ] = None,
+) -> None:
+    """Run the storage server.
+
+    Keeps the storage loaded and runs commands, that are sent by 'serve send'.
+    So, each command doesn't pay for the start of the app and the load of the storage.
+
+    Don't change the storage by other processes, while the server is running.
+    """
+    storage_dir_fact = get_storage_dir_fact(
+        no_persistence=False,
+        storage_dir_external=storage_dir,
+    )
+    socket_path_fact = socket_path or get_default_socket_path(storage_dir_fact)
+
+    # Note: Stop on SIGTERM, like on Ctrl+C. So, pending changes are saved on exit.
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    console = rich.console.Console()
+
+    with (
+        DataStorage.load(
+            dir_path=storage_dir_fact,
+            mode=storage_mode,
+            save_window=save_window,
+        ) as data_storage,
+        open_storage_server(socket_path=socket_path_fact, data_storage=data_storage) as server,
+    ):
+        console.print(f"Serving on the socket: {socket_path_fact}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            console.print("Server is stopped.")
+
+
+app.command()(send)
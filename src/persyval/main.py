@@ -1,10 +1,19 @@
-from persyval.cli.chat.main import app as app_chat
-from persyval.cli.main import app as app_full
+# Note: Apps are imported on call. So, the thin client doesn't import the whole app.
 
 
 def main() -> None:
+    from persyval.cli.main import app as app_full  # noqa: PLC0415
+
     app_full()
 
 
 def main_short() -> None:
+    from persyval.cli.chat.main import app as app_chat  # noqa: PLC0415
+
     app_chat()
+
+
+def main_client() -> None:
+    from persyval.cli.serve.client import app as app_client  # noqa: PLC0415
+
+    app_client()
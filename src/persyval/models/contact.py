@@ -6,11 +6,16 @@ from typing import TYPE_CHECKING, Annotated, Final, NewType
 from prompt_toolkit import HTML
 from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_serializer
 
-from persyval.services.birthday.parse_and_format import format_birthday_for_edit_and_export, format_birthday_for_output
+from persyval.services.birthday.parse_and_format import (
+    format_birthday_for_edit_and_export,
+    format_birthday_for_output,
+    parse_birthday,
+)
 from persyval.services.birthday.validate_birthday import validate_birthday
 from persyval.services.email.validate_email import validate_email_list
 from persyval.services.model_meta.field_meta import FieldItemMetaConfig, FieldsMetaConfig, FilterMode
 from persyval.services.model_meta.model_meta_info import ModelMetaInfo
+from persyval.services.model_meta.trusted_validation import skip_for_trusted
 from persyval.services.phone.validate_phone_list import validate_phone_list
 
 if TYPE_CHECKING:
@@ -32,7 +37,7 @@ class Contact(BaseModel):
     # noinspection Pydantic
     phones: Annotated[
         list[str],
-        AfterValidator(validate_phone_list),
+        AfterValidator(skip_for_trusted(validate_phone_list)),
     ] = Field(
         default_factory=list,
         description="List of phone numbers associated with the contact.",
@@ -40,7 +45,7 @@ class Contact(BaseModel):
     # noinspection Pydantic
     emails: Annotated[
         list[str],
-        AfterValidator(validate_email_list),
+        AfterValidator(skip_for_trusted(validate_email_list)),
     ] = Field(
         default_factory=list,
         description="List of email addresses associated with the contact.",
@@ -48,7 +53,7 @@ class Contact(BaseModel):
 
     birthday: Annotated[
         datetime.date | None,
-        AfterValidator(validate_birthday),
+        AfterValidator(skip_for_trusted(validate_birthday)),
     ] = None
 
     @field_serializer("birthday")
@@ -101,10 +106,12 @@ class Contact(BaseModel):
                     FieldItemMetaConfig(
                         name="name",
                         description="The name.",
+                        is_trigram_indexed=True,
                     ),
                     FieldItemMetaConfig(
                         name="address",
                         description="The address.",
+                        is_trigram_indexed=True,
                     ),
                     FieldItemMetaConfig(
                         name="phones",
@@ -122,7 +129,8 @@ class Contact(BaseModel):
                         name="birthday",
                         description="The birthday.",
                         filter_mode=FilterMode.EXACT,
-                        parse_func=validate_birthday,
+                        is_calendar_indexed=True,
+                        parse_func=lambda x: validate_birthday(parse_birthday(x)),  # pyright: ignore[reportUnknownArgumentType, reportUnknownLambdaType]
                     ),
                 ],
             ),
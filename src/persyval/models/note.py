@@ -88,11 +88,13 @@ class Note(BaseModel):
                     FieldItemMetaConfig(
                         name="title",
                         description="The title.",
+                        is_trigram_indexed=True,
                         is_groupable=False,
                     ),
                     FieldItemMetaConfig(
                         name="content",
                         description="The main content.",
+                        is_trigram_indexed=True,
                         is_groupable=False,
                     ),
                     FieldItemMetaConfig(
@@ -0,0 +1,57 @@
+import datetime
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+from persyval.services.birthday.get_nearest_anniversary import FEBRUARY_MONTH, LEAP_DAY, NON_LEAP_DAY, is_leap_year
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+type MonthDay = tuple[int, int]
+"""Day of the year, independent of the year. So, there are 366 of them."""
+
+LEAP_MONTH_DAY: MonthDay = (FEBRUARY_MONTH, LEAP_DAY)
+
+
+def get_month_day(date: datetime.date) -> MonthDay:
+    return date.month, date.day
+
+
+def get_celebrated_month_days(date: datetime.date) -> list[MonthDay]:
+    """Get birthdays (as days of the year), that are celebrated on the date.
+
+    Leap day birthdays are celebrated on February 28 in non-leap years. The same way as in `birthday_in_year`.
+    """
+    month_days = [get_month_day(date)]
+
+    if date.month == FEBRUARY_MONTH and date.day == NON_LEAP_DAY and not is_leap_year(date.year):
+        month_days.append(LEAP_MONTH_DAY)
+
+    return month_days
+
+
+def iterate_celebration_days(
+    start_date: datetime.date,
+    days: int,
+) -> Iterator[tuple[datetime.date, list[MonthDay]]]:
+    """Iterate over dates from the start date to the start date + days (inclusive) in calendar order.
+
+    Each day of the year is yielded once, on its nearest date. Windows longer than a year reach the same days again.
+    """
+    seen: set[MonthDay] = set()
+
+    for offset in range(days + 1):
+        date = start_date + datetime.timedelta(days=offset)
+
+        month_days = [month_day for month_day in get_celebrated_month_days(date) if month_day not in seen]
+        seen.update(month_days)
+
+        yield date, month_days
+
+
+@runtime_checkable
+class SupportsMonthDayLookup[T](Protocol):
+    """Collection, that can find items by the day of the year of the date field without the full scan."""
+
+    def get_items_by_month_days(self, field_name: str, month_days: Iterable[MonthDay]) -> dict[MonthDay, list[T]]:
+        """Get items grouped by the day of the year of the field. Only for the requested days."""
+        ...
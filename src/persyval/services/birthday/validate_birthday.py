@@ -1,8 +1,6 @@
 import datetime
 from typing import Final
 
-from dateutil.relativedelta import relativedelta
-
 from persyval.exceptions.main import InvalidDataError
 
 MAX_AGE: Final[int] = 200
@@ -37,6 +35,9 @@ def validate_birthday(date: datetime.date | None) -> datetime.date | None:
         msg = "Birthday date can not be in future."
         raise InvalidDataError(msg)
 
+    # Note: Import on the first use. Not on the start of CLI.
+    from dateutil.relativedelta import relativedelta  # noqa: PLC0415
+
     # Check age limit.
     difference = relativedelta(current_date, date)
     if difference.years > MAX_AGE:
@@ -0,0 +1,201 @@
+"""Batch of chat commands. Run in one session of the storage.
+
+So, the script of many commands pays for the start of the app and the load of the storage only once.
+Changes of all commands are persisted at once, on the end of the batch.
+"""
+
+import enum
+import time
+from typing import TYPE_CHECKING, Final
+
+from pydantic import BaseModel
+from rich.table import Table
+
+from persyval.services.chat.parse_input_and_make_action import LoopAction, parse_input_and_make_action
+from persyval.services.data_storage.data_storage import DataStorage, DataStorageMode
+from persyval.services.execution_queue.execution_queue import create_execution_queue
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterable
+
+    from rich.console import Console
+
+COMMENT_PREFIX: Final[str] = "#"
+
+
+class BatchCommand(BaseModel):
+    line_number: int
+    user_input: str
+
+
+@enum.unique
+class BatchCommandStatus(enum.StrEnum):
+    OK = enum.auto()
+    ERROR = enum.auto()
+    SKIPPED = enum.auto()
+
+
+class BatchCommandResult(BaseModel):
+    command: BatchCommand
+    status: BatchCommandStatus
+    seconds: float = 0
+
+
+class BatchResult(BaseModel):
+    results: list[BatchCommandResult]
+
+    @property
+    def is_successful(self) -> bool:
+        return all(result.status == BatchCommandStatus.OK for result in self.results)
+
+
+def parse_batch_lines(lines: Iterable[str]) -> list[BatchCommand]:
+    """Each line is a command. Empty lines and comments are skipped."""
+    commands: list[BatchCommand] = []
+    for line_number, line in enumerate(lines, start=1):
+        user_input = line.strip()
+        if not user_input or user_input.startswith(COMMENT_PREFIX):
+            continue
+
+        commands.append(BatchCommand(line_number=line_number, user_input=user_input))
+
+    return commands
+
+
+def run_batch_command(
+    *,
+    console: Console,
+    data_storage: DataStorage,
+    command: BatchCommand,
+    show_commands: bool = False,
+    plain_render: bool = False,
+) -> tuple[BatchCommandStatus, LoopAction]:
+    execution_queue = create_execution_queue()
+    execution_queue.put(command.user_input)
+
+    loop_action = LoopAction.CONTINUE
+    # Note: Handler can put follow-up commands to the queue. They are part of the same command.
+    while not execution_queue.empty() and loop_action == LoopAction.CONTINUE:
+        try:
+            loop_action = parse_input_and_make_action(
+                console=console,
+                data_storage=data_storage,
+                #
+                execution_queue=execution_queue,
+                show_commands=show_commands,
+                #
+                non_interactive=True,
+                plain_render=plain_render,
+                terminal_simplified=True,
+                # Note: The error is already rendered. Raised to know the status of the command.
+                throw_full_error=True,
+            )
+        except Exception:  # noqa: BLE001
+            return BatchCommandStatus.ERROR, LoopAction.CONTINUE
+
+    return BatchCommandStatus.OK, loop_action
+
+
+def run_batch(  # noqa: PLR0913
+    *,
+    console: Console,
+    data_storage: DataStorage,
+    commands: list[BatchCommand],
+    show_commands: bool = False,
+    plain_render: bool = False,
+    stop_on_error: bool = False,
+) -> BatchResult:
+    """Run commands one by one. Changes are persisted at once, on the end of the batch.
+
+    Commands after the `exit` command, or after the first error with `stop_on_error`, are skipped.
+    """
+    results: list[BatchCommandResult] = []
+    is_stopped = False
+
+    with data_storage.transaction():
+        for command in commands:
+            if is_stopped:
+                results.append(BatchCommandResult(command=command, status=BatchCommandStatus.SKIPPED))
+                continue
+
+            started_at = time.perf_counter()
+            status, loop_action = run_batch_command(
+                console=console,
+                data_storage=data_storage,
+                command=command,
+                show_commands=show_commands,
+                plain_render=plain_render,
+            )
+            results.append(
+                BatchCommandResult(command=command, status=status, seconds=time.perf_counter() - started_at),
+            )
+
+            match loop_action:
+                case LoopAction.EXIT:
+                    is_stopped = True
+                case _:
+                    is_stopped = stop_on_error and status == BatchCommandStatus.ERROR
+
+    return BatchResult(results=results)
+
+
+def render_batch_report(console: Console, batch_result: BatchResult) -> None:
+    table = Table(title="Batch Report", title_justify="left")
+    table.add_column("Line", justify="right")
+    table.add_column("Command")
+    table.add_column("Status")
+    table.add_column("Time, ms", justify="right")
+
+    for result in batch_result.results:
+        table.add_row(
+            str(result.command.line_number),
+            result.command.user_input,
+            result.status,
+            f"{result.seconds * 1000:.1f}",
+        )
+
+    console.print(table)
+
+
+def main_batch(  # noqa: PLR0913
+    *,
+    lines: Iterable[str],
+    console: Console,
+    report_console: Console | None = None,
+    #
+    show_commands: bool = False,
+    plain_render: bool = False,
+    stop_on_error: bool = False,
+    #
+    storage_dir: pathlib.Path | None = None,
+    storage_mode: DataStorageMode | None = None,
+) -> BatchResult:
+    """Load the storage, run the batch and render the report.
+
+    Args:
+        lines: Lines of the script.
+        console: Console for the output of commands.
+        report_console: Console for the report. If `None`, the report is not rendered.
+        show_commands: Show input commands.
+        plain_render: Render plain text without any special formatting.
+        stop_on_error: Skip the rest of commands after the first error.
+        storage_dir: Storage directory. If `None`, storage is temporary.
+        storage_mode: Storage mode. By default, detected by the storage directory.
+    """
+    commands = parse_batch_lines(lines)
+
+    with DataStorage.load(dir_path=storage_dir, mode=storage_mode) as data_storage:
+        batch_result = run_batch(
+            console=console,
+            data_storage=data_storage,
+            commands=commands,
+            show_commands=show_commands,
+            plain_render=plain_render,
+            stop_on_error=stop_on_error,
+        )
+
+    if report_console is not None:
+        render_batch_report(report_console, batch_result)
+
+    return batch_result
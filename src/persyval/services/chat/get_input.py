@@ -1,6 +1,6 @@
+import asyncio
 from typing import TYPE_CHECKING, Any
 
-from persyval.services.console.completer import get_completer
 from persyval.utils.format import format_prompt_message
 
 if TYPE_CHECKING:
@@ -8,24 +8,33 @@ if TYPE_CHECKING:
     from rich.console import Console
 
 
-def get_input(
+def create_prompt_session() -> PromptSession[Any]:
+    from prompt_toolkit import PromptSession  # noqa: PLC0415
+
+    return PromptSession()
+
+
+async def get_input_async(
     *,
     console: Console,
     prompt_session: PromptSession[Any] | None,
     use_advanced_completer: bool = False,
 ) -> str:
+    """Wait for the input without blocking the event loop."""
     input_prompt_msg = format_prompt_message("Enter command: ")
     console.print(input_prompt_msg)
 
     if prompt_session:
+        from persyval.services.console.completer import get_completer  # noqa: PLC0415
+
         result = str(
-            prompt_session.prompt(  # pyright: ignore[reportUnknownArgumentType]
+            await prompt_session.prompt_async(  # pyright: ignore[reportUnknownArgumentType]
                 message="> ",
                 completer=get_completer(use_advanced_completer=use_advanced_completer),
                 show_frame=True,
             ),
         )
     else:
-        result = input("> ")
+        result = await asyncio.to_thread(input, "> ")
 
     return str(result)
@@ -1,20 +1,22 @@
+import asyncio
 from typing import TYPE_CHECKING, Any
 
-from prompt_toolkit import PromptSession
 from rich.console import Console
 
-from persyval.services.chat.get_input import get_input
+from persyval.services.chat.get_input import create_prompt_session, get_input_async
 from persyval.services.chat.parse_input_and_make_action import (
     LoopAction,
-    parse_input_and_make_action,
+    parse_input_and_make_action_async,
 )
-from persyval.services.data_storage.data_storage import DataStorage
+from persyval.services.data_storage.data_storage import DataStorage, DataStorageMode
 from persyval.services.execution_queue.execution_queue import create_execution_queue
 from persyval.services.intro.render_intro import render_intro
 
 if TYPE_CHECKING:
     import pathlib
 
+    from prompt_toolkit import PromptSession
+
 # TODO: (?) Group some args to class
 
 
@@ -32,14 +34,69 @@ def main_chat(  # noqa: PLR0913
     predefined_input: str | None = None,
     #
     storage_dir: pathlib.Path | None = None,
+    storage_mode: DataStorageMode | None = None,
+    lazy_load: bool = False,
+    save_window: float | None = None,
     #
     use_advanced_completer: bool = False,
 ) -> None:
+    asyncio.run(
+        main_chat_async(
+            show_commands=show_commands,
+            hide_intro=hide_intro,
+            #
+            non_interactive=non_interactive,
+            plain_render=plain_render,
+            terminal_simplified=terminal_simplified,
+            raise_sys_exit_on_error=raise_sys_exit_on_error,
+            throw_full_error=throw_full_error,
+            #
+            predefined_input=predefined_input,
+            #
+            storage_dir=storage_dir,
+            storage_mode=storage_mode,
+            lazy_load=lazy_load,
+            save_window=save_window,
+            #
+            use_advanced_completer=use_advanced_completer,
+        ),
+    )
+
+
+async def main_chat_async(  # noqa: PLR0913
+    *,
+    show_commands: bool = False,
+    hide_intro: bool = False,
+    #
+    non_interactive: bool = False,
+    plain_render: bool = False,
+    terminal_simplified: bool = False,
+    raise_sys_exit_on_error: bool = False,
+    throw_full_error: bool = False,
+    #
+    predefined_input: str | None = None,
+    #
+    storage_dir: pathlib.Path | None = None,
+    storage_mode: DataStorageMode | None = None,
+    lazy_load: bool = False,
+    save_window: float | None = None,
+    #
+    use_advanced_completer: bool = False,
+) -> None:
+    """Chat loop on the event loop.
+
+    Input is awaited. Sync handlers are run in worker threads. Async handlers are run on the loop.
+    Commands are still run one by one.
+    """
     with DataStorage.load(
         dir_path=storage_dir,
+        mode=storage_mode,
+        lazy=lazy_load,
+        save_window=save_window,
     ) as data_storage:
         console = Console()
-        prompt_session: PromptSession[Any] | None = None if terminal_simplified else PromptSession()
+        # Note: Created on the first input. Not needed for the predefined input.
+        prompt_session: PromptSession[Any] | None = None
 
         execution_queue = create_execution_queue()
 
@@ -48,7 +105,10 @@ def main_chat(  # noqa: PLR0913
 
         while True:
             if execution_queue.empty():
-                user_input = predefined_input or get_input(
+                if not predefined_input and not terminal_simplified and prompt_session is None:
+                    prompt_session = create_prompt_session()
+
+                user_input = predefined_input or await get_input_async(
                     console=console,
                     prompt_session=prompt_session,
                     use_advanced_completer=use_advanced_completer,
@@ -59,7 +119,7 @@ def main_chat(  # noqa: PLR0913
 
                 execution_queue.put(user_input)
 
-            loop_action = parse_input_and_make_action(
+            loop_action = await parse_input_and_make_action_async(
                 console=console,
                 data_storage=data_storage,
                 #
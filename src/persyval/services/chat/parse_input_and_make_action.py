@@ -1,10 +1,14 @@
 import enum
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, ConfigDict, SkipValidation
 
 from persyval.exceptions.main import InvalidCommandError
 from persyval.services.commands.commands_meta_registry import COMMANDS_META_REGISTRY
-from persyval.services.parse_input.parse_input import parse_input
+from persyval.services.execution_queue.execution_queue import HandlerArgsBase
+from persyval.services.handlers_base.handler_base import HandlerBase
+from persyval.services.parse_input.parse_input import T_ARGS, parse_input
 from persyval.utils.format import render_error
 
 if TYPE_CHECKING:
@@ -12,6 +16,7 @@ if TYPE_CHECKING:
 
     from persyval.services.data_storage.data_storage import DataStorage
     from persyval.services.execution_queue.execution_queue import ExecutionQueue
+    from persyval.services.handlers_base.handler_output import HandlerOutput
 
 
 @enum.unique
@@ -20,7 +25,20 @@ class LoopAction(enum.StrEnum):
     CONTINUE = "continue"
 
 
-def parse_input_and_make_action(  # noqa: PLR0913
+class HandlerCall(BaseModel):
+    """Handler with its arguments. Ready to run."""
+
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+    )
+
+    # Note: Already created handler. Validation would create the new one.
+    handler: SkipValidation[HandlerBase[Any]]
+    args: T_ARGS | None = None
+    parsed_args: HandlerArgsBase | None = None
+
+
+def prepare_handler_call(  # noqa: PLR0913
     *,
     console: Console,
     data_storage: DataStorage,
@@ -33,7 +51,12 @@ def parse_input_and_make_action(  # noqa: PLR0913
     terminal_simplified: bool = False,
     raise_sys_exit_on_error: bool = False,
     throw_full_error: bool = False,
-) -> LoopAction:
+) -> HandlerCall | LoopAction:
+    """Take the next input from the queue and create its handler.
+
+    Returns:
+        The loop action, if the input is not a valid command.
+    """
     user_input = execution_queue.get()
     if isinstance(user_input, str):
         try:
@@ -66,7 +89,7 @@ def parse_input_and_make_action(  # noqa: PLR0913
 
     command_meta = COMMANDS_META_REGISTRY[command]
 
-    handler_obj = command_meta.handler(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+    handler_obj = command_meta.get_handler()(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
         execution_queue=execution_queue,
         #
         data_storage=data_storage,
@@ -79,11 +102,18 @@ def parse_input_and_make_action(  # noqa: PLR0913
         throw_full_error=throw_full_error,
     )
 
-    handler_output = handler_obj.run(  # pyright: ignore[reportUnknownMemberType]
+    return HandlerCall(
+        handler=handler_obj,  # pyright: ignore[reportUnknownArgumentType]
         args=args,
         parsed_args=parsed_args,
     )
 
+
+def handle_handler_output(
+    *,
+    console: Console,
+    handler_output: HandlerOutput | None,
+) -> LoopAction:
     if handler_output is not None:
         if handler_output.message_rich:
             console.print(handler_output.message_rich)
@@ -92,3 +122,80 @@ def parse_input_and_make_action(  # noqa: PLR0913
             return LoopAction.EXIT
 
     return LoopAction.CONTINUE
+
+
+def parse_input_and_make_action(  # noqa: PLR0913
+    *,
+    console: Console,
+    data_storage: DataStorage,
+    #
+    execution_queue: ExecutionQueue,
+    show_commands: bool = False,
+    #
+    non_interactive: bool = False,
+    plain_render: bool = False,
+    terminal_simplified: bool = False,
+    raise_sys_exit_on_error: bool = False,
+    throw_full_error: bool = False,
+) -> LoopAction:
+    handler_call = prepare_handler_call(
+        console=console,
+        data_storage=data_storage,
+        #
+        execution_queue=execution_queue,
+        show_commands=show_commands,
+        #
+        non_interactive=non_interactive,
+        plain_render=plain_render,
+        terminal_simplified=terminal_simplified,
+        raise_sys_exit_on_error=raise_sys_exit_on_error,
+        throw_full_error=throw_full_error,
+    )
+    if isinstance(handler_call, LoopAction):
+        return handler_call
+
+    handler_output = handler_call.handler.run(
+        args=handler_call.args,
+        parsed_args=handler_call.parsed_args,
+    )
+
+    return handle_handler_output(console=console, handler_output=handler_output)
+
+
+async def parse_input_and_make_action_async(  # noqa: PLR0913
+    *,
+    console: Console,
+    data_storage: DataStorage,
+    #
+    execution_queue: ExecutionQueue,
+    show_commands: bool = False,
+    #
+    non_interactive: bool = False,
+    plain_render: bool = False,
+    terminal_simplified: bool = False,
+    raise_sys_exit_on_error: bool = False,
+    throw_full_error: bool = False,
+) -> LoopAction:
+    """Like `parse_input_and_make_action`, but the handler is run by the event loop."""
+    handler_call = prepare_handler_call(
+        console=console,
+        data_storage=data_storage,
+        #
+        execution_queue=execution_queue,
+        show_commands=show_commands,
+        #
+        non_interactive=non_interactive,
+        plain_render=plain_render,
+        terminal_simplified=terminal_simplified,
+        raise_sys_exit_on_error=raise_sys_exit_on_error,
+        throw_full_error=throw_full_error,
+    )
+    if isinstance(handler_call, LoopAction):
+        return handler_call
+
+    handler_output = await handler_call.handler.run_async(
+        args=handler_call.args,
+        parsed_args=handler_call.parsed_args,
+    )
+
+    return handle_handler_output(console=console, handler_output=handler_output)
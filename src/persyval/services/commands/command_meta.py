@@ -1,19 +1,38 @@
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
 
-from persyval.services.commands.args_config import ArgsConfig
 from persyval.services.commands.commands_enum import Command
-from persyval.services.handlers_base.handler_base import HandlerBase
+from persyval.utils.import_by_path import import_by_path
+
+if TYPE_CHECKING:
+    from persyval.services.commands.args_config import ArgsConfig
+    from persyval.services.handlers_base.handler_base import HandlerBase
 
 
 class CommandMeta(BaseModel):
+    """Meta of the command.
+
+    Handlers and their arguments are referenced by dotted paths. So, they are imported only on use.
+    Otherwise, each start of CLI imports all handlers with their dependencies.
+    """
+
     command: Command
-    args_config: ArgsConfig[Any] | None = None
+    args_config_path: Annotated[
+        str | None,
+        Field(description="Dotted path to the arguments configuration."),
+    ] = None
     description: str = Field(default="")
-    handler: type[HandlerBase]  # type: ignore[type-arg] # pyright: ignore[reportMissingTypeArgument]
+    handler_path: Annotated[str, Field(description="Dotted path to the handler class.")]
     hidden: Annotated[bool, Field(description="Hidden from hints and basic help.")] = False
 
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True,
-    )
+    def get_handler(self) -> type[HandlerBase[Any]]:
+        handler: type[HandlerBase[Any]] = import_by_path(self.handler_path)
+        return handler
+
+    def get_args_config(self) -> ArgsConfig[Any] | None:
+        if self.args_config_path is None:
+            return None
+
+        args_config: ArgsConfig[Any] = import_by_path(self.args_config_path)
+        return args_config
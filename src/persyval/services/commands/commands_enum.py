@@ -14,6 +14,7 @@ class Command(enum.StrEnum):
     CONTACTS_LIST = "contacts_list"
     CONTACT_ADD = "contact_add"
     CONTACTS_EXPORT = "contacts_export"
+    CONTACTS_IMPORT = "contacts_import"
 
     CONTACT_EDIT = "contact_edit"
     CONTACT_VIEW = "contact_view"
@@ -26,8 +27,10 @@ class Command(enum.StrEnum):
     NOTES_ROOT = "notes"
 
     NOTES_LIST = "notes_list"
+    NOTES_SEARCH = "notes_search"
     NOTE_ADD = "note_add"
     NOTES_EXPORT = "notes_export"
+    NOTES_IMPORT = "notes_import"
 
     NOTE_EDIT = "note_edit"
     NOTE_VIEW = "note_view"
@@ -62,6 +65,7 @@ COMMANDS_ORDER: Final[list[Command]] = [
     Command.CONTACTS_LIST,
     Command.CONTACT_ADD,
     Command.CONTACTS_EXPORT,
+    Command.CONTACTS_IMPORT,
     #
     Command.CONTACT_EDIT,
     Command.CONTACT_VIEW,
@@ -74,12 +78,14 @@ COMMANDS_ORDER: Final[list[Command]] = [
     Command.NOTES_ROOT,
     #
     Command.NOTES_LIST,
+    Command.NOTES_SEARCH,
     Command.NOTE_ADD,
     #
     Command.NOTE_EDIT,
     Command.NOTE_VIEW,
     Command.NOTE_DELETE,
     Command.NOTES_EXPORT,
+    Command.NOTES_IMPORT,
     # [notes]-[END]
     #
     # [storage]-[BEGIN]
@@ -1,223 +1,197 @@
+from typing import Final
+
 from persyval.models.contact import Contact
 from persyval.models.note import Note
 from persyval.services.commands.command_meta import CommandMeta
 from persyval.services.commands.commands_enum import Command
-from persyval.services.handlers.contact_add import (
-    CONTACT_ADD_I_ARGS_CONFIG,
-    ContactAddIHandler,
-)
-from persyval.services.handlers.contact_delete import (
-    CONTACT_DELETE_I_ARGS_CONFIG,
-    ContactDeleteIHandler,
-)
-from persyval.services.handlers.contact_edit import (
-    CONTACT_EDIT_I_ARGS_CONFIG,
-    ContactEditIHandler,
-)
-from persyval.services.handlers.contact_view import (
-    CONTACT_VIEW_I_ARGS_CONFIG,
-    ContactViewIHandler,
-)
-from persyval.services.handlers.contacts_export import ContactsExportIHandler
-from persyval.services.handlers.contacts_get_upcoming_birthdays import (
-    CONTACTS_GET_BIRTHDAYS_I_ARGS_CONFIG,
-    ContactsGetUpcomingBirthdaysIHandler,
-)
-from persyval.services.handlers.contacts_list import (
-    ContactsListIHandler,
-)
-from persyval.services.handlers.contacts_root import (
-    CONTACTS_ROOT_I_ARGS_CONFIG,
-    ContactsRootIHandler,
-)
-from persyval.services.handlers.exit import EXIT_I_ARGS_CONFIG, ExitIHandler
-from persyval.services.handlers.hello import HelloIHandler
-from persyval.services.handlers.help import HELP_I_ARGS_CONFIG, HelpIHandler
-from persyval.services.handlers.note_add import NoteAddIHandler
-from persyval.services.handlers.note_delete import NOTE_DELETE_I_ARGS_CONFIG, NoteDeleteIHandler
-from persyval.services.handlers.note_edit import NOTE_EDIT_I_ARGS_CONFIG, NoteEditIHandler
-from persyval.services.handlers.note_view import (
-    NOTE_VIEW_I_ARGS_CONFIG,
-    NoteViewIHandler,
-)
-from persyval.services.handlers.notes_export import NotesExportIHandler
-from persyval.services.handlers.notes_list import NotesListIHandler
-from persyval.services.handlers.notes_root import NOTES_ROOT_I_ARGS_CONFIG, NotesRootIHandler
-from persyval.services.handlers.root import RootIHandler
-from persyval.services.handlers.shared.args_i_empty import ARGS_CONFIG_I_EMPTY
-from persyval.services.handlers.shared.sort_and_filter import LIST_I_ARGS_CONFIG_CONTACTS, LIST_I_ARGS_CONFIG_NOTES
-from persyval.services.handlers.storage_clear import (
-    STORAGE_CLEAR_I_ARGS_CONFIG,
-    StorageClearIHandler,
-)
-from persyval.services.handlers.storage_root import (
-    STORAGE_ROOT_I_ARGS_CONFIG,
-    StorageRootIHandler,
-)
-from persyval.services.handlers.storage_stats import StorageStatsIHandler
+
+HANDLERS_PACKAGE: Final[str] = "persyval.services.handlers"
+
+# Note: Handlers are referenced by dotted paths. So, only the handler of the called command is imported.
 
 COMMANDS_META_REGISTRY: dict[Command, CommandMeta] = {
     item.command: item
     for item in [
         CommandMeta(
             command=Command.HELLO,
-            args_config=ARGS_CONFIG_I_EMPTY,
+            args_config_path=f"{HANDLERS_PACKAGE}.shared.args_i_empty.ARGS_CONFIG_I_EMPTY",
             description="Display greeting.",
-            handler=HelloIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.hello.HelloIHandler",
         ),
         CommandMeta(
             command=Command.ROOT,
-            args_config=ARGS_CONFIG_I_EMPTY,
+            args_config_path=f"{HANDLERS_PACKAGE}.shared.args_i_empty.ARGS_CONFIG_I_EMPTY",
             description="Display root menu.",
-            handler=RootIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.root.RootIHandler",
             hidden=True,
         ),
         #
         CommandMeta(
             command=Command.CONTACTS_ROOT,
-            args_config=CONTACTS_ROOT_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.contacts_root.CONTACTS_ROOT_I_ARGS_CONFIG",
             description=f"Manage {Contact.get_meta_info().plural_name}.",
-            handler=ContactsRootIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.contacts_root.ContactsRootIHandler",
         ),
         #
         CommandMeta(
             command=Command.CONTACTS_LIST,
-            args_config=LIST_I_ARGS_CONFIG_CONTACTS,
+            args_config_path=f"{HANDLERS_PACKAGE}.shared.sort_and_filter.LIST_I_ARGS_CONFIG_CONTACTS",
             description=f"List {Contact.get_meta_info().plural_name}. "
             f"With filtering and actions on the selected {Contact.get_meta_info().plural_name}.",
-            handler=ContactsListIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.contacts_list.ContactsListIHandler",
             hidden=True,
         ),
         CommandMeta(
             command=Command.CONTACT_ADD,
-            args_config=CONTACT_ADD_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.contact_add.CONTACT_ADD_I_ARGS_CONFIG",
             description=f"Add a {Contact.get_meta_info().singular_name}.",
-            handler=ContactAddIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.contact_add.ContactAddIHandler",
             hidden=True,
         ),
         CommandMeta(
             command=Command.CONTACTS_EXPORT,
-            args_config=CONTACT_ADD_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.contact_add.CONTACT_ADD_I_ARGS_CONFIG",
             description=f"Export {Contact.get_meta_info().plural_name.lower()} to file.",
-            handler=ContactsExportIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.contacts_export.ContactsExportIHandler",
+            hidden=True,
+        ),
+        CommandMeta(
+            command=Command.CONTACTS_IMPORT,
+            args_config_path=f"{HANDLERS_PACKAGE}.shared.import_items.IMPORT_I_ARGS_CONFIG",
+            description=f"Import {Contact.get_meta_info().plural_name.lower()} from file. Formats: csv, json, jsonl.",
+            handler_path=f"{HANDLERS_PACKAGE}.contacts_import.ContactsImportIHandler",
             hidden=True,
         ),
         #
         CommandMeta(
             command=Command.CONTACT_EDIT,
-            args_config=CONTACT_EDIT_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.contact_edit.CONTACT_EDIT_I_ARGS_CONFIG",
             description=f"Edit a {Contact.get_meta_info().singular_name}.",
-            handler=ContactEditIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.contact_edit.ContactEditIHandler",
             hidden=True,
         ),
         CommandMeta(
             command=Command.CONTACT_VIEW,
-            args_config=CONTACT_VIEW_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.contact_view.CONTACT_VIEW_I_ARGS_CONFIG",
             description=f"View a {Contact.get_meta_info().singular_name}.",
-            handler=ContactViewIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.contact_view.ContactViewIHandler",
             hidden=True,
         ),
         CommandMeta(
             command=Command.CONTACT_DELETE,
-            args_config=CONTACT_DELETE_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.contact_delete.CONTACT_DELETE_I_ARGS_CONFIG",
             description=f"Delete a {Contact.get_meta_info().singular_name}.",
-            handler=ContactDeleteIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.contact_delete.ContactDeleteIHandler",
             hidden=True,
         ),
         #
         CommandMeta(
             command=Command.CONTACTS_GET_UPCOMING_BIRTHDAYS,
-            args_config=CONTACTS_GET_BIRTHDAYS_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.contacts_get_upcoming_birthdays.CONTACTS_GET_BIRTHDAYS_I_ARGS_CONFIG",
             description=f"Show upcoming birthdays for the {Contact.get_meta_info().plural_name}.",
-            handler=ContactsGetUpcomingBirthdaysIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.contacts_get_upcoming_birthdays.ContactsGetUpcomingBirthdaysIHandler",
             hidden=True,
         ),
         #
         CommandMeta(
             command=Command.NOTES_ROOT,
-            args_config=NOTES_ROOT_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.notes_root.NOTES_ROOT_I_ARGS_CONFIG",
             description=f"Manage {Note.get_meta_info().plural_name}.",
-            handler=NotesRootIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.notes_root.NotesRootIHandler",
         ),
         #
         CommandMeta(
             command=Command.NOTES_LIST,
-            args_config=LIST_I_ARGS_CONFIG_NOTES,
+            args_config_path=f"{HANDLERS_PACKAGE}.shared.sort_and_filter.LIST_I_ARGS_CONFIG_NOTES",
             description=f"List {Note.get_meta_info().plural_name}. "
             f"With filtering and actions on the selected {Note.get_meta_info().plural_name}.",
-            handler=NotesListIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.notes_list.NotesListIHandler",
+            hidden=True,
+        ),
+        CommandMeta(
+            command=Command.NOTES_SEARCH,
+            args_config_path=f"{HANDLERS_PACKAGE}.notes_search.NOTES_SEARCH_I_ARGS_CONFIG",
+            description=f"Search {Note.get_meta_info().plural_name.lower()} by words. The most relevant first.",
+            handler_path=f"{HANDLERS_PACKAGE}.notes_search.NotesSearchIHandler",
             hidden=True,
         ),
         CommandMeta(
             command=Command.NOTE_ADD,
-            args_config=ARGS_CONFIG_I_EMPTY,
+            args_config_path=f"{HANDLERS_PACKAGE}.shared.args_i_empty.ARGS_CONFIG_I_EMPTY",
             description=f"Add a {Note.get_meta_info().singular_name}.",
-            handler=NoteAddIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.note_add.NoteAddIHandler",
             hidden=True,
         ),
         #
         CommandMeta(
             command=Command.NOTE_VIEW,
-            args_config=NOTE_VIEW_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.note_view.NOTE_VIEW_I_ARGS_CONFIG",
             description=f"View a {Note.get_meta_info().singular_name}.",
-            handler=NoteViewIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.note_view.NoteViewIHandler",
             hidden=True,
         ),
         CommandMeta(
             command=Command.NOTE_EDIT,
-            args_config=NOTE_EDIT_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.note_edit.NOTE_EDIT_I_ARGS_CONFIG",
             description=f"Edit a {Note.get_meta_info().singular_name}.",
-            handler=NoteEditIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.note_edit.NoteEditIHandler",
             hidden=True,
         ),
         CommandMeta(
             command=Command.NOTE_DELETE,
-            args_config=NOTE_DELETE_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.note_delete.NOTE_DELETE_I_ARGS_CONFIG",
             description=f"Delete a {Note.get_meta_info().singular_name}.",
-            handler=NoteDeleteIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.note_delete.NoteDeleteIHandler",
             hidden=True,
         ),
         CommandMeta(
             command=Command.NOTES_EXPORT,
-            args_config=CONTACT_ADD_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.contact_add.CONTACT_ADD_I_ARGS_CONFIG",
             description=f"Export {Note.get_meta_info().plural_name.lower()} to file.",
-            handler=NotesExportIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.notes_export.NotesExportIHandler",
+            hidden=True,
+        ),
+        CommandMeta(
+            command=Command.NOTES_IMPORT,
+            args_config_path=f"{HANDLERS_PACKAGE}.shared.import_items.IMPORT_I_ARGS_CONFIG",
+            description=f"Import {Note.get_meta_info().plural_name.lower()} from file. Formats: csv, json, jsonl.",
+            handler_path=f"{HANDLERS_PACKAGE}.notes_import.NotesImportIHandler",
             hidden=True,
         ),
         #
         CommandMeta(
             command=Command.STORAGE_ROOT,
-            args_config=STORAGE_ROOT_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.storage_root.STORAGE_ROOT_I_ARGS_CONFIG",
             description="Manage storage.",
-            handler=StorageRootIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.storage_root.StorageRootIHandler",
         ),
         #
         CommandMeta(
             command=Command.STORAGE_STATS,
-            args_config=ARGS_CONFIG_I_EMPTY,
+            args_config_path=f"{HANDLERS_PACKAGE}.shared.args_i_empty.ARGS_CONFIG_I_EMPTY",
             description="Display statistics about the storage.",
-            handler=StorageStatsIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.storage_stats.StorageStatsIHandler",
             hidden=True,
         ),
         CommandMeta(
             command=Command.STORAGE_CLEAR,
-            args_config=STORAGE_CLEAR_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.storage_clear.STORAGE_CLEAR_I_ARGS_CONFIG",
             description="Clear the storage.",
-            handler=StorageClearIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.storage_clear.StorageClearIHandler",
             hidden=True,
         ),
         #
         CommandMeta(
             command=Command.HELP,
-            args_config=HELP_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.help.HELP_I_ARGS_CONFIG",
             description="Display help information.",
-            handler=HelpIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.help.HelpIHandler",
         ),
         CommandMeta(
             command=Command.EXIT,
-            args_config=EXIT_I_ARGS_CONFIG,
+            args_config_path=f"{HANDLERS_PACKAGE}.exit.EXIT_I_ARGS_CONFIG",
             description="Exit the personal assistant chat.",
-            handler=ExitIHandler,
+            handler_path=f"{HANDLERS_PACKAGE}.exit.ExitIHandler",
         ),
     ]
 }
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 from persyval.exceptions.main import AlreadyExistsError
 from persyval.models.contact import Contact
+from persyval.services.data_storage.data_change import DataChange
 
 if TYPE_CHECKING:
     from persyval.services.data_storage.data_storage import DataStorage
@@ -15,7 +16,7 @@ def contact_add(
         msg = f"{Contact.get_meta_info().singular_name} with uid {contact.uid} already exists."
         raise AlreadyExistsError(msg)
 
-    with data_storage.autosave():
+    with data_storage.autosave(DataChange.contact_put(contact)):
         data_storage.data.contacts[contact.uid] = contact
 
     return contact
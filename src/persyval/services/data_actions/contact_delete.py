@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 from persyval.exceptions.main import NotFoundError
 from persyval.models.contact import Contact
+from persyval.services.data_storage.data_change import DataChange
 
 if TYPE_CHECKING:
     from persyval.models.contact import ContactUid
@@ -13,7 +14,7 @@ def contact_delete(
     contact_uid: ContactUid,
 ) -> Contact:
     try:
-        with data_storage.autosave():
+        with data_storage.autosave(DataChange.contact_delete(contact_uid)):
             contact = data_storage.data.contacts.pop(contact_uid)
     except KeyError as exc:
         msg = f"{Contact.get_meta_info().singular_name} with uid {contact_uid} not found."
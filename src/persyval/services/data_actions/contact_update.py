@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 from persyval.exceptions.main import NotFoundError
 from persyval.models.contact import Contact
+from persyval.services.data_storage.data_change import DataChange
 
 if TYPE_CHECKING:
     from persyval.services.data_storage.data_storage import DataStorage
@@ -12,7 +13,7 @@ def contact_update(
     contact: Contact,
 ) -> Contact:
     try:
-        with data_storage.autosave():
+        with data_storage.autosave(DataChange.contact_put(contact)):
             data_storage.data.contacts[contact.uid] = contact
     except KeyError as exc:
         msg = f"{Contact.get_meta_info().singular_name} with uid {contact.uid} not found."
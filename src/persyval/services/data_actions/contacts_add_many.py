@@ -0,0 +1,34 @@
+from typing import TYPE_CHECKING
+
+from persyval.exceptions.main import AlreadyExistsError
+from persyval.models.contact import Contact
+from persyval.services.data_storage.data_change import DataChange
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from persyval.services.data_storage.data_storage import DataStorage
+
+
+def contacts_add_many(
+    data_storage: DataStorage,
+    contacts: Iterable[Contact],
+) -> list[Contact]:
+    """Add contacts at once. Nothing is added, if any of them already exists."""
+    items = list(contacts)
+
+    uids = {contact.uid for contact in items}
+    if len(uids) != len(items):
+        msg = f"{Contact.get_meta_info().plural_name} have duplicated uids."
+        raise AlreadyExistsError(msg)
+
+    for contact in items:
+        if contact.uid in data_storage.data.contacts:
+            msg = f"{Contact.get_meta_info().singular_name} with uid {contact.uid} already exists."
+            raise AlreadyExistsError(msg)
+
+    with data_storage.autosave(*(DataChange.contact_put(contact) for contact in items)):
+        for contact in items:
+            data_storage.data.contacts[contact.uid] = contact
+
+    return items
@@ -1,13 +1,17 @@
 import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from pydantic import BaseModel
 
+from persyval.services.birthday.birthday_calendar import SupportsMonthDayLookup, iterate_celebration_days
 from persyval.services.birthday.get_nearest_anniversary import get_nearest_anniversary, handle_weekend_birthday
 
 if TYPE_CHECKING:
+    from persyval.models.contact import Contact
     from persyval.services.data_storage.data_storage import DataStorage
 
+BIRTHDAY_FIELD_NAME: Final[str] = "birthday"
+
 
 class AnniversaryContactInfo(BaseModel):
     name: str
@@ -21,12 +25,21 @@ def contacts_get_upcoming_birthdays(
     *,
     sort: bool = False,
 ) -> list[AnniversaryContactInfo]:
-    upcoming_birthdays: list[AnniversaryContactInfo] = []
-
     # Ignore the timezone for this case for now.
     current_date = datetime.datetime.now().date()  # noqa: DTZ005
 
-    for contact in data_storage.data.contacts.values():
+    contacts = data_storage.data.contacts
+    if isinstance(contacts, SupportsMonthDayLookup):
+        # Note: Already in calendar order. So, no need to sort.
+        return get_upcoming_birthdays_by_calendar(
+            contacts,  # pyright: ignore[reportUnknownArgumentType]
+            current_date,
+            target_days,
+        )
+
+    upcoming_birthdays: list[AnniversaryContactInfo] = []
+
+    for contact in contacts.values():
         if not contact.birthday:
             continue
 
@@ -50,3 +63,33 @@ def contacts_get_upcoming_birthdays(
         upcoming_birthdays.sort(key=lambda x: x.congratulation_date)
 
     return upcoming_birthdays
+
+
+def get_upcoming_birthdays_by_calendar(
+    contacts: SupportsMonthDayLookup[Contact],
+    current_date: datetime.date,
+    target_days: int,
+) -> list[AnniversaryContactInfo]:
+    """Touch only the days in range. In calendar order."""
+    celebration_days = list(iterate_celebration_days(current_date, target_days))
+
+    contacts_by_month_day = contacts.get_items_by_month_days(
+        BIRTHDAY_FIELD_NAME,
+        [month_day for _, month_days in celebration_days for month_day in month_days],
+    )
+
+    upcoming_birthdays: list[AnniversaryContactInfo] = []
+    for congratulation_date, month_days in celebration_days:
+        non_weekend_congratulation_date = handle_weekend_birthday(congratulation_date)
+
+        for month_day in month_days:
+            upcoming_birthdays.extend(
+                AnniversaryContactInfo(
+                    name=contact.name,
+                    congratulation_date=congratulation_date,
+                    non_weekend_congratulation_date=non_weekend_congratulation_date,
+                )
+                for contact in contacts_by_month_day.get(month_day, [])
+            )
+
+    return upcoming_birthdays
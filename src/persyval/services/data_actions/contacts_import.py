@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING
+
+from persyval.models.contact import Contact
+from persyval.services.data_actions.contacts_add_many import contacts_add_many
+from persyval.services.import_items.import_items import ImportResult, import_items
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from persyval.services.data_storage.data_storage import DataStorage
+
+
+def contacts_import(
+    data_storage: DataStorage,
+    path: pathlib.Path,
+    workers: int | None = None,
+) -> ImportResult:
+    """Import contacts from the file. Bad rows are reported and skipped. Others are persisted at once."""
+    return import_items(
+        data_storage=data_storage,
+        path=path,
+        model=Contact,
+        fields_meta_config=Contact.get_meta_info().fields_meta_config,
+        section=data_storage.data.contacts,
+        add_many=lambda items: contacts_add_many(data_storage=data_storage, contacts=items),
+        workers=workers,
+    )
@@ -0,0 +1,21 @@
+from typing import TYPE_CHECKING
+
+from persyval.models.contact import Contact
+from persyval.services.handlers.shared.sort_and_filter import ListConfig, iterate_section
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from persyval.services.data_storage.data_storage import DataStorage
+
+
+def contacts_iterate(
+    data_storage: DataStorage,
+    list_config: ListConfig,
+) -> Iterable[Contact]:
+    """Like `contacts_list`, but lazy, if the order is default."""
+    return iterate_section(
+        section=data_storage.data.contacts,
+        model=Contact,
+        list_config=list_config,
+    )
@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
 from persyval.models.contact import Contact
-from persyval.services.handlers.shared.sort_and_filter import ListConfig, filter_iterable
+from persyval.services.handlers.shared.sort_and_filter import ListConfig, filter_section
 
 if TYPE_CHECKING:
     from persyval.services.data_storage.data_storage import DataStorage
@@ -17,8 +17,8 @@ def contacts_list(
     data_storage: DataStorage,
     list_config: ListConfig,
 ) -> list[Contact]:
-    return filter_iterable(
-        iterable=data_storage.data.contacts.values(),
+    return filter_section(
+        section=data_storage.data.contacts,
         model=Contact,
         list_config=list_config,
     )
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 from persyval.exceptions.main import AlreadyExistsError
 from persyval.models.note import Note
+from persyval.services.data_storage.data_change import DataChange
 
 if TYPE_CHECKING:
     from persyval.services.data_storage.data_storage import DataStorage
@@ -15,7 +16,7 @@ def note_add(
         msg = f"{Note.get_meta_info().singular_name} with uid {note.uid} already exists."
         raise AlreadyExistsError(msg)
 
-    with data_storage.autosave():
+    with data_storage.autosave(DataChange.note_put(note)):
         data_storage.data.notes[note.uid] = note
 
     return note
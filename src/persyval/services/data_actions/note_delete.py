@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 from persyval.exceptions.main import NotFoundError
 from persyval.models.note import Note
+from persyval.services.data_storage.data_change import DataChange
 
 if TYPE_CHECKING:
     from persyval.models.note import NoteUid
@@ -13,7 +14,7 @@ def note_delete(
     note_uid: NoteUid,
 ) -> None:
     try:
-        with data_storage.autosave():
+        with data_storage.autosave(DataChange.note_delete(note_uid)):
             del data_storage.data.notes[note_uid]
     except KeyError as exc:
         msg = f"{Note.get_meta_info().singular_name} with uid {note_uid} not found."
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 from persyval.exceptions.main import NotFoundError
 from persyval.models.note import Note
+from persyval.services.data_storage.data_change import DataChange
 
 if TYPE_CHECKING:
     from persyval.models.note import NoteUid
@@ -18,9 +19,17 @@ def note_update(
 ) -> None:
     try:
         target_note = data_storage.data.notes[note_uid]
-        target_note.title = new_title
-        target_note.content = new_content
-        target_note.tags = new_tags
+
+        with data_storage.autosave() as autosaver:
+            target_note.title = new_title
+            target_note.content = new_content
+            target_note.tags = new_tags
+
+            # Note: Not all sections keep items in memory. So, put the item back explicitly.
+            data_storage.data.notes[note_uid] = target_note
+
+            # Note: The change is built from the updated note. Not from the note before the assignment.
+            autosaver.add_change(DataChange.note_put(target_note))
 
     except KeyError as exc:
         msg = f"{Note.get_meta_info().singular_name} with uid {note_uid} not found."
@@ -0,0 +1,34 @@
+from typing import TYPE_CHECKING
+
+from persyval.exceptions.main import AlreadyExistsError
+from persyval.models.note import Note
+from persyval.services.data_storage.data_change import DataChange
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from persyval.services.data_storage.data_storage import DataStorage
+
+
+def notes_add_many(
+    data_storage: DataStorage,
+    notes: Iterable[Note],
+) -> list[Note]:
+    """Add notes at once. Nothing is added, if any of them already exists."""
+    items = list(notes)
+
+    uids = {note.uid for note in items}
+    if len(uids) != len(items):
+        msg = f"{Note.get_meta_info().plural_name} have duplicated uids."
+        raise AlreadyExistsError(msg)
+
+    for note in items:
+        if note.uid in data_storage.data.notes:
+            msg = f"{Note.get_meta_info().singular_name} with uid {note.uid} already exists."
+            raise AlreadyExistsError(msg)
+
+    with data_storage.autosave(*(DataChange.note_put(note) for note in items)):
+        for note in items:
+            data_storage.data.notes[note.uid] = note
+
+    return items
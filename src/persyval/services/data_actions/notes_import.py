@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING
+
+from persyval.models.note import Note
+from persyval.services.data_actions.notes_add_many import notes_add_many
+from persyval.services.import_items.import_items import ImportResult, import_items
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from persyval.services.data_storage.data_storage import DataStorage
+
+
+def notes_import(
+    data_storage: DataStorage,
+    path: pathlib.Path,
+    workers: int | None = None,
+) -> ImportResult:
+    """Import notes from the file. Bad rows are reported and skipped. Others are persisted at once."""
+    return import_items(
+        data_storage=data_storage,
+        path=path,
+        model=Note,
+        fields_meta_config=Note.get_meta_info().fields_meta_config,
+        section=data_storage.data.notes,
+        add_many=lambda items: notes_add_many(data_storage=data_storage, notes=items),
+        workers=workers,
+    )
@@ -0,0 +1,21 @@
+from typing import TYPE_CHECKING
+
+from persyval.models.note import Note
+from persyval.services.handlers.shared.sort_and_filter import ListConfig, iterate_section
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from persyval.services.data_storage.data_storage import DataStorage
+
+
+def notes_iterate(
+    data_storage: DataStorage,
+    list_config: ListConfig,
+) -> Iterable[Note]:
+    """Like `notes_list`, but lazy, if the order is default."""
+    return iterate_section(
+        section=data_storage.data.notes,
+        model=Note,
+        list_config=list_config,
+    )
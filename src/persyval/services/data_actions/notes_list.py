@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
 from persyval.models.note import Note
-from persyval.services.handlers.shared.sort_and_filter import ListConfig, filter_iterable
+from persyval.services.handlers.shared.sort_and_filter import ListConfig, filter_section
 
 if TYPE_CHECKING:
     from persyval.services.data_storage.data_storage import DataStorage
@@ -11,8 +11,8 @@ def notes_list(
     data_storage: DataStorage,
     list_config: ListConfig,
 ) -> list[Note]:
-    return filter_iterable(
-        iterable=data_storage.data.notes.values(),
+    return filter_section(
+        section=data_storage.data.notes,
         model=Note,
         list_config=list_config,
     )
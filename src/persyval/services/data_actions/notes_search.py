@@ -0,0 +1,18 @@
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from persyval.models.note import Note
+    from persyval.services.data_storage.data_storage import DataStorage
+
+NOTES_SEARCH_DEFAULT_LIMIT: Final[int] = 20
+
+
+def notes_search(
+    data_storage: DataStorage,
+    query: str,
+    limit: int = NOTES_SEARCH_DEFAULT_LIMIT,
+) -> list[Note]:
+    """Find notes by the full-text query. The most relevant notes first."""
+    hits = data_storage.get_notes_search_index().search(query, limit)
+
+    return [data_storage.data.notes[hit.uid] for hit in hits]
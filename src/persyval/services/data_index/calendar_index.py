@@ -0,0 +1,60 @@
+"""In-memory day-of-year index for date fields.
+
+Items are grouped into buckets by the month and the day of the date. So, there are 366 buckets at most.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from persyval.services.birthday.birthday_calendar import get_month_day
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from persyval.services.birthday.birthday_calendar import MonthDay
+
+
+class CalendarIndex[Uid]:
+    def __init__(
+        self,
+        field_name: str,
+        items: Iterable[tuple[Uid, Any]] = (),
+    ) -> None:
+        self.field_name = field_name
+
+        # Note: Dicts as ordered sets. So, items in the bucket keep the order of addition.
+        self.buckets: dict[MonthDay, dict[Uid, None]] = {}
+        self.item_keys: dict[Uid, MonthDay] = {}
+
+        for uid, item in items:
+            self.add(uid, item)
+
+    def add(self, uid: Uid, item: Any) -> None:  # noqa: ANN401
+        value = getattr(item, self.field_name)
+        month_day = get_month_day(value) if value is not None else None
+
+        if self.item_keys.get(uid) == month_day:
+            return
+
+        self.remove(uid)
+        if month_day is None:
+            return
+
+        self.buckets.setdefault(month_day, {})[uid] = None
+        self.item_keys[uid] = month_day
+
+    def remove(self, uid: Uid) -> None:
+        month_day = self.item_keys.pop(uid, None)
+        if month_day is None:
+            return
+
+        bucket = self.buckets[month_day]
+        del bucket[uid]
+        if not bucket:
+            del self.buckets[month_day]
+
+    def clear(self) -> None:
+        self.buckets.clear()
+        self.item_keys.clear()
+
+    def get_uids(self, month_day: MonthDay) -> list[Uid]:
+        return list(self.buckets.get(month_day, ()))
@@ -0,0 +1,151 @@
+"""In-memory section of the data with secondary indexes.
+
+The section is a usual `dict`, so it is serialized as before.
+Indexes are built on the first filtering and then kept in sync by the mapping mutations,
+that are used by the data actions.
+"""
+
+import uuid
+from typing import TYPE_CHECKING, Any, Self, cast, override
+
+from persyval.services.data_index.calendar_index import CalendarIndex
+from persyval.services.data_index.section_index import SectionIndex
+from persyval.services.model_meta.field_meta import UID_FIELD_NAME
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from persyval.services.birthday.birthday_calendar import MonthDay
+    from persyval.services.model_meta.field_meta import FieldsMetaConfig
+
+
+class IndexedSection[Uid: uuid.UUID, T](dict[Uid, T]):
+    def __init__(
+        self,
+        items: Iterable[tuple[Uid, T]] = (),
+        *,
+        fields_meta_config: FieldsMetaConfig,
+    ) -> None:
+        super().__init__(items)
+
+        self._fields_meta_config = fields_meta_config
+        self._index: SectionIndex[Uid] | None = None
+        self._calendar_indexes: dict[str, CalendarIndex[Uid]] = {}
+
+    def get_index(self) -> SectionIndex[Uid]:
+        if self._index is None:
+            self._index = SectionIndex(self._fields_meta_config, self.items())
+
+        return self._index
+
+    def get_calendar_index(self, field_name: str) -> CalendarIndex[Uid]:
+        index = self._calendar_indexes.get(field_name)
+        if index is None:
+            field = self._fields_meta_config.get_fields_meta_registry()[field_name]
+            if not field.is_calendar_indexed:
+                msg = f"Field '{field_name}' has no calendar index."
+                raise ValueError(msg)
+
+            index = CalendarIndex(field_name, self.items())
+            self._calendar_indexes[field_name] = index
+
+        return index
+
+    def _get_built_indexes(self) -> list[SectionIndex[Uid] | CalendarIndex[Uid]]:
+        indexes: list[SectionIndex[Uid] | CalendarIndex[Uid]] = list(self._calendar_indexes.values())
+        if self._index is not None:
+            indexes.append(self._index)
+
+        return indexes
+
+    def get_filter_candidates(self, filter_query: dict[str, str]) -> Iterable[T]:
+        """Get items, that can match the filter. Filter values must be normalized."""
+        query = dict(filter_query)
+
+        uid_value = query.pop(UID_FIELD_NAME, None)
+        if uid_value is not None:
+            try:
+                uid = cast("Uid", uuid.UUID(uid_value))
+            except ValueError:
+                return []
+
+            return [self[uid]] if uid in self else []
+
+        uids = self.get_index().get_candidate_uids(query)
+        if uids is None:
+            return self.values()
+
+        return [self[uid] for uid in uids]
+
+    def get_filter_candidates_i_any(self, filter_queries: list[dict[str, str]]) -> Iterable[T]:
+        """Get items, that can match any of the filters. Filter values must be normalized."""
+        uids = self.get_index().get_candidate_uids_i_any(filter_queries)
+        if uids is None:
+            return self.values()
+
+        return [self[uid] for uid in uids]
+
+    def get_items_by_month_days(self, field_name: str, month_days: Iterable[MonthDay]) -> dict[MonthDay, list[T]]:
+        index = self.get_calendar_index(field_name)
+
+        result: dict[MonthDay, list[T]] = {}
+        for month_day in month_days:
+            uids = index.get_uids(month_day)
+            if uids:
+                result[month_day] = [self[uid] for uid in uids]
+
+        return result
+
+    # [mapping]-[BEGIN]
+
+    @override
+    def __setitem__(self, key: Uid, value: T) -> None:
+        super().__setitem__(key, value)
+        for index in self._get_built_indexes():
+            index.add(key, value)
+
+    @override
+    def __delitem__(self, key: Uid) -> None:
+        super().__delitem__(key)
+        for index in self._get_built_indexes():
+            index.remove(key)
+
+    @override
+    def pop(self, key: Uid, *args: Any) -> Any:
+        result = super().pop(key, *args)
+        for index in self._get_built_indexes():
+            index.remove(key)
+        return result
+
+    @override
+    def popitem(self) -> tuple[Uid, T]:
+        key, value = super().popitem()
+        for index in self._get_built_indexes():
+            index.remove(key)
+        return key, value
+
+    @override
+    def clear(self) -> None:
+        super().clear()
+        for index in self._get_built_indexes():
+            index.clear()
+
+    @override
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        # Note: Rare bulk operation. So, just rebuild the indexes on the next use.
+        self._index = None
+        self._calendar_indexes.clear()
+
+    @override
+    def setdefault(self, key: Uid, default: T, /) -> T:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    @override
+    def __ior__(self, other: Any) -> Self:  # type: ignore[override]
+        self.update(other)
+        return self
+
+    # [mapping]-[END]
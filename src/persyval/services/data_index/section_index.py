@@ -0,0 +1,245 @@
+"""In-memory secondary indexes for the section of the data.
+
+Configured by the fields metadata:
+- hash index for `EXACT` fields;
+- inverted index (value -> items) for list-based fields;
+- trigram index for `PARTIAL` fields with `is_trigram_indexed`.
+"""
+
+import uuid
+from typing import TYPE_CHECKING, Any, Final, cast
+
+from persyval.services.model_meta.field_meta import (
+    UID_FIELD_NAME,
+    FieldItemMetaConfig,
+    FieldsMetaConfig,
+    FilterMode,
+    normalize_field_value_for_filter,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+TRIGRAM_SIZE: Final[int] = 3
+
+
+def is_field_trigram_indexed(field: FieldItemMetaConfig) -> bool:
+    return field.is_trigram_indexed and not field.is_list_based and field.filter_mode == FilterMode.PARTIAL
+
+
+def is_field_indexed(field: FieldItemMetaConfig) -> bool:
+    if field.name == UID_FIELD_NAME or not field.is_filterable:
+        return False
+
+    return field.is_list_based or field.filter_mode == FilterMode.EXACT or is_field_trigram_indexed(field)
+
+
+def get_trigrams(value: str) -> set[str]:
+    return {value[i : i + TRIGRAM_SIZE] for i in range(len(value) - TRIGRAM_SIZE + 1)}
+
+
+def get_index_keys(field: FieldItemMetaConfig, item: Any) -> set[str]:  # noqa: ANN401
+    value = getattr(item, field.name)
+
+    if is_field_trigram_indexed(field):
+        normalized = normalize_field_value_for_filter(value)
+        # Note: Values shorter than a trigram can't contain any indexed filter value. So, they have no keys.
+        return get_trigrams(normalized) if normalized is not None else set()
+
+    values = (value or []) if field.is_list_based else [value]
+
+    return {key for key in map(normalize_field_value_for_filter, values) if key is not None}
+
+
+class SectionIndex[Uid]:
+    """Secondary indexes of the section.
+
+    Items are identified by the internal ids. They are increasing with the insertion order.
+    So, sorted ids give the order of the section. Also, `int` hashing is cheaper than `uuid.UUID` hashing.
+
+    - `postings`: field name -> normalized value (or trigram) -> ids of items;
+    - `item_keys`: id -> field name -> keys. For removal of the outdated keys.
+    """
+
+    def __init__(
+        self,
+        fields_meta_config: FieldsMetaConfig,
+        items: Iterable[tuple[Uid, Any]] = (),
+    ) -> None:
+        self.fields_registry: dict[str, FieldItemMetaConfig] = {
+            field.name: field for field in fields_meta_config.fields if is_field_indexed(field)
+        }
+
+        self.postings: dict[str, dict[str, set[int]]] = {field_name: {} for field_name in self.fields_registry}
+        self.item_keys: dict[int, dict[str, set[str]]] = {}
+
+        self.ids: dict[Uid, int] = {}
+        self.uids: dict[int, Uid] = {}
+        self.next_id = 0
+
+        for uid, item in items:
+            self.add(uid, item)
+
+    def add(self, uid: Uid, item: Any) -> None:  # noqa: ANN401
+        item_id = self.ids.get(uid)
+        if item_id is None:
+            item_id = self.next_id
+            self.next_id += 1
+            self.ids[uid] = item_id
+            self.uids[item_id] = uid
+        else:
+            # Note: Updated item keeps its place in the section.
+            self._remove_keys(item_id)
+
+        keys_by_field: dict[str, set[str]] = {}
+        for field_name, field in self.fields_registry.items():
+            keys = get_index_keys(field, item)
+            postings = self.postings[field_name]
+            for key in keys:
+                ids = postings.get(key)
+                if ids is None:
+                    postings[key] = {item_id}
+                else:
+                    ids.add(item_id)
+
+            keys_by_field[field_name] = keys
+
+        self.item_keys[item_id] = keys_by_field
+
+    def remove(self, uid: Uid) -> None:
+        item_id = self.ids.pop(uid, None)
+        if item_id is None:
+            return
+
+        del self.uids[item_id]
+        self._remove_keys(item_id)
+
+    def _remove_keys(self, item_id: int) -> None:
+        for field_name, keys in self.item_keys.pop(item_id, {}).items():
+            postings = self.postings[field_name]
+            for key in keys:
+                ids = postings[key]
+                ids.discard(item_id)
+                if not ids:
+                    del postings[key]
+
+    def clear(self) -> None:
+        for postings in self.postings.values():
+            postings.clear()
+        self.item_keys.clear()
+        self.ids.clear()
+        self.uids.clear()
+        self.next_id = 0
+
+    def lookup(self, field_name: str, filter_value: str) -> set[int] | None:
+        """Get ids of the items, that can match the filter value.
+
+        Returns:
+            `None`, if the field is not indexed or the index can't narrow the items.
+        """
+        if field_name == UID_FIELD_NAME:
+            return self._lookup_uid(filter_value)
+
+        postings = self.postings.get(field_name)
+        if postings is None:
+            return None
+
+        field = self.fields_registry[field_name]
+        if field.filter_mode == FilterMode.EXACT:
+            return set(postings.get(filter_value, ()))
+
+        if is_field_trigram_indexed(field):
+            return self._lookup_trigrams(postings, filter_value)
+
+        # Note: Scan only distinct values instead of all items.
+        result: set[int] = set()
+        for key, ids in postings.items():
+            if filter_value in key:
+                result |= ids
+
+        return result
+
+    def _lookup_uid(self, filter_value: str) -> set[int]:
+        try:
+            uid = cast("Uid", uuid.UUID(filter_value))
+        except ValueError:
+            return set()
+
+        item_id = self.ids.get(uid)
+        return {item_id} if item_id is not None else set()
+
+    @staticmethod
+    def _lookup_trigrams(postings: dict[str, set[int]], filter_value: str) -> set[int] | None:
+        trigrams = get_trigrams(filter_value)
+        if not trigrams:
+            return None
+
+        # Note: Start from the rarest trigram. So, intersections are small.
+        ids_by_trigram = sorted((postings.get(trigram, set()) for trigram in trigrams), key=len)
+
+        result = set(ids_by_trigram[0])
+        for ids in ids_by_trigram[1:]:
+            if not result:
+                break
+            result &= ids
+
+        return result
+
+    def get_candidate_uids(self, filter_query: dict[str, str]) -> list[Uid] | None:
+        """Get uids of the items, that can match all the filter values. In the order of the section.
+
+        Returns:
+            `None`, if no field from the query is indexed.
+        """
+        result = self.get_candidate_ids(filter_query)
+        if result is None:
+            return None
+
+        return [self.uids[item_id] for item_id in sorted(result)]
+
+    def get_candidate_uids_i_any(self, filter_queries: list[dict[str, str]]) -> list[Uid] | None:
+        """Get uids of the items, that can match any of the filter queries. In the order of the section.
+
+        Returns:
+            `None`, if any of the queries has no indexed field.
+        """
+        result: set[int] = set()
+        for filter_query in filter_queries:
+            ids = self.get_candidate_ids(filter_query)
+            if ids is None:
+                return None
+
+            result |= ids
+
+        return [self.uids[item_id] for item_id in sorted(result)]
+
+    def get_candidate_ids(self, filter_query: dict[str, str]) -> set[int] | None:
+        result: set[int] | None = None
+
+        # Note: Exact lookups are the cheapest and the most selective. So, use them first. Scans of values are the last.
+        for field_name, filter_value in sorted(
+            filter_query.items(),
+            key=lambda pair: self._get_lookup_priority(pair[0]),
+        ):
+            ids = self.lookup(field_name, filter_value)
+            if ids is None:
+                continue
+
+            result = ids if result is None else result & ids
+            if not result:
+                break
+
+        return result
+
+    def _get_lookup_priority(self, field_name: str) -> int:
+        if field_name == UID_FIELD_NAME:
+            return -1
+
+        field = self.fields_registry.get(field_name)
+        if field is None:
+            return 3
+
+        if field.filter_mode == FilterMode.EXACT:
+            return 0
+
+        return 1 if is_field_trigram_indexed(field) else 2
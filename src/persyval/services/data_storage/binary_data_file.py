@@ -0,0 +1,403 @@
+"""Compact binary format of the data file.
+
+Layout (little-endian):
+- header: magic and version;
+- sections (contacts, notes): amount of items, then items;
+- trailer: digest of everything before it.
+
+Each item has the fixed part and the variable part. Fields are in the order of the schema.
+Fixed part:
+- uuid: 16 bytes;
+- string: length (u32) of UTF-8 bytes. `None` is encoded by the special length;
+- list of strings: amount (u32). `None` is encoded by the special amount;
+- date: proleptic Gregorian ordinal (u32). `None` is `0`.
+Variable part:
+- string: UTF-8 bytes;
+- list of strings: lengths (u32 each) and then UTF-8 bytes of the strings.
+
+Items are written and read one by one. So, there is no intermediate tree, like in JSON.
+The file is read by chunks. So, the whole file is not kept in memory together with decoded items.
+"""
+
+import datetime
+import enum
+import hashlib
+import os
+import struct
+import uuid
+from functools import cache
+from typing import TYPE_CHECKING, Any, Final
+
+from pydantic import BaseModel
+
+from persyval.exceptions.main import InvalidDataError
+from persyval.models.contact import Contact
+from persyval.models.note import Note
+from persyval.services.data_storage.data_file import (
+    DIGEST_SIZE,
+    DataFileWriteResult,
+    fsync_dir,
+    get_temp_path,
+)
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable, Mapping
+    from typing import BinaryIO
+
+BINARY_MAGIC: Final[bytes] = b"PSVBIN\x00\x00"
+BINARY_VERSION: Final[int] = 1
+
+BINARY_HEADER: Final[struct.Struct] = struct.Struct("<8sH")
+U32: Final[struct.Struct] = struct.Struct("<I")
+UUID_SIZE: Final[int] = 16
+
+NONE_LENGTH: Final[int] = 0xFFFFFFFF
+"""Length (or amount), that marks `None`."""
+
+WRITE_BUFFER_SIZE: Final[int] = 1024 * 1024
+READ_CHUNK_SIZE: Final[int] = 1024 * 1024
+
+
+@enum.unique
+class FieldCodec(enum.StrEnum):
+    UUID = "uuid"
+    STR = "str"
+    OPTIONAL_STR = "optional_str"
+    STR_LIST = "str_list"
+    OPTIONAL_STR_LIST = "optional_str_list"
+    OPTIONAL_DATE = "optional_date"
+
+
+type ModelSchema = tuple[tuple[str, FieldCodec], ...]
+
+CONTACT_SCHEMA: Final[ModelSchema] = (
+    ("uid", FieldCodec.UUID),
+    ("name", FieldCodec.STR),
+    ("address", FieldCodec.OPTIONAL_STR),
+    ("phones", FieldCodec.STR_LIST),
+    ("emails", FieldCodec.STR_LIST),
+    ("birthday", FieldCodec.OPTIONAL_DATE),
+)
+
+NOTE_SCHEMA: Final[ModelSchema] = (
+    ("uid", FieldCodec.UUID),
+    ("title", FieldCodec.OPTIONAL_STR),
+    ("content", FieldCodec.STR),
+    ("tags", FieldCodec.OPTIONAL_STR_LIST),
+)
+
+
+def validate_model_schema(model: type[BaseModel], schema: ModelSchema) -> tuple[type[BaseModel], ModelSchema]:
+    """Check, that the schema has all fields of the model. In the same order.
+
+    So, a new field of the model fails on import, instead of the silent loss of its data on save.
+    """
+    field_names = [field_name for field_name, _ in schema]
+    if field_names != list(model.model_fields):
+        msg = (
+            f"Binary schema of {model.__name__} doesn't match its fields: {field_names} != {list(model.model_fields)}."
+        )
+        raise TypeError(msg)
+
+    return model, schema
+
+
+SECTION_MODELS: Final[tuple[tuple[type[BaseModel], ModelSchema], ...]] = (
+    validate_model_schema(Contact, CONTACT_SCHEMA),
+    validate_model_schema(Note, NOTE_SCHEMA),
+)
+
+
+# Note: Each field has a fixed part (uuid, length, amount or ordinal) and an optional variable part (bytes).
+# Fixed parts of all fields are at the start of the item. So, they are read at once.
+
+FIXED_FORMATS_REGISTRY: Final[dict[FieldCodec, str]] = {
+    FieldCodec.UUID: f"{UUID_SIZE}s",
+    FieldCodec.STR: "I",
+    FieldCodec.OPTIONAL_STR: "I",
+    FieldCodec.STR_LIST: "I",
+    FieldCodec.OPTIONAL_STR_LIST: "I",
+    FieldCodec.OPTIONAL_DATE: "I",
+}
+
+
+@cache
+def get_fixed_struct(schema: ModelSchema) -> struct.Struct:
+    return struct.Struct("<" + "".join(FIXED_FORMATS_REGISTRY[codec] for _, codec in schema))
+
+
+# [encode]-[BEGIN]
+# Note: Encoder appends the variable part and returns the fixed part.
+
+
+def encode_uuid(value: uuid.UUID, variable: list[bytes]) -> bytes:
+    del variable
+    return value.bytes
+
+
+def encode_optional_str(value: str | None, variable: list[bytes]) -> int:
+    if value is None:
+        return NONE_LENGTH
+
+    raw = value.encode()
+    variable.append(raw)
+    return len(raw)
+
+
+def encode_optional_str_list(value: list[str] | None, variable: list[bytes]) -> int:
+    if value is None:
+        return NONE_LENGTH
+
+    raw_items = [item.encode() for item in value]
+    variable.append(struct.pack(f"<{len(raw_items)}I", *map(len, raw_items)))
+    variable.extend(raw_items)
+    return len(raw_items)
+
+
+def encode_optional_date(value: datetime.date | None, variable: list[bytes]) -> int:
+    del variable
+    return 0 if value is None else value.toordinal()
+
+
+ENCODERS_REGISTRY: Final[dict[FieldCodec, Callable[[Any, list[bytes]], Any]]] = {
+    FieldCodec.UUID: encode_uuid,
+    FieldCodec.STR: encode_optional_str,
+    FieldCodec.OPTIONAL_STR: encode_optional_str,
+    FieldCodec.STR_LIST: encode_optional_str_list,
+    FieldCodec.OPTIONAL_STR_LIST: encode_optional_str_list,
+    FieldCodec.OPTIONAL_DATE: encode_optional_date,
+}
+
+
+def encode_item(item: BaseModel, schema: ModelSchema) -> bytes:
+    variable: list[bytes] = []
+    fixed = [ENCODERS_REGISTRY[codec](getattr(item, field_name), variable) for field_name, codec in schema]
+    return get_fixed_struct(schema).pack(*fixed) + b"".join(variable)
+
+
+# [encode]-[END]
+
+# [decode]-[BEGIN]
+# Note: Decoder gets the fixed part and reads the variable part from the offset.
+
+
+def decode_uuid(fixed: bytes, buffer: bytes, offset: int) -> tuple[uuid.UUID, int]:
+    del buffer
+    return uuid.UUID(bytes=fixed), offset
+
+
+def decode_optional_str(fixed: int, buffer: bytes, offset: int) -> tuple[str | None, int]:
+    if fixed == NONE_LENGTH:
+        return None, offset
+
+    end = offset + fixed
+    return buffer[offset:end].decode(), end
+
+
+def decode_str(fixed: int, buffer: bytes, offset: int) -> tuple[str, int]:
+    if fixed == NONE_LENGTH:
+        msg = "String value is missing in the binary data file."
+        raise InvalidDataError(msg)
+
+    end = offset + fixed
+    return buffer[offset:end].decode(), end
+
+
+def decode_optional_str_list(fixed: int, buffer: bytes, offset: int) -> tuple[list[str] | None, int]:
+    if fixed == NONE_LENGTH:
+        return None, offset
+
+    lengths = struct.unpack_from(f"<{fixed}I", buffer, offset)
+    offset += fixed * U32.size
+
+    items: list[str] = []
+    for length in lengths:
+        end = offset + length
+        items.append(buffer[offset:end].decode())
+        offset = end
+
+    return items, offset
+
+
+def decode_str_list(fixed: int, buffer: bytes, offset: int) -> tuple[list[str], int]:
+    items, offset = decode_optional_str_list(fixed, buffer, offset)
+    return items or [], offset
+
+
+def decode_optional_date(fixed: int, buffer: bytes, offset: int) -> tuple[datetime.date | None, int]:
+    del buffer
+    return (datetime.date.fromordinal(fixed) if fixed else None), offset
+
+
+DECODERS_REGISTRY: Final[dict[FieldCodec, Callable[[Any, bytes, int], tuple[Any, int]]]] = {
+    FieldCodec.UUID: decode_uuid,
+    FieldCodec.STR: decode_str,
+    FieldCodec.OPTIONAL_STR: decode_optional_str,
+    FieldCodec.STR_LIST: decode_str_list,
+    FieldCodec.OPTIONAL_STR_LIST: decode_optional_str_list,
+    FieldCodec.OPTIONAL_DATE: decode_optional_date,
+}
+
+
+# [decode]-[END]
+
+
+def write_binary_data_file(
+    path: pathlib.Path,
+    sections: list[Mapping[Any, BaseModel]],
+) -> DataFileWriteResult:
+    """Write the binary data file. Atomically, like the JSON data file."""
+    hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+    temp_path = get_temp_path(path)
+    with temp_path.open("wb", buffering=WRITE_BUFFER_SIZE) as file:
+
+        def write(chunk: bytes) -> None:
+            file.write(chunk)
+            hasher.update(chunk)
+
+        write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION))
+
+        for section, (_, schema) in zip(sections, SECTION_MODELS, strict=True):
+            write(U32.pack(len(section)))
+            for item in section.values():
+                write(encode_item(item, schema))
+
+        digest = hasher.digest()
+        file.write(digest)
+
+        file.flush()
+        os.fsync(file.fileno())
+
+    temp_path.replace(path)
+    fsync_dir(path.parent)
+
+    return DataFileWriteResult(digest=digest.hex())
+
+
+class BinaryDataFileReadResult(BaseModel):
+    sections: list[dict[Any, Any]]
+    digest: str
+
+
+class ChunkedReader:
+    """Reader of the data before the digest. By chunks. Each chunk is hashed once, when it is read from the file.
+
+    Items are decoded from the buffer, like from the whole content. If the item is not in the buffer completely,
+    the next chunk is appended to the unread rest of the buffer.
+    """
+
+    def __init__(self, file: BinaryIO, size: int) -> None:
+        self._file = file
+        self._remaining = size
+        self.buffer = b""
+        self.offset = 0
+        self.hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+    def refill(self) -> None:
+        """Append the next chunk to the unread rest of the buffer.
+
+        Raises:
+            InvalidDataError: If there is no more data. So, the item is cut, because lengths are corrupted.
+        """
+        if not self._remaining:
+            msg = "Binary data file is corrupted. Data ends unexpectedly."
+            raise InvalidDataError(msg)
+
+        amount = min(self._remaining, READ_CHUNK_SIZE)
+        chunk = self._file.read(amount)
+        if len(chunk) != amount:
+            msg = "Binary data file is changed while reading."
+            raise InvalidDataError(msg)
+
+        self.hasher.update(chunk)
+        self._remaining -= amount
+        self.buffer = self.buffer[self.offset :] + chunk
+        self.offset = 0
+
+    def read_struct(self, fixed_struct: struct.Struct) -> tuple[Any, ...]:
+        while self.offset + fixed_struct.size > len(self.buffer):
+            self.refill()
+
+        values = fixed_struct.unpack_from(self.buffer, self.offset)
+        self.offset += fixed_struct.size
+        return values
+
+    def is_exhausted(self) -> bool:
+        return not self._remaining and self.offset == len(self.buffer)
+
+
+def read_binary_data_file(file: BinaryIO) -> BinaryDataFileReadResult:
+    """Read the binary data file. Streamed, by chunks.
+
+    Items are created without validation. The digest is checked at the end, before any of them is returned.
+    So, only items of the file, written by persyval, are used.
+
+    Raises:
+        InvalidDataError: If the file is not the binary data file, has unsupported version or is corrupted.
+    """
+    size = os.fstat(file.fileno()).st_size
+    if size < BINARY_HEADER.size + DIGEST_SIZE:
+        msg = "Binary data file is too short."
+        raise InvalidDataError(msg)
+
+    reader = ChunkedReader(file, size - DIGEST_SIZE)
+
+    magic, version = reader.read_struct(BINARY_HEADER)
+    if magic != BINARY_MAGIC:
+        msg = "File is not the binary data file."
+        raise InvalidDataError(msg)
+
+    if version != BINARY_VERSION:
+        msg = f"Unsupported version of the binary data file: {version}."
+        raise InvalidDataError(msg)
+
+    sections = [read_section(reader, model, schema) for model, schema in SECTION_MODELS]
+
+    if not reader.is_exhausted():
+        msg = "Binary data file has unexpected data after the sections."
+        raise InvalidDataError(msg)
+
+    digest = reader.hasher.digest()
+    if digest != file.read(DIGEST_SIZE):
+        msg = "Binary data file is corrupted. Digest doesn't match."
+        raise InvalidDataError(msg)
+
+    return BinaryDataFileReadResult(sections=sections, digest=digest.hex())
+
+
+def read_section(reader: ChunkedReader, model: type[BaseModel], schema: ModelSchema) -> dict[Any, Any]:
+    fixed_struct = get_fixed_struct(schema)
+    # Note: Resolve decoders once per section. Not per field of each item.
+    field_decoders = [(field_name, DECODERS_REGISTRY[codec]) for field_name, codec in schema]
+
+    (amount,) = reader.read_struct(U32)
+
+    section: dict[Any, Any] = {}
+    for _ in range(amount):
+        while True:
+            buffer = reader.buffer
+            offset = reader.offset
+
+            # Note: The item can be cut by the end of the buffer. Then, decoding fails or ends past the buffer.
+            # Errors of the corrupted data look the same. So, they are raised, when there is no data to append.
+            try:
+                fixed_values = fixed_struct.unpack_from(buffer, offset)
+                offset += fixed_struct.size
+
+                values: dict[str, Any] = {}
+                for (field_name, decoder), fixed in zip(field_decoders, fixed_values, strict=True):
+                    values[field_name], offset = decoder(fixed, buffer, offset)
+            except (UnicodeDecodeError, ValueError, struct.error, InvalidDataError):
+                offset = len(buffer) + 1
+
+            if offset <= len(buffer):
+                break
+
+            reader.refill()
+
+        reader.offset = offset
+        section[values["uid"]] = model.model_construct(**values)
+
+    return section
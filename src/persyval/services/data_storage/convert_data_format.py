@@ -0,0 +1,44 @@
+from typing import TYPE_CHECKING
+
+from persyval.exceptions.main import InvalidDataError
+from persyval.services.data_storage.data_file import remove_offsets_file
+from persyval.services.data_storage.data_storage import (
+    DataFileFormat,
+    DataStorage,
+    DataStorageMode,
+    detect_data_file_format,
+    detect_data_storage_mode,
+    get_data_file_name,
+)
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+def convert_data_format(dir_path: pathlib.Path, data_format: DataFileFormat) -> bool:
+    """Convert the data file of the storage to the given format. The journal is folded into the new data file.
+
+    Returns:
+        `False`, if the storage already uses this format.
+    """
+    if detect_data_storage_mode(dir_path) == DataStorageMode.SQLITE:
+        msg = f"Storage in '{dir_path}' uses the '{DataStorageMode.SQLITE}' mode. It has no data file to convert."
+        raise InvalidDataError(msg)
+
+    source_format = detect_data_file_format(dir_path)
+    if source_format == data_format:
+        return False
+
+    source_path = dir_path / get_data_file_name(source_format)
+
+    # Note: The journal mode doesn't rewrite the data file on exit. So, it is written only once.
+    with DataStorage.load(dir_path=dir_path, mode=DataStorageMode.JOURNAL) as data_storage:
+        data_storage.path = dir_path / get_data_file_name(data_format)
+        data_storage.data_format = data_format
+        data_storage.save()
+
+    # Note: Remove the source only after the new data file is written. So, the data is never lost.
+    source_path.unlink(missing_ok=True)
+    remove_offsets_file(source_path)
+
+    return True
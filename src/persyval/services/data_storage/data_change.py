@@ -0,0 +1,87 @@
+import enum
+import uuid
+from typing import TYPE_CHECKING, Self
+
+from pydantic import BaseModel
+
+from persyval.models.contact import Contact, ContactUid
+from persyval.models.note import Note, NoteUid
+
+if TYPE_CHECKING:
+    from persyval.services.data_storage.data_storage import Data
+
+
+@enum.unique
+class DataChangeKind(enum.StrEnum):
+    CONTACT_PUT = "contact_put"
+    CONTACT_DELETE = "contact_delete"
+
+    NOTE_PUT = "note_put"
+    NOTE_DELETE = "note_delete"
+
+    CLEAR = "clear"
+
+
+class DataChange(BaseModel):
+    """Single mutation of the data.
+
+    Produced by data actions. Used to persist the mutation without rewriting the whole data.
+    """
+
+    kind: DataChangeKind
+    uid: uuid.UUID | None = None
+
+    contact: Contact | None = None
+    note: Note | None = None
+
+    @classmethod
+    def contact_put(cls, contact: Contact) -> Self:
+        return cls(kind=DataChangeKind.CONTACT_PUT, uid=contact.uid, contact=contact)
+
+    @classmethod
+    def contact_delete(cls, uid: ContactUid) -> Self:
+        return cls(kind=DataChangeKind.CONTACT_DELETE, uid=uid)
+
+    @classmethod
+    def note_put(cls, note: Note) -> Self:
+        return cls(kind=DataChangeKind.NOTE_PUT, uid=note.uid, note=note)
+
+    @classmethod
+    def note_delete(cls, uid: NoteUid) -> Self:
+        return cls(kind=DataChangeKind.NOTE_DELETE, uid=uid)
+
+    @classmethod
+    def clear(cls) -> Self:
+        return cls(kind=DataChangeKind.CLEAR)
+
+
+def apply_data_change(data: Data, change: DataChange) -> None:
+    match change.kind:
+        case DataChangeKind.CONTACT_PUT:
+            if change.contact is None:
+                msg = f"Change '{change.kind}' has no contact."
+                raise ValueError(msg)
+            data.contacts[change.contact.uid] = change.contact
+
+        case DataChangeKind.CONTACT_DELETE:
+            data.contacts.pop(ContactUid(require_change_uid(change)), None)
+
+        case DataChangeKind.NOTE_PUT:
+            if change.note is None:
+                msg = f"Change '{change.kind}' has no note."
+                raise ValueError(msg)
+            data.notes[change.note.uid] = change.note
+
+        case DataChangeKind.NOTE_DELETE:
+            data.notes.pop(NoteUid(require_change_uid(change)), None)
+
+        case DataChangeKind.CLEAR:
+            data.clear()
+
+
+def require_change_uid(change: DataChange) -> uuid.UUID:
+    if change.uid is None:
+        msg = f"Change '{change.kind}' has no uid."
+        raise ValueError(msg)
+
+    return change.uid
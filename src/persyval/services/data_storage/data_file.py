@@ -0,0 +1,329 @@
+"""Data file writer and its offsets index.
+
+The data file is a usual JSON, but each item is written on a separate line in a compact form:
+
+    {
+        "contacts": {
+            "<uid>": {...},
+            ...
+        },
+        "notes": {
+            ...
+        }
+    }
+
+So, the position of each item is known after the write.
+Positions are stored in the offsets index file, next to the data file.
+It allows to read a single item without parsing the whole data file.
+
+Offsets index layout (little-endian):
+- header: magic, version, size and mtime of the data file, digest of the data file, amount of items per section;
+- records: uid (16 bytes), offset and length of the item in the data file.
+  Sorted by uid inside each section. So, lookup is a binary search.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import uuid
+from typing import TYPE_CHECKING, Any, BinaryIO, Final, Protocol, Self, runtime_checkable
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterator, Mapping
+
+OFFSETS_FILE_SUFFIX: Final[str] = ".offsets"
+TEMP_FILE_SUFFIX: Final[str] = ".tmp"
+
+DATA_FILE_SECTIONS: Final[tuple[str, ...]] = ("contacts", "notes")
+
+OFFSETS_MAGIC: Final[bytes] = b"PSVOFFS\x00"
+OFFSETS_VERSION: Final[int] = 1
+
+DIGEST_SIZE: Final[int] = 16
+
+OFFSETS_HEADER: Final[struct.Struct] = struct.Struct(f"<8sHQQ{DIGEST_SIZE}s{len(DATA_FILE_SECTIONS)}Q")
+OFFSETS_RECORD: Final[struct.Struct] = struct.Struct("<16sQI")
+UID_SIZE: Final[int] = 16
+
+INDENT: Final[bytes] = b"    "
+
+
+def get_offsets_path(data_path: pathlib.Path) -> pathlib.Path:
+    return data_path.with_suffix(OFFSETS_FILE_SUFFIX)
+
+
+def get_temp_path(path: pathlib.Path) -> pathlib.Path:
+    return path.with_name(f"{path.name}{TEMP_FILE_SUFFIX}")
+
+
+@runtime_checkable
+class SupportsRawItems(Protocol):
+    """Collection, that can give JSON of the item without its materialization."""
+
+    def get_raw_item(self, uid: uuid.UUID) -> bytes: ...
+
+
+def get_raw_item(section: Mapping[Any, BaseModel], uid: uuid.UUID) -> bytes:
+    if isinstance(section, SupportsRawItems):
+        return section.get_raw_item(uid)
+
+    return section[uid].model_dump_json().encode()
+
+
+class DataFileWriteResult(BaseModel):
+    digest: str
+
+
+def write_data_file(
+    path: pathlib.Path,
+    sections: list[Mapping[Any, BaseModel]],
+) -> DataFileWriteResult:
+    """Write the data file and its offsets index.
+
+    Files are written to temporary files and then replaced. So, readers of the old files (memory maps) are safe.
+    Also, the crash in the middle of the write keeps the previous data file.
+    """
+    hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    records: list[list[tuple[bytes, int, int]]] = []
+
+    temp_path = get_temp_path(path)
+    with temp_path.open("wb") as file:
+        position = 0
+
+        def write(chunk: bytes) -> None:
+            nonlocal position
+            file.write(chunk)
+            hasher.update(chunk)
+            position += len(chunk)
+
+        write(b"{\n")
+        for section_position, (name, section) in enumerate(zip(DATA_FILE_SECTIONS, sections, strict=True)):
+            section_records: list[tuple[bytes, int, int]] = []
+
+            write(INDENT + json.dumps(name).encode() + b": {")
+            for item_position, uid in enumerate(section):
+                raw = get_raw_item(section, uid)
+
+                write((b",\n" if item_position else b"\n") + INDENT * 2 + f'"{uid}": '.encode())
+                section_records.append((uid.bytes, position, len(raw)))
+                write(raw)
+
+            write((b"\n" + INDENT if section_records else b"") + b"}")
+            write(b",\n" if section_position < len(DATA_FILE_SECTIONS) - 1 else b"\n")
+
+            records.append(section_records)
+
+        write(b"}\n")
+
+        # Note: The data must be on the disk before the rename. Otherwise, the crash can leave the empty file.
+        file.flush()
+        os.fsync(file.fileno())
+
+    temp_path.replace(path)
+    fsync_dir(path.parent)
+
+    digest = hasher.hexdigest()
+    write_offsets_file(path, digest, records)
+
+    return DataFileWriteResult(digest=digest)
+
+
+def write_offsets_file(
+    data_path: pathlib.Path,
+    digest: str,
+    records: list[list[tuple[bytes, int, int]]],
+) -> None:
+    stat = data_path.stat()
+
+    offsets_path = get_offsets_path(data_path)
+    temp_path = get_temp_path(offsets_path)
+    with temp_path.open("wb") as file:
+        file.write(
+            OFFSETS_HEADER.pack(
+                OFFSETS_MAGIC,
+                OFFSETS_VERSION,
+                stat.st_size,
+                stat.st_mtime_ns,
+                bytes.fromhex(digest),
+                *(len(section_records) for section_records in records),
+            ),
+        )
+        for section_records in records:
+            file.writelines(OFFSETS_RECORD.pack(*record) for record in sorted(section_records))
+
+    temp_path.replace(offsets_path)
+
+
+def fsync_dir(dir_path: pathlib.Path) -> None:
+    """Persist the rename in the directory. Not supported on some platforms. So, it is skipped there."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+
+    dir_fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def remove_offsets_file(data_path: pathlib.Path) -> None:
+    get_offsets_path(data_path).unlink(missing_ok=True)
+
+
+class OffsetsHeader(BaseModel):
+    digest: str
+    section_sizes: list[int]
+
+
+def read_offsets_header(data_path: pathlib.Path, offsets_file: BinaryIO) -> OffsetsHeader | None:
+    """Read the header of the offsets index.
+
+    Returns:
+        `None`, if the header is broken or doesn't match the data file.
+    """
+    try:
+        stat = data_path.stat()
+    except FileNotFoundError:
+        return None
+
+    header_raw = offsets_file.read(OFFSETS_HEADER.size)
+    if len(header_raw) != OFFSETS_HEADER.size:
+        return None
+
+    magic, version, size, mtime_ns, digest, *section_sizes = OFFSETS_HEADER.unpack(header_raw)
+    if (magic, version, size, mtime_ns) != (OFFSETS_MAGIC, OFFSETS_VERSION, stat.st_size, stat.st_mtime_ns):
+        return None
+
+    return OffsetsHeader(digest=digest.hex(), section_sizes=section_sizes)
+
+
+def get_data_file_digest(data_path: pathlib.Path) -> str | None:
+    """Get the digest of the data file, that is recorded by the writer.
+
+    Returns:
+        `None`, if the data file is not written by the writer or is changed after that.
+    """
+    try:
+        offsets_file = get_offsets_path(data_path).open("rb")
+    except FileNotFoundError:
+        return None
+
+    with offsets_file:
+        header = read_offsets_header(data_path, offsets_file)
+
+    return None if header is None else header.digest
+
+
+class MappedDataFile:
+    """Memory-mapped data file with its offsets index. Read-only."""
+
+    def __init__(
+        self,
+        *,
+        data_map: mmap.mmap,
+        offsets_map: mmap.mmap,
+        digest: str,
+        section_sizes: list[int],
+    ) -> None:
+        self._data_map = data_map
+        self._offsets_map = offsets_map
+        self.digest = digest
+
+        self._section_starts: list[int] = []
+        start = OFFSETS_HEADER.size
+        for size in section_sizes:
+            self._section_starts.append(start)
+            start += size * OFFSETS_RECORD.size
+        self._section_sizes = section_sizes
+
+    @classmethod
+    def open(cls, data_path: pathlib.Path) -> Self | None:
+        """Open the data file, if it has an actual offsets index.
+
+        The digest of the data file is checked once. So, items are trusted and read without validation.
+        Size and mtime are not enough: the file can be edited without their change.
+
+        Returns:
+            `None`, if there is no offsets index or it doesn't match the data file.
+        """
+        try:
+            offsets_file = get_offsets_path(data_path).open("rb")
+        except FileNotFoundError:
+            return None
+
+        with offsets_file:
+            header = read_offsets_header(data_path, offsets_file)
+            if header is None:
+                return None
+
+            offsets_map = mmap.mmap(offsets_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        with data_path.open("rb") as data_file:
+            data_map = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if hashlib.blake2b(data_map, digest_size=DIGEST_SIZE).hexdigest() != header.digest:
+            data_map.close()
+            offsets_map.close()
+            return None
+
+        return cls(
+            data_map=data_map,
+            offsets_map=offsets_map,
+            digest=header.digest,
+            section_sizes=header.section_sizes,
+        )
+
+    def close(self) -> None:
+        self._data_map.close()
+        self._offsets_map.close()
+
+    def get_section_size(self, section_position: int) -> int:
+        return self._section_sizes[section_position]
+
+    def _get_record(self, section_position: int, record_position: int) -> tuple[bytes, int, int]:
+        start = self._section_starts[section_position] + record_position * OFFSETS_RECORD.size
+        uid_bytes, offset, length = OFFSETS_RECORD.unpack_from(self._offsets_map, start)
+        return uid_bytes, offset, length
+
+    def find(self, section_position: int, uid: uuid.UUID) -> tuple[int, int] | None:
+        """Find the offset and the length of the item. Binary search by uid."""
+        target = uid.bytes
+        start = self._section_starts[section_position]
+
+        low = 0
+        high = self._section_sizes[section_position]
+        while low < high:
+            middle = (low + high) // 2
+            record_start = start + middle * OFFSETS_RECORD.size
+            if self._offsets_map[record_start : record_start + UID_SIZE] < target:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == self._section_sizes[section_position]:
+            return None
+
+        uid_bytes, offset, length = self._get_record(section_position, low)
+        if uid_bytes != target:
+            return None
+
+        return offset, length
+
+    def read(self, offset: int, length: int) -> bytes:
+        return self._data_map[offset : offset + length]
+
+    def iterate_uids(self, section_position: int) -> Iterator[uuid.UUID]:
+        """Iterate over uids in the order of the data file."""
+        records = [
+            self._get_record(section_position, record_position)
+            for record_position in range(self._section_sizes[section_position])
+        ]
+        records.sort(key=lambda record: record[1])
+
+        for uid_bytes, _, _ in records:
+            yield uuid.UUID(bytes=uid_bytes)
@@ -1,39 +1,250 @@
+import enum
+import hashlib
 import pathlib
-from typing import TYPE_CHECKING, Annotated, Self
+import sqlite3
+import threading
+from collections.abc import Mapping, MutableMapping
+from typing import TYPE_CHECKING, Annotated, Any, Final, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
+from persyval.exceptions.main import InvalidDataError
 from persyval.models.contact import Contact, ContactUid
 from persyval.models.note import Note, NoteUid
+from persyval.services.data_index.indexed_section import IndexedSection
+from persyval.services.data_storage.binary_data_file import read_binary_data_file, write_binary_data_file
+from persyval.services.data_storage.data_change import DataChange
+from persyval.services.data_storage.data_file import (
+    DIGEST_SIZE,
+    MappedDataFile,
+    get_data_file_digest,
+    write_data_file,
+)
+from persyval.services.data_storage.debounced_writer import DebouncedWriter
+from persyval.services.data_storage.journal import (
+    append_to_journal,
+    get_journal_size,
+    iterate_journal,
+    remove_journal,
+    replay_journal,
+)
+from persyval.services.data_storage.lazy_section import LazySection
+from persyval.services.data_storage.sqlite_section import SqliteSection
+from persyval.services.model_meta.trusted_validation import get_trusted_context
+from persyval.services.notes_search.search_index import (
+    NotesSearchIndex,
+    load_notes_search_index,
+    save_notes_search_index,
+)
 
 if TYPE_CHECKING:
     from types import TracebackType
 
+DATA_FILE_NAME: Final[str] = "data.json"
+BINARY_DATA_FILE_NAME: Final[str] = "data.bin"
+JOURNAL_FILE_SUFFIX: Final[str] = ".journal"
+SQLITE_FILE_NAME: Final[str] = "data.sqlite3"
+SQLITE_IN_MEMORY: Final[str] = ":memory:"
+NOTES_SEARCH_INDEX_FILE_SUFFIX: Final[str] = ".notes_search.json"
+
+JOURNAL_COMPACTION_MIN_RECORDS: Final[int] = 1000
+"""Minimal amount of journal records before compaction into the snapshot.
+
+Compaction happens when the journal becomes bigger than this value and bigger than the data itself.
+So, the cost of the snapshot rewrite is amortized over the mutations.
+"""
+
+
+@enum.unique
+class DataStorageMode(enum.StrEnum):
+    SNAPSHOT = "snapshot"
+    """Rewrite the whole data file on each mutation."""
+
+    JOURNAL = "journal"
+    """Append each mutation to the journal. Fold the journal into the data file from time to time."""
+
+    SQLITE = "sqlite"
+    """Keep the data in the SQLite database. Load items on demand. Filter by indexed queries."""
+
+
+@enum.unique
+class DataFileFormat(enum.StrEnum):
+    JSON = "json"
+    """Human-readable data file. Can be loaded lazily."""
+
+    BINARY = "binary"
+    """Compact binary data file. Faster to load and save. Smaller on the disk."""
+
+
+def get_data_file_name(data_format: DataFileFormat) -> str:
+    match data_format:
+        case DataFileFormat.JSON:
+            return DATA_FILE_NAME
+        case DataFileFormat.BINARY:
+            return BINARY_DATA_FILE_NAME
+
+
+def detect_data_file_format(dir_path: pathlib.Path) -> DataFileFormat:
+    if (dir_path / BINARY_DATA_FILE_NAME).exists():
+        return DataFileFormat.BINARY
+
+    return DataFileFormat.JSON
+
+
+def detect_data_storage_mode(dir_path: pathlib.Path) -> DataStorageMode:
+    if (dir_path / SQLITE_FILE_NAME).exists():
+        return DataStorageMode.SQLITE
+
+    return DataStorageMode.SNAPSHOT
+
+
+def get_content_fingerprint(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=DIGEST_SIZE).hexdigest()
+
+
+def get_file_fingerprint(path: pathlib.Path) -> str:
+    """Cheap fingerprint of the file by metadata. For files, that are too big to hash."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return ""
+
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
 
 # Note: Use `thin model` when available. So, all methods created as separated functions.
 
 
 class Data(BaseModel):
-    contacts: dict[ContactUid, Contact] = Field(
+    contacts: MutableMapping[ContactUid, Contact] = Field(
         default_factory=dict,
         description="Dictionary of contacts indexed by their unique identifiers.",
     )
 
-    notes: dict[NoteUid, Note] = Field(
+    notes: MutableMapping[NoteUid, Note] = Field(
         default_factory=dict,
         description="Dictionary of notes indexed by their unique identifiers.",
     )
 
+    @model_validator(mode="after")
+    def add_indexes_to_sections(self) -> Self:
+        add_indexes_to_data(self)
+        return self
+
     def clear(self) -> None:
         self.contacts.clear()
         self.notes.clear()
 
 
+def add_indexes_to_data(data: Data) -> None:
+    # Note: Only in-memory sections need it. Other sections are created without validation.
+    if type(data.contacts) is dict:
+        data.contacts = IndexedSection(
+            data.contacts.items(),
+            fields_meta_config=Contact.get_meta_info().fields_meta_config,
+        )
+
+    if type(data.notes) is dict:
+        data.notes = IndexedSection(
+            data.notes.items(),
+            fields_meta_config=Note.get_meta_info().fields_meta_config,
+        )
+
+
+def create_sqlite_data(connection: sqlite3.Connection) -> Data:
+    # Note: Sections are not dicts here. So, skip validation.
+    return Data.model_construct(
+        contacts=SqliteSection(
+            connection=connection,
+            table_name="contacts",
+            model=Contact,
+            fields_meta_config=Contact.get_meta_info().fields_meta_config,
+            uid_factory=ContactUid,
+        ),
+        notes=SqliteSection(
+            connection=connection,
+            table_name="notes",
+            model=Note,
+            fields_meta_config=Note.get_meta_info().fields_meta_config,
+            uid_factory=NoteUid,
+        ),
+    )
+
+
+def create_lazy_data(data_file: MappedDataFile) -> Data:
+    # Note: Sections are not dicts here. So, skip validation.
+    return Data.model_construct(
+        contacts=LazySection(
+            data_file=data_file,
+            section_position=0,
+            model=Contact,
+            uid_factory=ContactUid,
+        ),
+        notes=LazySection(
+            data_file=data_file,
+            section_position=1,
+            model=Note,
+            uid_factory=NoteUid,
+        ),
+    )
+
+
+def is_data_changed(data: Data) -> bool:
+    """Check, if the data is changed since the last save. Only lazy sections track it. Other sections are changed."""
+    return not all(
+        isinstance(section, LazySection) and not section.is_changed for section in (data.contacts, data.notes)
+    )
+
+
+def mark_data_saved(data: Data) -> None:
+    for section in (data.contacts, data.notes):
+        if isinstance(section, LazySection):
+            section.is_changed = False
+
+
 class DataStorageAutosaver(BaseModel):
+    data_storage: DataStorage
+    changes: list[DataChange] = Field(default_factory=list)
+
+    def __enter__(self) -> Self:
+        # Note: Mutations and background writes are not mixed.
+        self.data_storage.get_lock().acquire()
+        return self
+
+    def add_change(self, change: DataChange) -> None:
+        """Add the change, that is known only after the mutation."""
+        self.changes.append(change)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        del exc_val, exc_tb
+
+        try:
+            # Save only if there is no exception.
+            if exc_type is None:
+                self.data_storage.commit_changes(self.changes)
+            else:
+                self.data_storage.rollback_changes()
+        finally:
+            self.data_storage.get_lock().release()
+        return None
+
+
+class DataStorageTransaction(BaseModel):
+    """Batch of changes, that is persisted at once.
+
+    Data actions inside the transaction don't persist their changes. All of them are persisted on exit.
+    Nested transactions are parts of the outer one.
+    """
+
     data_storage: DataStorage
 
     def __enter__(self) -> None:
-        return
+        self.data_storage.begin_transaction()
 
     def __exit__(
         self,
@@ -43,9 +254,7 @@ class DataStorageAutosaver(BaseModel):
     ) -> bool | None:
         del exc_val, exc_tb
 
-        # Save only if there is no exception.
-        if exc_type is None:
-            self.data_storage.save()
+        self.data_storage.end_transaction(is_successful=exc_type is None)
         return None
 
 
@@ -62,36 +271,378 @@ class DataStorage(BaseModel):
 
     data: Data
 
+    mode: DataStorageMode = DataStorageMode.SNAPSHOT
+
+    data_format: DataFileFormat = DataFileFormat.JSON
+
+    _journal_records_amount: int = PrivateAttr(default=0)
+    _sqlite_connection: sqlite3.Connection | None = PrivateAttr(default=None)
+    _mapped_data_file: MappedDataFile | None = PrivateAttr(default=None)
+
+    _lock: threading.RLock = PrivateAttr(default_factory=threading.RLock)
+    _debounced_writer: DebouncedWriter | None = PrivateAttr(default=None)
+
+    _transaction_depth: int = PrivateAttr(default=0)
+    _transaction_changes: list[DataChange] = PrivateAttr(default_factory=list)
+    _is_transaction_changes_unknown: bool = PrivateAttr(default=False)
+
+    _notes_search_index: NotesSearchIndex | None = PrivateAttr(default=None)
+    _data_fingerprint: str | None = PrivateAttr(default=None)
+    """Fingerprint of the persisted data. `None`, if unknown."""
+    _is_data_saved: bool = PrivateAttr(default=False)
+    """The data is saved and not changed since then. So, the save on exit is skipped. `False`, if unknown."""
+
     @classmethod
     def load(
         cls,
         dir_path: pathlib.Path | None,
+        mode: DataStorageMode | None = None,
+        *,
+        lazy: bool = False,
+        save_window: float | None = None,
+        data_format: DataFileFormat | None = None,
+    ) -> Self:
+        """Load the data storage.
+
+        If the mode or the format of the data file is not specified, it is detected by the files in the directory.
+
+        If `lazy`, items of the data file are validated only on access.
+        It works only for the data file, that is written with the offsets index. Otherwise, the data is loaded as usual.
+
+        If `save_window` is set, rewrites of the data file in the snapshot mode are done in the background.
+        All changes inside the window (in seconds) are written at once. Pending changes are written on exit.
+        """
+        data_storage = cls._load(dir_path=dir_path, mode=mode, data_format=data_format, lazy=lazy)
+
+        if save_window:
+            data_storage.enable_background_save(save_window)
+
+        return data_storage
+
+    @classmethod
+    def _load(
+        cls,
+        dir_path: pathlib.Path | None,
+        mode: DataStorageMode | None,
+        *,
+        data_format: DataFileFormat | None,
+        lazy: bool,
     ) -> Self:
         if dir_path is None:
-            return cls(path=None, data=Data())
+            mode = mode or DataStorageMode.SNAPSHOT
+            if mode == DataStorageMode.SQLITE:
+                return cls._load_sqlite(path=None)
+
+            return cls(path=None, data=Data(), mode=mode, data_format=data_format or DataFileFormat.JSON)
+
+        detected_mode = detect_data_storage_mode(dir_path)
+        mode = mode or detected_mode
+
+        if mode == DataStorageMode.SQLITE:
+            return cls._load_sqlite(path=dir_path / SQLITE_FILE_NAME)
+
+        if detected_mode == DataStorageMode.SQLITE:
+            msg = (
+                f"Storage in '{dir_path}' uses the '{DataStorageMode.SQLITE}' mode. Can't open it in the '{mode}' mode."
+            )
+            raise InvalidDataError(msg)
+
+        detected_format = detect_data_file_format(dir_path)
+        data_format = data_format or detected_format
 
-        path = dir_path / "data.json"
+        if data_format != detected_format and (dir_path / get_data_file_name(detected_format)).exists():
+            msg = (
+                f"Storage in '{dir_path}' uses the '{detected_format}' data format. "
+                f"Convert it to the '{data_format}' data format first."
+            )
+            raise InvalidDataError(msg)
+
+        return cls._load_data_file(
+            path=dir_path / get_data_file_name(data_format),
+            mode=mode,
+            data_format=data_format,
+            lazy=lazy,
+        )
+
+    @classmethod
+    def _load_data_file(
+        cls,
+        path: pathlib.Path,
+        mode: DataStorageMode,
+        data_format: DataFileFormat,
+        *,
+        lazy: bool = False,
+    ) -> Self:
+        match data_format:
+            case DataFileFormat.JSON:
+                return cls._load_json(path=path, mode=mode, lazy=lazy)
+            case DataFileFormat.BINARY:
+                # Note: Binary data file has no offsets index. So, it is always loaded eagerly. It is fast anyway.
+                return cls._load_binary(path=path, mode=mode)
+
+    @classmethod
+    def _load_binary(cls, path: pathlib.Path, mode: DataStorageMode) -> Self:
+        try:
+            file = path.open("rb")
+        except FileNotFoundError:
+            data = Data()
+            fingerprint = get_content_fingerprint(b"")
+        else:
+            with file:
+                read_result = read_binary_data_file(file)
+            contacts, notes = read_result.sections
+            # Note: Items are checked by the digest. So, skip validation. Indexes are still needed.
+            data = Data.model_construct(contacts=contacts, notes=notes)
+            add_indexes_to_data(data)
+            fingerprint = read_result.digest
+
+        data_storage = cls(path=path, data=data, mode=mode, data_format=DataFileFormat.BINARY)
+        data_storage._data_fingerprint = fingerprint
+        data_storage._journal_records_amount = replay_journal(data_storage.get_journal_path(), data)
+
+        return data_storage
+
+    @classmethod
+    def _load_json(cls, path: pathlib.Path, mode: DataStorageMode, *, lazy: bool = False) -> Self:
+        mapped_data_file = MappedDataFile.open(path) if lazy else None
+        if mapped_data_file is not None:
+            data_storage = cls(path=path, data=create_lazy_data(mapped_data_file), mode=mode)
+            data_storage._mapped_data_file = mapped_data_file
+            data_storage._data_fingerprint = mapped_data_file.digest
+            data_storage._journal_records_amount = replay_journal(data_storage.get_journal_path(), data_storage.data)
+            return data_storage
 
         try:
-            with path.open("r", encoding="utf-8") as file:
-                data = Data.model_validate_json(file.read())
+            with path.open("rb") as file:
+                content = file.read()
         except FileNotFoundError:
+            content = b""
+            fingerprint = get_content_fingerprint(content)
             data = Data()
+        else:
+            fingerprint = get_content_fingerprint(content)
+            # Note: The data file is trusted, only if it is written by persyval and not changed after that.
+            # So, foreign and edited files are fully validated.
+            is_trusted = get_data_file_digest(path) == fingerprint
+            data = Data.model_validate_json(content, context=get_trusted_context() if is_trusted else None)
+
+        data_storage = cls(path=path, data=data, mode=mode)
+        data_storage._data_fingerprint = fingerprint
+
+        # Note: Replay the journal in any mode. It can be left by the previous run in the journal mode.
+        data_storage._journal_records_amount = replay_journal(data_storage.get_journal_path(), data)
+
+        return data_storage
+
+    @classmethod
+    def _load_sqlite(cls, path: pathlib.Path | None) -> Self:
+        is_new = path is None or not path.exists()
+
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+        data_fingerprint = None if path is None else get_file_fingerprint(path)
+
+        # Note: Commands are run in worker threads of the chat engine. But one by one. So, access is not concurrent.
+        connection = sqlite3.connect(SQLITE_IN_MEMORY if path is None else path, check_same_thread=False)
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.execute("PRAGMA journal_mode = WAL")
+
+        data_storage = cls(path=path, data=create_sqlite_data(connection), mode=DataStorageMode.SQLITE)
+        data_storage._sqlite_connection = connection
+        data_storage._data_fingerprint = data_fingerprint
+
+        data_file_format = None if path is None else detect_data_file_format(path.parent)
+        if is_new and path is not None and data_file_format is not None:
+            data_file_path = path.parent / get_data_file_name(data_file_format)
+            if data_file_path.exists():
+                # Note: Import existing data once. The data file is kept as is.
+                file_data = cls._load_data_file(
+                    path=data_file_path,
+                    mode=DataStorageMode.SNAPSHOT,
+                    data_format=data_file_format,
+                ).data
+                data_storage.data.contacts.update(file_data.contacts)
+                data_storage.data.notes.update(file_data.notes)
+
+        connection.commit()
+
+        return data_storage
+
+    def get_journal_path(self) -> pathlib.Path:
+        if self.path is None:
+            msg = "Temporary storage has no journal."
+            raise ValueError(msg)
+
+        return self.path.with_suffix(JOURNAL_FILE_SUFFIX)
+
+    def get_notes_search_index_path(self) -> pathlib.Path:
+        if self.path is None:
+            msg = "Temporary storage has no notes search index."
+            raise ValueError(msg)
+
+        return self.path.with_suffix(NOTES_SEARCH_INDEX_FILE_SUFFIX)
+
+    def get_notes_search_index(self) -> NotesSearchIndex:
+        """Get the full-text search index for notes. Load the persisted one or build it on the first use."""
+        if self._notes_search_index is None:
+            self._notes_search_index = self._load_notes_search_index() or NotesSearchIndex.create(
+                self.data.notes.values(),
+            )
+
+        return self._notes_search_index
+
+    def _load_notes_search_index(self) -> NotesSearchIndex | None:
+        if self.path is None or self._data_fingerprint is None:
+            return None
+
+        index = load_notes_search_index(self.get_notes_search_index_path())
+        if index is None or index.source_fingerprint != self._data_fingerprint:
+            return None
+
+        # Note: Catch up with changes, that are appended to the journal after the index was persisted.
+        for change, _ in iterate_journal(self.get_journal_path(), offset=index.journal_offset):
+            index.apply_data_change(change)
+
+        return index
+
+    def _save_notes_search_index(self) -> None:
+        if self.path is None or self._notes_search_index is None:
+            return
 
-        return cls(path=path, data=data)
+        index = self._notes_search_index
+        index.source_fingerprint = self._data_fingerprint
+        index.journal_offset = get_journal_size(self.get_journal_path())
+
+        save_notes_search_index(self.get_notes_search_index_path(), index)
 
     def save(self) -> None:
+        """Write the whole data to the data file. Fold the journal, if any."""
+        if self._sqlite_connection is not None:
+            self._sqlite_connection.commit()
+            self._is_data_saved = True
+            # Note: Known after the connection is closed.
+            self._data_fingerprint = None
+            return
+
         if self.path is None:
             return
 
         dir_path = self.path.parent
         dir_path.mkdir(parents=True, exist_ok=True)
 
-        with self.path.open("w", encoding="utf-8") as file:
-            file.write(self.data.model_dump_json(indent=4, ensure_ascii=False))
+        sections: list[Mapping[Any, BaseModel]] = [self.data.contacts, self.data.notes]
+        match self.data_format:
+            case DataFileFormat.JSON:
+                write_result = write_data_file(self.path, sections)
+            case DataFileFormat.BINARY:
+                write_result = write_binary_data_file(self.path, sections)
+        mark_data_saved(self.data)
+        self._is_data_saved = True
+
+        self._data_fingerprint = write_result.digest
+
+        remove_journal(self.get_journal_path())
+        self._journal_records_amount = 0
+
+    def get_lock(self) -> threading.RLock:
+        return self._lock
+
+    def enable_background_save(self, window: float) -> None:
+        """Rewrite the data file in the background. At most once per window (in seconds).
+
+        Only the snapshot mode rewrites the data file on each change. So, other modes are kept as is.
+        """
+        if self.path is None or self.mode != DataStorageMode.SNAPSHOT or self._debounced_writer is not None:
+            return
+
+        self._debounced_writer = DebouncedWriter(write=self._save_in_background, window=window)
+
+    def _save_in_background(self) -> None:
+        with self._lock:
+            self.save()
+
+    def commit_changes(self, changes: list[DataChange]) -> None:
+        """Persist changes, that already applied to the data. Inside the transaction, persist them on its end."""
+        self._is_data_saved = False
+
+        if self._notes_search_index is not None:
+            if changes:
+                for change in changes:
+                    self._notes_search_index.apply_data_change(change)
+            else:
+                # Note: Unknown changes. So, rebuild the index on the next use.
+                self._notes_search_index = None
+
+        if self._transaction_depth:
+            self._transaction_changes.extend(changes)
+            self._is_transaction_changes_unknown = self._is_transaction_changes_unknown or not changes
+            return
+
+        self._persist_changes(changes)
+
+    def _persist_changes(self, changes: list[DataChange]) -> None:
+        if self.path is None:
+            return
+
+        match self.mode:
+            case DataStorageMode.SNAPSHOT if self._debounced_writer is not None:
+                self._debounced_writer.request()
 
-    def autosave(self) -> DataStorageAutosaver:
-        return DataStorageAutosaver(data_storage=self)
+            case DataStorageMode.SNAPSHOT | DataStorageMode.SQLITE:
+                self.save()
+
+            case DataStorageMode.JOURNAL:
+                if not changes:
+                    # Note: Unknown changes. So, the only safe way is the full rewrite.
+                    self.save()
+                    return
+
+                self._journal_records_amount += append_to_journal(self.get_journal_path(), changes)
+
+                if self._journal_records_amount >= max(JOURNAL_COMPACTION_MIN_RECORDS, self.get_items_amount()):
+                    self.save()
+
+    def rollback_changes(self) -> None:
+        """Discard not persisted changes, if the mode supports it. Inside the transaction, it is done on its end."""
+        # Note: In-memory sections keep the partial mutation. So, it is saved on exit, like before.
+        self._is_data_saved = False
+
+        if self._transaction_depth:
+            return
+
+        if self._sqlite_connection is not None:
+            self._sqlite_connection.rollback()
+
+    def autosave(self, *changes: DataChange) -> DataStorageAutosaver:
+        return DataStorageAutosaver(data_storage=self, changes=list(changes))
+
+    def transaction(self) -> DataStorageTransaction:
+        return DataStorageTransaction(data_storage=self)
+
+    def begin_transaction(self) -> None:
+        # Note: Background writes must not see the half of the transaction.
+        self._lock.acquire()
+        self._transaction_depth += 1
+
+    def end_transaction(self, *, is_successful: bool) -> None:
+        try:
+            self._transaction_depth -= 1
+            if self._transaction_depth:
+                return
+
+            changes = self._transaction_changes
+            is_changes_unknown = self._is_transaction_changes_unknown
+            self._transaction_changes = []
+            self._is_transaction_changes_unknown = False
+
+            if not is_successful:
+                self.rollback_changes()
+            elif changes or is_changes_unknown:
+                # Note: Empty list means unknown changes. So, the full rewrite is done.
+                self._persist_changes([] if is_changes_unknown else changes)
+        finally:
+            self._lock.release()
 
     def __enter__(self) -> Self:
         return self
@@ -102,13 +653,39 @@ class DataStorage(BaseModel):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> bool | None:
-        self.save()
+        is_save_pending = False
+        if self._debounced_writer is not None:
+            is_save_pending = self._debounced_writer.stop()
+            self._debounced_writer = None
+
+        # Note: In the journal mode, all changes are already persisted. Compaction happens by the journal size.
+        # Note: The data, that is persisted by the end of the transaction, is not rewritten again.
+        if is_save_pending or (
+            self.mode != DataStorageMode.JOURNAL and not self._is_data_saved and is_data_changed(self.data)
+        ):
+            self.save()
+
+        if self._sqlite_connection is not None:
+            self._sqlite_connection.close()
+            self._sqlite_connection = None
+
+            if self.path is not None:
+                self._data_fingerprint = get_file_fingerprint(self.path)
+
+        self._save_notes_search_index()
+
+        if self._mapped_data_file is not None:
+            self._mapped_data_file.close()
+            self._mapped_data_file = None
         return None
 
     def clear(self) -> None:
-        with self.autosave():
+        with self.autosave(DataChange.clear()):
             self.data.clear()
 
+    def get_items_amount(self) -> int:
+        return len(self.data.contacts) + len(self.data.notes)
+
     def get_stats(self) -> list[DataStorageSectionStats]:
         return [
             DataStorageSectionStats(name="Contacts", amount=len(self.data.contacts)),
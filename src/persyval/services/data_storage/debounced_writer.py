@@ -0,0 +1,100 @@
+"""Background writer, that coalesces bursts of save requests into one write."""
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class DebouncedWriter:
+    """Call the write function in the background thread, at most once per window.
+
+    The first request opens the window. All requests inside the window are served by one write at its end.
+    So, the latency of the persistence is limited by the window.
+    """
+
+    def __init__(
+        self,
+        *,
+        write: Callable[[], None],
+        window: float,
+    ) -> None:
+        self._write = write
+        self._window = window
+
+        self._condition = threading.Condition()
+        self._window_end: float | None = None
+        """End of the current window. `None`, if there is no scheduled write."""
+        self._is_pending = False
+        """If there are requests, that are not written yet. Also, after the failed write."""
+        self._is_stopped = False
+        self._error: Exception | None = None
+
+        self._thread = threading.Thread(target=self._run, name="persyval-debounced-writer", daemon=True)
+        self._thread.start()
+
+    def request(self) -> None:
+        """Request the write. Raise the error of the previous background write, if any."""
+        with self._condition:
+            self._raise_error()
+
+            self._is_pending = True
+            if self._window_end is None:
+                self._window_end = time.monotonic() + self._window
+                self._condition.notify()
+
+    def stop(self) -> bool:
+        """Stop the background thread. Pending write is not done.
+
+        Returns:
+            `True`, if there is a pending write. So, the caller must write by itself.
+        """
+        with self._condition:
+            self._is_stopped = True
+            self._condition.notify()
+
+        self._thread.join()
+
+        with self._condition:
+            self._error = None
+            return self._is_pending
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _wait_for_window_end(self) -> bool:
+        """Wait under the condition. Returns `False`, if the writer is stopped."""
+        while not self._is_stopped:
+            if self._window_end is None:
+                self._condition.wait()
+                continue
+
+            timeout = self._window_end - time.monotonic()
+            if timeout <= 0:
+                return True
+
+            self._condition.wait(timeout)
+
+        return False
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._wait_for_window_end():
+                    return
+
+                self._window_end = None
+                self._is_pending = False
+
+            # Note: Write outside the condition. So, new requests are not blocked by the write.
+            try:
+                self._write()
+            except Exception as e:  # noqa: BLE001
+                with self._condition:
+                    # Note: Don't retry in the loop. The error is raised on the next request, that schedules the retry.
+                    self._error = e
+                    self._is_pending = True
@@ -0,0 +1,124 @@
+"""Append-only journal (write-ahead log) for the data storage.
+
+Each line is a compact JSON representation of a single `DataChange`.
+"""
+
+import os
+from typing import TYPE_CHECKING
+
+from pydantic import ValidationError
+
+from persyval.exceptions.main import InvalidDataError
+from persyval.services.data_storage.data_change import DataChange, apply_data_change
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterable, Iterator
+
+    from persyval.services.data_storage.data_storage import Data
+
+
+def append_to_journal(
+    path: pathlib.Path,
+    changes: Iterable[DataChange],
+) -> int:
+    lines = [change.model_dump_json(exclude_none=True) + "\n" for change in changes]
+    if not lines:
+        return 0
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with path.open("a", encoding="utf-8") as file:
+        file.writelines(lines)
+
+    return len(lines)
+
+
+def is_json_syntax_error(error: ValidationError) -> bool:
+    return any(item["type"] == "json_invalid" for item in error.errors())
+
+
+def iterate_journal(
+    path: pathlib.Path,
+    offset: int = 0,
+) -> Iterator[tuple[DataChange, int]]:
+    """Iterate over changes from the journal, starting from the offset in bytes.
+
+    Stops at the torn last record. It is left by the crash during the append:
+    the line without the trailing newline or with the broken JSON.
+
+    Yields:
+        Change and the size of the valid part of the journal, including this change.
+
+    Raises:
+        InvalidDataError: If the invalid record is followed by other records or is the complete JSON.
+            So, later changes are never dropped together with it.
+    """
+    try:
+        file = path.open("rb")
+    except FileNotFoundError:
+        return
+
+    position = offset
+    with file:
+        size = os.fstat(file.fileno()).st_size
+        file.seek(offset)
+        for line in file:
+            # Note: Only the last line can be without the newline.
+            if not line.endswith(b"\n"):
+                return
+
+            try:
+                change = DataChange.model_validate_json(line)
+            except ValidationError as error:
+                if position + len(line) == size and is_json_syntax_error(error):
+                    return
+
+                raise make_journal_corrupted_error(path, position) from error
+            except InvalidDataError as error:
+                raise make_journal_corrupted_error(path, position) from error
+
+            position += len(line)
+            yield change, position
+
+
+def make_journal_corrupted_error(path: pathlib.Path, position: int) -> InvalidDataError:
+    msg = f"Journal is corrupted. Invalid record at byte {position} of the file: {path}"
+    return InvalidDataError(msg)
+
+
+def get_journal_size(path: pathlib.Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def replay_journal(
+    path: pathlib.Path,
+    data: Data,
+) -> int:
+    """Apply all changes from the journal to the data.
+
+    A torn trailing record (for example, after a crash during an append) is dropped from the file.
+    Other invalid records raise the error. The file is left untouched then.
+
+    Returns:
+        Amount of applied changes.
+    """
+    applied = 0
+    valid_size = 0
+    for change, position in iterate_journal(path):
+        apply_data_change(data, change)
+        applied += 1
+        valid_size = position
+
+    if valid_size != get_journal_size(path):
+        with path.open("r+b") as file_to_fix:
+            file_to_fix.truncate(valid_size)
+
+    return applied
+
+
+def remove_journal(path: pathlib.Path) -> None:
+    path.unlink(missing_ok=True)
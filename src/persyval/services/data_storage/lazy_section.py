@@ -0,0 +1,161 @@
+"""Lazy section of the data, backed by the memory-mapped data file.
+
+Items are validated and materialized only on access. Mutations are kept in memory on top of the file.
+"""
+
+import uuid
+from collections.abc import Callable, Iterator, MutableMapping, ValuesView
+from typing import TYPE_CHECKING, Any, override
+
+from pydantic import BaseModel
+
+from persyval.services.model_meta.trusted_validation import get_trusted_context
+
+if TYPE_CHECKING:
+    from persyval.services.data_storage.data_file import MappedDataFile
+
+
+class LazySectionValues[T: BaseModel](ValuesView[T]):
+    def __init__(self, section: LazySection[Any, T]) -> None:
+        super().__init__(section)
+        self._section = section
+
+    @override
+    def __iter__(self) -> Iterator[T]:
+        yield from self._section.iterate_values()
+
+
+class LazySection[Uid: uuid.UUID, T: BaseModel](MutableMapping[Uid, T]):
+    def __init__(
+        self,
+        *,
+        data_file: MappedDataFile,
+        section_position: int,
+        model: type[T],
+        uid_factory: Callable[[uuid.UUID], Uid],
+    ) -> None:
+        self._data_file = data_file
+        self._section_position = section_position
+        self._model = model
+        self._uid_factory = uid_factory
+
+        self._materialized: dict[Uid, T] = {}
+        """Items, that are already validated. Also, new and updated items."""
+        self._added: dict[Uid, None] = {}
+        """Items, that are not in the file. In order of addition."""
+        self._deleted: set[Uid] = set()
+        """Items from the file, that are deleted."""
+        self._is_file_cleared = False
+
+        self.is_changed = False
+        """If there are changes since the last save."""
+
+    def _find_in_file(self, key: Uid) -> tuple[int, int] | None:
+        if self._is_file_cleared or key in self._deleted:
+            return None
+
+        return self._data_file.find(self._section_position, key)
+
+    def get_raw_item(self, uid: uuid.UUID) -> bytes:
+        key = self._uid_factory(uid)
+
+        item = self._materialized.get(key)
+        if item is not None:
+            return item.model_dump_json().encode()
+
+        location = self._find_in_file(key)
+        if location is None:
+            raise KeyError(key)
+
+        # Note: The item was validated, when it was written. So, copy it as is.
+        return self._data_file.read(*location)
+
+    # [mapping]-[BEGIN]
+
+    @override
+    def __getitem__(self, key: Uid) -> T:
+        item = self._materialized.get(key)
+        if item is not None:
+            return item
+
+        location = self._find_in_file(key)
+        if location is None:
+            raise KeyError(key)
+
+        item = self._read_item(location)
+        self._materialized[key] = item
+        return item
+
+    def _read_item(self, location: tuple[int, int]) -> T:
+        # Note: The digest of the data file is checked by `MappedDataFile.open`. So, items are trusted.
+        return self._model.model_validate_json(self._data_file.read(*location), context=get_trusted_context())
+
+    @override
+    def __setitem__(self, key: Uid, value: T) -> None:
+        if key not in self:
+            self._added[key] = None
+
+        self._materialized[key] = value
+        self.is_changed = True
+
+    @override
+    def __delitem__(self, key: Uid) -> None:
+        if key in self._added:
+            del self._added[key]
+        elif self._find_in_file(key) is not None:
+            self._deleted.add(key)
+        else:
+            raise KeyError(key)
+
+        self._materialized.pop(key, None)
+        self.is_changed = True
+
+    @override
+    def __iter__(self) -> Iterator[Uid]:
+        if not self._is_file_cleared:
+            for uid in self._data_file.iterate_uids(self._section_position):
+                key = self._uid_factory(uid)
+                if key not in self._deleted:
+                    yield key
+
+        yield from list(self._added)
+
+    @override
+    def __len__(self) -> int:
+        in_file = 0 if self._is_file_cleared else self._data_file.get_section_size(self._section_position)
+        return in_file - len(self._deleted) + len(self._added)
+
+    @override
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, uuid.UUID):
+            return False
+
+        uid = self._uid_factory(key)
+        return uid in self._added or self._find_in_file(uid) is not None
+
+    @override
+    def values(self) -> LazySectionValues[T]:
+        return LazySectionValues(self)
+
+    @override
+    def clear(self) -> None:
+        self._materialized.clear()
+        self._added.clear()
+        self._deleted.clear()
+        self._is_file_cleared = True
+        self.is_changed = True
+
+    # [mapping]-[END]
+
+    def iterate_values(self) -> Iterator[T]:
+        """Iterate items without keeping them in memory. For full scans, like the export."""
+        for key in self:
+            item = self._materialized.get(key)
+            if item is None:
+                location = self._find_in_file(key)
+                if location is None:
+                    continue
+
+                item = self._read_item(location)
+
+            yield item
@@ -0,0 +1,279 @@
+"""SQLite-backed section of the data.
+
+Each section (contacts, notes) is a table with the item stored as JSON.
+Filterable fields are duplicated into indexed columns with normalized values.
+List-based fields are stored in separate tables, one row per value.
+
+So, the section can be used as a usual mapping, but filtering is done by indexed queries.
+"""
+
+import uuid
+from collections.abc import Callable, Iterator, MutableMapping, ValuesView
+from typing import TYPE_CHECKING, Any, Final, override
+
+from pydantic import BaseModel
+
+from persyval.services.birthday.birthday_calendar import get_month_day
+from persyval.services.model_meta.field_meta import FilterMode, normalize_field_value_for_filter
+from persyval.services.model_meta.trusted_validation import get_trusted_context
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterable
+
+    from persyval.services.birthday.birthday_calendar import MonthDay
+    from persyval.services.model_meta.field_meta import FieldItemMetaConfig, FieldsMetaConfig
+
+UID_COLUMN: Final[str] = "uid"
+DATA_COLUMN: Final[str] = "data"
+
+MONTH_DAY_START: Final[int] = 6
+"""Position of the month and the day in the normalized date (`YYYY-MM-DD`) for `substr`."""
+
+
+def quote_identifier(name: str) -> str:
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+class SqliteSectionValues[T: BaseModel](ValuesView[T]):
+    def __init__(self, section: SqliteSection[Any, T]) -> None:
+        super().__init__(section)
+        self._section = section
+
+    @override
+    def __iter__(self) -> Iterator[T]:
+        yield from self._section.iterate_values()
+
+
+class SqliteSection[Uid: uuid.UUID, T: BaseModel](MutableMapping[Uid, T]):
+    def __init__(
+        self,
+        *,
+        connection: sqlite3.Connection,
+        table_name: str,
+        model: type[T],
+        fields_meta_config: FieldsMetaConfig,
+        uid_factory: Callable[[uuid.UUID], Uid],
+    ) -> None:
+        self._connection = connection
+        self._table_name = table_name
+        self._model = model
+        self._uid_factory = uid_factory
+
+        fields = [field for field in fields_meta_config.get_fields_for_filtering() if field.name != UID_COLUMN]
+        self._fields_registry: dict[str, FieldItemMetaConfig] = {field.name: field for field in fields}
+        self._scalar_fields = [field for field in fields if not field.is_list_based]
+        self._list_fields = [field for field in fields if field.is_list_based]
+
+        self._create_schema()
+
+    def get_list_table_name(self, field: FieldItemMetaConfig) -> str:
+        return f"{self._table_name}_{field.name}"
+
+    def _create_schema(self) -> None:
+        table = quote_identifier(self._table_name)
+        scalar_columns = "".join(f", {quote_identifier(field.name)} TEXT" for field in self._scalar_fields)
+
+        statements = [
+            f"CREATE TABLE IF NOT EXISTS {table} ({UID_COLUMN} TEXT PRIMARY KEY{scalar_columns}, {DATA_COLUMN} TEXT NOT NULL)",  # noqa: E501
+        ]
+        statements.extend(
+            f"CREATE INDEX IF NOT EXISTS {quote_identifier(f'{self._table_name}__{field.name}')} "
+            f"ON {table} ({quote_identifier(field.name)})"
+            for field in self._scalar_fields
+        )
+        statements.extend(
+            f"CREATE INDEX IF NOT EXISTS {quote_identifier(f'{self._table_name}__{field.name}__month_day')} "
+            f"ON {table} (substr({quote_identifier(field.name)}, {MONTH_DAY_START}))"
+            for field in self._scalar_fields
+            if field.is_calendar_indexed
+        )
+
+        for field in self._list_fields:
+            list_table_name = self.get_list_table_name(field)
+            list_table = quote_identifier(list_table_name)
+            statements.extend(
+                [
+                    f"CREATE TABLE IF NOT EXISTS {list_table} ("
+                    f"{UID_COLUMN} TEXT NOT NULL REFERENCES {table} ({UID_COLUMN}) ON DELETE CASCADE, "
+                    "position INTEGER NOT NULL, "
+                    "value TEXT NOT NULL, "
+                    f"PRIMARY KEY ({UID_COLUMN}, position))",
+                    f"CREATE INDEX IF NOT EXISTS {quote_identifier(f'{list_table_name}__value')} "
+                    f"ON {list_table} (value)",
+                ],
+            )
+
+        for statement in statements:
+            self._connection.execute(statement)
+
+    # [mapping]-[BEGIN]
+
+    @override
+    def __getitem__(self, key: Uid) -> T:
+        row = self._connection.execute(
+            f"SELECT {DATA_COLUMN} FROM {quote_identifier(self._table_name)} WHERE {UID_COLUMN} = ?",  # noqa: S608
+            (str(key),),
+        ).fetchone()
+
+        if row is None:
+            raise KeyError(key)
+
+        return self._validate_item(row[0])
+
+    @override
+    def __setitem__(self, key: Uid, value: T) -> None:
+        table = quote_identifier(self._table_name)
+        columns = [UID_COLUMN, *(quote_identifier(field.name) for field in self._scalar_fields), DATA_COLUMN]
+        values = [
+            str(key),
+            *(normalize_field_value_for_filter(getattr(value, field.name)) for field in self._scalar_fields),
+            value.model_dump_json(),
+        ]
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+
+        self._connection.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "  # noqa: S608
+            f"ON CONFLICT ({UID_COLUMN}) DO UPDATE SET {updates}",
+            values,
+        )
+
+        for field in self._list_fields:
+            list_table = quote_identifier(self.get_list_table_name(field))
+            self._connection.execute(f"DELETE FROM {list_table} WHERE {UID_COLUMN} = ?", (str(key),))  # noqa: S608
+            self._connection.executemany(
+                f"INSERT INTO {list_table} ({UID_COLUMN}, position, value) VALUES (?, ?, ?)",  # noqa: S608
+                [
+                    (str(key), position, normalize_field_value_for_filter(item))
+                    for position, item in enumerate(getattr(value, field.name) or [])
+                ],
+            )
+
+    @override
+    def __delitem__(self, key: Uid) -> None:
+        cursor = self._connection.execute(
+            f"DELETE FROM {quote_identifier(self._table_name)} WHERE {UID_COLUMN} = ?",  # noqa: S608
+            (str(key),),
+        )
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+
+    @override
+    def __iter__(self) -> Iterator[Uid]:
+        cursor = self._connection.execute(
+            f"SELECT {UID_COLUMN} FROM {quote_identifier(self._table_name)} ORDER BY rowid",  # noqa: S608
+        )
+        for (uid,) in cursor:
+            yield self._uid_factory(uuid.UUID(uid))
+
+    @override
+    def __len__(self) -> int:
+        row = self._connection.execute(f"SELECT COUNT(*) FROM {quote_identifier(self._table_name)}").fetchone()  # noqa: S608
+        return int(row[0])
+
+    @override
+    def __contains__(self, key: object) -> bool:
+        row = self._connection.execute(
+            f"SELECT 1 FROM {quote_identifier(self._table_name)} WHERE {UID_COLUMN} = ?",  # noqa: S608
+            (str(key),),
+        ).fetchone()
+        return row is not None
+
+    @override
+    def values(self) -> SqliteSectionValues[T]:
+        return SqliteSectionValues(self)
+
+    @override
+    def clear(self) -> None:
+        self._connection.execute(f"DELETE FROM {quote_identifier(self._table_name)}")  # noqa: S608
+
+    # [mapping]-[END]
+
+    def iterate_values(
+        self,
+        *,
+        conditions: list[str] | None = None,
+        params: list[str] | None = None,
+    ) -> Iterator[T]:
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor = self._connection.execute(
+            f"SELECT {DATA_COLUMN} FROM {quote_identifier(self._table_name)}{where} ORDER BY rowid",  # noqa: S608
+            params or [],
+        )
+        for (data,) in cursor:
+            yield self._validate_item(data)
+
+    def _validate_item(self, data: str | bytes) -> T:
+        # Note: Rows are written by persyval from validated items. So, they are trusted.
+        return self._model.model_validate_json(data, context=get_trusted_context())
+
+    def get_filter_candidates(self, filter_query: dict[str, str]) -> Iterator[T]:
+        """Get items, that can match the filter. Filter values must be normalized."""
+        conditions, params = self.build_filter_conditions(filter_query)
+        return self.iterate_values(conditions=conditions, params=params)
+
+    def get_filter_candidates_i_any(self, filter_queries: list[dict[str, str]]) -> Iterator[T]:
+        """Get items, that can match any of the filters. Filter values must be normalized."""
+        if not filter_queries:
+            return iter(())
+
+        any_conditions: list[str] = []
+        params: list[str] = []
+
+        for filter_query in filter_queries:
+            conditions, query_params = self.build_filter_conditions(filter_query)
+            if not conditions:
+                return self.iterate_values()
+
+            any_conditions.append(f"({' AND '.join(conditions)})")
+            params.extend(query_params)
+
+        return self.iterate_values(conditions=[f"({' OR '.join(any_conditions)})"], params=params)
+
+    def build_filter_conditions(self, filter_query: dict[str, str]) -> tuple[list[str], list[str]]:
+        conditions: list[str] = []
+        params: list[str] = []
+
+        for field_name, filter_value in filter_query.items():
+            if field_name == UID_COLUMN:
+                conditions.append(f"{UID_COLUMN} = ?")
+                params.append(filter_value)
+                continue
+
+            field = self._fields_registry[field_name]
+            is_exact = field.filter_mode == FilterMode.EXACT
+
+            if field.is_list_based:
+                value_condition = "value = ?" if is_exact else "instr(value, ?) > 0"
+                list_table = quote_identifier(self.get_list_table_name(field))
+                conditions.append(
+                    f"{UID_COLUMN} IN (SELECT {UID_COLUMN} FROM {list_table} WHERE {value_condition})",  # noqa: S608
+                )
+            else:
+                column = quote_identifier(field.name)
+                conditions.append(f"{column} = ?" if is_exact else f"instr({column}, ?) > 0")
+
+            params.append(filter_value)
+
+        return conditions, params
+
+    def get_items_by_month_days(self, field_name: str, month_days: Iterable[MonthDay]) -> dict[MonthDay, list[T]]:
+        field = self._fields_registry[field_name]
+        if not field.is_calendar_indexed:
+            msg = f"Field '{field_name}' has no calendar index."
+            raise ValueError(msg)
+
+        keys = [f"{month:02}-{day:02}" for month, day in month_days]
+        if not keys:
+            return {}
+
+        result: dict[MonthDay, list[T]] = {}
+        for item in self.iterate_values(
+            conditions=[
+                f"substr({quote_identifier(field.name)}, {MONTH_DAY_START}) IN ({', '.join('?' * len(keys))})",
+            ],
+            params=keys,
+        ):
+            result.setdefault(get_month_day(getattr(item, field.name)), []).append(item)
+
+        return result
@@ -1,16 +1,48 @@
-from typing import TYPE_CHECKING, Final
+import contextlib
+import datetime
+import enum
+import random
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Annotated, Final
 
-from faker import Faker
+from pydantic import BaseModel, Field
 
-from persyval.models.contact import Contact
-from persyval.models.note import Note
-from persyval.services.data_actions.contact_add import contact_add
-from persyval.services.data_actions.note_add import note_add
+from persyval.models.contact import Contact, ContactUid
+from persyval.models.note import Note, NoteUid
+from persyval.services.data_actions.contacts_add_many import contacts_add_many
+from persyval.services.data_actions.notes_add_many import notes_add_many
 from persyval.services.data_storage.data_storage import DataStorage
 
 if TYPE_CHECKING:
     import pathlib
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator, Iterator
+    from concurrent.futures import Executor
+
+    from faker import Faker
+
+FILL_SHARD_SIZE: Final[int] = 10_000
+"""Amount of items in the shard. Big enough to amortize the transfer between processes."""
+
+FILL_SEED_LIMIT: Final[int] = 2**32
+FILL_SHARD_SEED_MULTIPLIER: Final[int] = 1_000_003
+
+BIRTHDAY_RANGE_START: Final[datetime.date] = datetime.date(1925, 1, 1)
+BIRTHDAY_RANGE_END: Final[datetime.date] = datetime.date(2024, 12, 31)
+"""Fixed range instead of the age. So, generated data doesn't depend on the current date."""
+
+LONG_NOTE_PARAGRAPHS: Final[int] = 30
+
+COMMON_TAGS: Final[list[str]] = [
+    "work",
+    "home",
+    "todo",
+    "idea",
+    "family",
+    "travel",
+    "shopping",
+    "health",
+]
 
 OPERATOR_CODES: Final[list[str]] = [
     "73",
@@ -32,14 +64,69 @@ def generate_phone_number(
     )
 
 
+@enum.unique
+class FillSizePreset(enum.StrEnum):
+    SMALL = "1k"
+    MEDIUM = "100k"
+    LARGE = "1m"
+
+
+FILL_SIZE_PRESET_AMOUNTS: Final[dict[FillSizePreset, int]] = {
+    FillSizePreset.SMALL: 1_000,
+    FillSizePreset.MEDIUM: 100_000,
+    FillSizePreset.LARGE: 1_000_000,
+}
+
+
+class FillProfile(BaseModel):
+    """Distribution of the generated data."""
+
+    birthday_share: Annotated[
+        float,
+        Field(ge=0, le=1, description="Share of contacts with the birthday."),
+    ] = 0.5
+    long_note_share: Annotated[
+        float,
+        Field(ge=0, le=1, description="Share of notes with the long content."),
+    ] = 0.0
+    common_tag_share: Annotated[
+        float,
+        Field(ge=0, le=1, description="Share of tags, that are taken from the small set of common tags."),
+    ] = 0.0
+
+
+def is_chance(faker: Faker, share: float) -> bool:
+    value: float = faker.random.random()
+    return value < share
+
+
+def generate_uid(faker: Faker) -> uuid.UUID:
+    # Note: Default uids depend on the time. So, take them from the seeded generator.
+    return uuid.UUID(int=faker.random.getrandbits(128), version=4)
+
+
+def generate_tag(faker: Faker, profile: FillProfile) -> str:
+    if is_chance(faker, profile.common_tag_share):
+        return faker.random_element(elements=COMMON_TAGS)
+
+    return faker.word()
+
+
 def generate_note(
     faker: Faker,
+    profile: FillProfile | None = None,
 ) -> Note:
+    profile = profile or FillProfile()
+
     title = faker.sentence(nb_words=6) if faker.boolean(chance_of_getting_true=70) else None
-    content = faker.paragraph(nb_sentences=3)
-    tags = [faker.word() for _ in range(faker.random_int(min=0, max=5))]
+    if is_chance(faker, profile.long_note_share):
+        content = "\n\n".join(faker.paragraphs(nb=LONG_NOTE_PARAGRAPHS))
+    else:
+        content = faker.paragraph(nb_sentences=3)
+    tags = [generate_tag(faker, profile) for _ in range(faker.random_int(min=0, max=5))]
 
     return Note(
+        uid=NoteUid(generate_uid(faker)),
         title=title,
         content=content,
         tags=tags,
@@ -48,11 +135,19 @@ def generate_note(
 
 def generate_contact(
     faker: Faker,
+    profile: FillProfile | None = None,
 ) -> Contact:
+    profile = profile or FillProfile()
+
     return Contact(
+        uid=ContactUid(generate_uid(faker)),
         name=faker.name(),
         address=faker.address() if faker.boolean() else None,
-        birthday=faker.date_of_birth(minimum_age=1, maximum_age=100) if faker.boolean() else None,
+        birthday=(
+            faker.date_between_dates(date_start=BIRTHDAY_RANGE_START, date_end=BIRTHDAY_RANGE_END)
+            if is_chance(faker, profile.birthday_share)
+            else None
+        ),
         phones=[generate_phone_number(faker) for _ in range(faker.random_int(min=0, max=10))],
         emails=[faker.email() for _ in range(faker.random_int(min=0, max=10))],
     )
@@ -61,24 +156,83 @@ def generate_contact(
 def generate_contacts(
     amount: int,
     faker: Faker,
+    profile: FillProfile | None = None,
 ) -> Generator[Contact]:
     for _ in range(amount):
-        yield generate_contact(faker)
+        yield generate_contact(faker, profile)
 
 
 def generate_notes(
     amount: int,
     faker: Faker,
+    profile: FillProfile | None = None,
 ) -> Generator[Note]:
     for _ in range(amount):
-        yield generate_note(faker)
+        yield generate_note(faker, profile)
+
+
+class FillShard(BaseModel):
+    """Part of the generation. Independent of other shards. So, it can be generated in another process."""
+
+    amount: int
+    seed: int
+    profile: FillProfile
+
 
+def get_fill_shards(amount: int, seed: int, profile: FillProfile) -> list[FillShard]:
+    """Split the generation into shards. Seeds depend only on the base seed and the position of the shard.
 
-def fill_data_storage_by_path(
+    So, the result doesn't depend on the amount of workers.
+    """
+    return [
+        FillShard(
+            amount=min(FILL_SHARD_SIZE, amount - start),
+            seed=seed * FILL_SHARD_SEED_MULTIPLIER + position,
+            profile=profile,
+        )
+        for position, start in enumerate(range(0, amount, FILL_SHARD_SIZE))
+    ]
+
+
+def create_faker(seed: int) -> Faker:
+    # Note: Heavy library. Import on the first use. Not on the start of CLI.
+    from faker import Faker  # noqa: PLC0415
+
+    faker = Faker(
+        # "uk_UA",
+    )
+    faker.seed_instance(seed)
+    return faker
+
+
+def generate_contacts_shard(shard: FillShard) -> list[Contact]:
+    return list(generate_contacts(shard.amount, create_faker(shard.seed), shard.profile))
+
+
+def generate_notes_shard(shard: FillShard) -> list[Note]:
+    return list(generate_notes(shard.amount, create_faker(shard.seed), shard.profile))
+
+
+def iterate_generated_shards[T](
+    generate_shard: Callable[[FillShard], list[T]],
+    shards: list[FillShard],
+    executor: Executor | None,
+) -> Iterator[list[T]]:
+    """Generate shards in the executor, if any. Results are in the order of shards."""
+    if executor is None:
+        return map(generate_shard, shards)
+
+    return executor.map(generate_shard, shards)
+
+
+def fill_data_storage_by_path(  # noqa: PLR0913
     *,
     storage_dir: pathlib.Path | None = None,
     amount: int = 10,
     init_only: bool = False,
+    workers: int = 1,
+    seed: int | None = None,
+    profile: FillProfile | None = None,
 ) -> None:
     with DataStorage.load(
         dir_path=storage_dir,
@@ -87,36 +241,59 @@ def fill_data_storage_by_path(
             data_storage=data_storage,
             amount=amount,
             init_only=init_only,
+            workers=workers,
+            seed=seed,
+            profile=profile,
         )
 
 
-def fill_data_storage(
+def fill_data_storage(  # noqa: PLR0913
     *,
     data_storage: DataStorage,
     amount: int = 10,
     init_only: bool = False,
+    workers: int = 1,
+    seed: int | None = None,
+    profile: FillProfile | None = None,
 ) -> None:
-    faker = Faker(
-        # "uk_UA",
-    )
+    """Fill the storage with generated data.
 
-    if init_only and data_storage.data.contacts:
-        print("Contacts already exists. Skipping.")
-    else:
-        for contact in generate_contacts(amount, faker):
-            contact_add(
-                data_storage=data_storage,
-                contact=contact,
-            )
-
-    if init_only and data_storage.data.notes:
-        print("Notes already exists. Skipping.")
-    else:
-        for note in generate_notes(amount, faker):
-            note_add(
-                data_storage=data_storage,
-                note=note,
-            )
+    The same seed and profile give the same data. Without the seed, it is random.
+
+    If there are several workers, shards are generated in the process pool.
+    Generated shards are added to the storage one by one, while other shards are generated.
+    """
+    if seed is None:
+        seed = random.randrange(FILL_SEED_LIMIT)  # noqa: S311
+
+    profile = profile or FillProfile()
+
+    contacts_shards = get_fill_shards(amount, seed, profile)
+    # Note: Notes use other seeds. So, they are not correlated with contacts.
+    notes_shards = get_fill_shards(amount, ~seed, profile)
+
+    with contextlib.ExitStack() as stack:
+        executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers)) if workers > 1 else None
+
+        # Note: Persist all sections at once. Not on each added item.
+        with data_storage.transaction():
+            if init_only and data_storage.data.contacts:
+                print("Contacts already exists. Skipping.")
+            else:
+                for contacts in iterate_generated_shards(generate_contacts_shard, contacts_shards, executor):
+                    contacts_add_many(
+                        data_storage=data_storage,
+                        contacts=contacts,
+                    )
+
+            if init_only and data_storage.data.notes:
+                print("Notes already exists. Skipping.")
+            else:
+                for notes in iterate_generated_shards(generate_notes_shard, notes_shards, executor):
+                    notes_add_many(
+                        data_storage=data_storage,
+                        notes=notes,
+                    )
 
     for info in data_storage.get_stats():
         print(info)
@@ -1,6 +1,3 @@
-from email_validator import EmailNotValidError
-from email_validator import validate_email as validate_email_external
-
 from persyval.exceptions.main import EmptyDataError, InvalidDataError
 
 
@@ -14,6 +11,10 @@ def validate_email(email: str) -> str:
         msg = f"Email address is empty: {email}"
         raise EmptyDataError(msg)
 
+    # Note: Heavy library. Import on the first use. Not on the start of CLI.
+    from email_validator import EmailNotValidError  # noqa: PLC0415
+    from email_validator import validate_email as validate_email_external  # noqa: PLC0415
+
     try:
         valid = validate_email_external(user_email, check_deliverability=False)
 
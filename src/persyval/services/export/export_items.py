@@ -1,16 +1,19 @@
 import csv
+import itertools
 import json
+import textwrap
 from enum import Enum
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 from prompt_toolkit.shortcuts import choice
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
 
 from persyval.exceptions.main import NotFoundError
 from persyval.services.get_paths.get_app_dirs import get_downloads_dir_in_user_space
 from persyval.utils.format import render_canceled_message, render_error, render_good_message
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
     from pathlib import Path
 
     from pydantic import BaseModel
@@ -20,13 +23,26 @@ if TYPE_CHECKING:
 class ExportFormat(str, Enum):
     CSV = "csv"
     JSON = "json"
+    JSONL = "jsonl"
 
 
 format_choices = [
     (ExportFormat.CSV, "CSV"),
     (ExportFormat.JSON, "JSON"),
+    (ExportFormat.JSONL, "JSON Lines"),
 ]
 
+type ExportProgressCallback = Callable[[int], None]
+"""Called with the amount of already written items."""
+
+EXPORT_BUFFER_SIZE: Final[int] = 1024 * 1024
+"""Bytes. Items are written one by one. The buffer makes writes to the file less frequent."""
+
+EXPORT_PROGRESS_STEP: Final[int] = 1000
+"""Items between calls of the progress callback."""
+
+JSON_INDENT: Final[int] = 4
+
 
 def choose_export_format(
     non_interactive: bool = False,  # noqa: FBT001, FBT002
@@ -97,10 +113,27 @@ def adapt_fields_to_csv(
     return new_item
 
 
+def report_progress(
+    amount: int,
+    on_progress: ExportProgressCallback | None,
+    *,
+    is_done: bool = False,
+) -> None:
+    if on_progress is not None and (is_done or amount % EXPORT_PROGRESS_STEP == 0):
+        on_progress(amount)
+
+
 def write_to_csv(
     items: Iterable[BaseModel],
     path: Path,
-) -> None:
+    *,
+    on_progress: ExportProgressCallback | None = None,
+) -> int:
+    """Write items one by one.
+
+    Returns:
+        Amount of written items.
+    """
     iter_items = iter(items)
 
     try:
@@ -111,37 +144,93 @@ def write_to_csv(
 
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with path.open("w", newline="", encoding="utf-8") as f:
+    amount = 0
+    with path.open("w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
         fields = type(first).model_fields.keys()
 
         writer = csv.DictWriter(f, fieldnames=fields)
         writer.writeheader()
-        writer.writerow(adapt_fields_to_csv(first.model_dump(mode="json")))
 
-        for item in iter_items:
+        for item in itertools.chain((first,), iter_items):
             writer.writerow(adapt_fields_to_csv(item.model_dump(mode="json")))
+            amount += 1
+            report_progress(amount, on_progress)
+
+    report_progress(amount, on_progress, is_done=True)
+    return amount
 
 
 def write_to_json(
     *,
     items: Iterable[BaseModel],
     path: Path,
-) -> None:
-    # TODO: Rework to better pydantic usage.
-    data = [item.model_dump(mode="json") for item in items]
+    on_progress: ExportProgressCallback | None = None,
+) -> int:
+    """Write items one by one. The result is the same, as for the list, dumped at once.
+
+    Returns:
+        Amount of written items.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    amount = 0
+    with path.open("w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
+        f.write("[")
 
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+        for item in items:
+            # TODO: Rework to better pydantic usage.
+            item_json = json.dumps(item.model_dump(mode="json"), indent=JSON_INDENT, ensure_ascii=False)
 
+            f.write(",\n" if amount else "\n")
+            f.write(textwrap.indent(item_json, " " * JSON_INDENT))
+            amount += 1
+            report_progress(amount, on_progress)
 
-def export_items(
+        f.write("\n]" if amount else "]")
+
+    report_progress(amount, on_progress, is_done=True)
+    return amount
+
+
+def write_to_jsonl(
+    *,
+    items: Iterable[BaseModel],
+    path: Path,
+    on_progress: ExportProgressCallback | None = None,
+) -> int:
+    """Write items as JSON Lines. One item per line.
+
+    Returns:
+        Amount of written items.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    amount = 0
+    with path.open("w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
+        for item in items:
+            f.write(item.model_dump_json())
+            f.write("\n")
+            amount += 1
+            report_progress(amount, on_progress)
+
+    report_progress(amount, on_progress, is_done=True)
+    return amount
+
+
+def export_items(  # noqa: PLR0913
     *,
     console: Console,
     items: Iterable[BaseModel],
     file_base_name: str,
     chosen_format: ExportFormat,
     non_interactive: bool = False,
+    total: int | None = None,
 ) -> None:
+    """Export items to the file in the downloads directory.
+
+    Items are written one by one. So, pass the iterable, not the list, to keep the memory usage low.
+    `total` is used for the progress bar.
+    """
     extension = chosen_format.value
     export_path = get_downloads_dir_in_user_space() / f"{file_base_name}.{extension}"
 
@@ -153,13 +242,32 @@ def export_items(
         render_canceled_message(console, "Export canceled by user.")
         return
 
+    progress = Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console,
+        transient=True,
+        # Note: Only for the terminal. Not for scripts.
+        disable=non_interactive or not console.is_terminal,
+    )
+
     # export itself
     try:
-        match chosen_format:
-            case ExportFormat.CSV:
-                write_to_csv(items=items, path=export_path)
-            case ExportFormat.JSON:
-                write_to_json(items=items, path=export_path)
+        with progress:
+            task_id = progress.add_task("Exporting", total=total)
+
+            def on_progress(amount: int) -> None:
+                progress.update(task_id, completed=amount)
+
+            match chosen_format:
+                case ExportFormat.CSV:
+                    write_to_csv(items=items, path=export_path, on_progress=on_progress)
+                case ExportFormat.JSON:
+                    write_to_json(items=items, path=export_path, on_progress=on_progress)
+                case ExportFormat.JSONL:
+                    write_to_jsonl(items=items, path=export_path, on_progress=on_progress)
 
     except Exception as exc:  # noqa: BLE001
         render_error(
@@ -1,13 +1,11 @@
 from typing import TYPE_CHECKING
 
 from persyval.models.contact import Contact
-from persyval.services.data_actions.contacts_list import contacts_list
 from persyval.services.export.export_items import choose_export_format, export_items
 from persyval.services.handlers.shared.args_i_empty import (
     ARGS_CONFIG_I_EMPTY,
     ArgsIEmpty,
 )
-from persyval.services.handlers.shared.sort_and_filter import ListConfig, ListFilterModeEnum, ListOrderModeEnum
 from persyval.services.handlers_base.handler_base import HandlerBase
 from persyval.utils.format import render_canceled_message
 
@@ -28,13 +26,8 @@ class ContactsExportIHandler(HandlerBase[ArgsIEmpty]):
             render_canceled_message(self.console, "Export canceled.")
             return
 
-        contacts = contacts_list(
-            data_storage=self.data_storage,
-            list_config=ListConfig(
-                filter_mode=ListFilterModeEnum.ALL,
-                order_mode=ListOrderModeEnum.DEFAULT,
-            ),
-        )
+        # Note: Not the list. Items are exported one by one, as they are read from the storage.
+        contacts = self.data_storage.data.contacts.values()
 
         if not contacts:
             render_canceled_message(
@@ -46,6 +39,7 @@ class ContactsExportIHandler(HandlerBase[ArgsIEmpty]):
         export_items(
             console=self.console,
             items=contacts,
+            total=len(contacts),
             file_base_name=Contact.get_meta_info().plural_name.lower(),
             chosen_format=chosen_format,
             non_interactive=self.non_interactive,
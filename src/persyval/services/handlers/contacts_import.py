@@ -0,0 +1,31 @@
+from typing import TYPE_CHECKING
+
+from persyval.models.contact import Contact
+from persyval.services.data_actions.contacts_import import contacts_import
+from persyval.services.handlers.shared.import_items import IMPORT_I_ARGS_CONFIG, ImportIArgs, render_import_result
+from persyval.services.handlers_base.handler_base import HandlerBase
+
+if TYPE_CHECKING:
+    from persyval.services.commands.args_config import ArgsConfig
+
+
+class ContactsImportIHandler(HandlerBase[ImportIArgs]):
+    def _get_args_config(self) -> ArgsConfig[ImportIArgs]:
+        return IMPORT_I_ARGS_CONFIG
+
+    def _make_action(self, parsed_args: ImportIArgs) -> None:
+        if parsed_args.path is None:
+            msg = "Path is required."
+            raise ValueError(msg)
+
+        result = contacts_import(
+            data_storage=self.data_storage,
+            path=parsed_args.path,
+            workers=parsed_args.workers,
+        )
+
+        render_import_result(
+            console=self.console,
+            result=result,
+            plural_name=Contact.get_meta_info().plural_name,
+        )
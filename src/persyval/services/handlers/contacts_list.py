@@ -3,9 +3,7 @@ from typing import TYPE_CHECKING
 from persyval.models.contact import (
     Contact,
 )
-from persyval.services.data_actions.contacts_list import (
-    contacts_list,
-)
+from persyval.services.data_actions.contacts_iterate import contacts_iterate
 from persyval.services.handlers.contacts.contact_item_ask_next_action import (
     contact_item_ask_next_action,
 )
@@ -33,16 +31,17 @@ class ContactsListIHandler(
     def _make_action(self, parsed_args: ListIArgs) -> None:
         return list_show(
             list_config=ListConfig(
-                **parsed_args.model_dump(),
+                **parsed_args.model_dump(exclude={"page_size"}),
             ),
             data_storage=self.data_storage,
-            list_callable=contacts_list,
+            list_callable=contacts_iterate,
             next_action=contact_item_ask_next_action,
             #
             model=Contact,
             console=self.console,
             execution_queue=self.execution_queue,
             #
+            page_size=parsed_args.page_size,
             plain_render=self.plain_render,
             non_interactive=self.non_interactive,
         )
@@ -25,6 +25,7 @@ class ContactsRootIAction(enum.StrEnum):
     ADD = "add"
     GET_UPCOMING_BIRTHDAYS = "get_upcoming_birthdays"
     EXPORT = "export"
+    IMPORT = "import"
 
 
 class ContactsRootIArgs(HandlerArgsBase):
@@ -109,3 +110,13 @@ class ContactsRootIHandler(
                         args=ArgsIEmpty(),
                     ),
                 )
+
+            case ContactsRootIAction.IMPORT:
+                from persyval.services.handlers.shared.import_items import ImportIArgs  # noqa: PLC0415
+
+                self.execution_queue.put(
+                    HandlerFullArgs(
+                        command=Command.CONTACTS_IMPORT,
+                        args=ImportIArgs(),
+                    ),
+                )
@@ -56,9 +56,10 @@ def render_help(
 
     for command_meta in iterate_over_commands_meta(show_hidden=show_hidden):
         command_full = str(command_meta.command)
-        if command_meta.args_config:
+        args_config = command_meta.get_args_config()
+        if args_config:
             args: list[str] = []
-            for arg in command_meta.args_config.args:
+            for arg in args_config.args:
                 arg_obj = ArgMetaConfig(name=arg, required=False) if isinstance(arg, str) else arg
 
                 is_required_char = "*" if arg_obj.required else "?"
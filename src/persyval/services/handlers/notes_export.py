@@ -1,13 +1,11 @@
 from typing import TYPE_CHECKING
 
 from persyval.models.note import Note
-from persyval.services.data_actions.notes_list import notes_list
 from persyval.services.export.export_items import choose_export_format, export_items
 from persyval.services.handlers.shared.args_i_empty import (
     ARGS_CONFIG_I_EMPTY,
     ArgsIEmpty,
 )
-from persyval.services.handlers.shared.sort_and_filter import ListConfig, ListFilterModeEnum, ListOrderModeEnum
 from persyval.services.handlers_base.handler_base import HandlerBase
 from persyval.utils.format import render_canceled_message
 
@@ -28,13 +26,8 @@ class NotesExportIHandler(HandlerBase[ArgsIEmpty]):
             render_canceled_message(self.console, "Export canceled.")
             return
 
-        notes = notes_list(
-            data_storage=self.data_storage,
-            list_config=ListConfig(
-                filter_mode=ListFilterModeEnum.ALL,
-                order_mode=ListOrderModeEnum.DEFAULT,
-            ),
-        )
+        # Note: Not the list. Items are exported one by one, as they are read from the storage.
+        notes = self.data_storage.data.notes.values()
 
         if not notes:
             render_canceled_message(
@@ -46,6 +39,7 @@ class NotesExportIHandler(HandlerBase[ArgsIEmpty]):
         export_items(
             console=self.console,
             items=notes,
+            total=len(notes),
             file_base_name=Note.get_meta_info().plural_name.lower(),
             chosen_format=chosen_format,
             non_interactive=self.non_interactive,
@@ -0,0 +1,31 @@
+from typing import TYPE_CHECKING
+
+from persyval.models.note import Note
+from persyval.services.data_actions.notes_import import notes_import
+from persyval.services.handlers.shared.import_items import IMPORT_I_ARGS_CONFIG, ImportIArgs, render_import_result
+from persyval.services.handlers_base.handler_base import HandlerBase
+
+if TYPE_CHECKING:
+    from persyval.services.commands.args_config import ArgsConfig
+
+
+class NotesImportIHandler(HandlerBase[ImportIArgs]):
+    def _get_args_config(self) -> ArgsConfig[ImportIArgs]:
+        return IMPORT_I_ARGS_CONFIG
+
+    def _make_action(self, parsed_args: ImportIArgs) -> None:
+        if parsed_args.path is None:
+            msg = "Path is required."
+            raise ValueError(msg)
+
+        result = notes_import(
+            data_storage=self.data_storage,
+            path=parsed_args.path,
+            workers=parsed_args.workers,
+        )
+
+        render_import_result(
+            console=self.console,
+            result=result,
+            plural_name=Note.get_meta_info().plural_name,
+        )
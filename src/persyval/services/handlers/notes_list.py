@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 from persyval.models.note import (
     Note,
 )
-from persyval.services.data_actions.notes_list import notes_list
+from persyval.services.data_actions.notes_iterate import notes_iterate
 from persyval.services.handlers.notes.note_item_ask_next_action import note_item_ask_next_action
 from persyval.services.handlers.shared.list_show import list_show
 from persyval.services.handlers.shared.sort_and_filter import (
@@ -26,16 +26,17 @@ class NotesListIHandler(
     def _make_action(self, parsed_args: ListIArgs) -> None:
         return list_show(
             list_config=ListConfig(
-                **parsed_args.model_dump(),
+                **parsed_args.model_dump(exclude={"page_size"}),
             ),
             data_storage=self.data_storage,
-            list_callable=notes_list,
+            list_callable=notes_iterate,
             next_action=note_item_ask_next_action,
             #
             model=Note,
             console=self.console,
             execution_queue=self.execution_queue,
             #
+            page_size=parsed_args.page_size,
             plain_render=self.plain_render,
             non_interactive=self.non_interactive,
         )
@@ -25,8 +25,10 @@ if TYPE_CHECKING:
 @enum.unique
 class NotesRootIAction(enum.StrEnum):
     LIST = "list"
+    SEARCH = "search"
     ADD = "add"
     EXPORT = "export"
+    IMPORT = "import"
 
 
 class NotesRootIArgs(HandlerArgsBase):
@@ -79,6 +81,16 @@ class NotesRootIHandler(
                     ),
                 )
 
+            case NotesRootIAction.SEARCH:
+                from persyval.services.handlers.notes_search import NotesSearchIArgs  # noqa: PLC0415
+
+                self.execution_queue.put(
+                    HandlerFullArgs(
+                        command=Command.NOTES_SEARCH,
+                        args=NotesSearchIArgs(),
+                    ),
+                )
+
             case NotesRootIAction.ADD:
                 self.execution_queue.put(
                     HandlerFullArgs(
@@ -96,3 +108,13 @@ class NotesRootIHandler(
                         args=ListIArgs(),
                     ),
                 )
+
+            case NotesRootIAction.IMPORT:
+                from persyval.services.handlers.shared.import_items import ImportIArgs  # noqa: PLC0415
+
+                self.execution_queue.put(
+                    HandlerFullArgs(
+                        command=Command.NOTES_IMPORT,
+                        args=ImportIArgs(),
+                    ),
+                )
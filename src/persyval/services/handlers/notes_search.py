@@ -0,0 +1,60 @@
+from persyval.models.note import Note
+from persyval.services.commands.args_config import ArgMetaConfig, ArgsConfig, ArgType
+from persyval.services.data_actions.notes_search import NOTES_SEARCH_DEFAULT_LIMIT, notes_search
+from persyval.services.execution_queue.execution_queue import HandlerArgsBase
+from persyval.services.handlers.notes.note_item_ask_next_action import note_item_ask_next_action
+from persyval.services.handlers.shared.list_show import items_show
+from persyval.services.handlers_base.handler_base import HandlerBase
+
+
+class NotesSearchIArgs(HandlerArgsBase):
+    query: str | None = None
+    limit: int | None = None
+
+
+NOTES_SEARCH_I_ARGS_CONFIG = ArgsConfig[NotesSearchIArgs](
+    result_cls=NotesSearchIArgs,
+    args=[
+        ArgMetaConfig(
+            name="query",
+            description="words to search. Add '*' to the end of a word to search by prefix",
+            required=True,
+            allow_input_on_empty=True,
+        ),
+        ArgMetaConfig(
+            name="limit",
+            type_=ArgType.INT,
+            default=NOTES_SEARCH_DEFAULT_LIMIT,
+        ),
+    ],
+)
+
+
+class NotesSearchIHandler(
+    HandlerBase[NotesSearchIArgs],
+):
+    def _get_args_config(self) -> ArgsConfig[NotesSearchIArgs]:
+        return NOTES_SEARCH_I_ARGS_CONFIG
+
+    def _make_action(self, parsed_args: NotesSearchIArgs) -> None:
+        if parsed_args.query is None:
+            msg = "You shouldn't be here"
+            raise NotImplementedError(msg)
+
+        items = notes_search(
+            data_storage=self.data_storage,
+            query=parsed_args.query,
+            limit=parsed_args.limit or NOTES_SEARCH_DEFAULT_LIMIT,
+        )
+
+        return items_show(
+            items_factory=lambda: items,
+            next_action=note_item_ask_next_action,
+            #
+            model=Note,
+            console=self.console,
+            execution_queue=self.execution_queue,
+            #
+            plain_render=self.plain_render,
+            non_interactive=self.non_interactive,
+        )
@@ -0,0 +1,60 @@
+import pathlib
+from typing import TYPE_CHECKING
+
+from rich.table import Table
+
+from persyval.services.commands.args_config import ArgMetaConfig, ArgsConfig, ArgType
+from persyval.services.execution_queue.execution_queue import HandlerArgsBase
+from persyval.utils.format import render_error, render_good_message
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from persyval.services.import_items.import_items import ImportResult
+
+
+class ImportIArgs(HandlerArgsBase):
+    path: pathlib.Path | None = None
+    workers: int | None = None
+
+
+IMPORT_I_ARGS_CONFIG = ArgsConfig[ImportIArgs](
+    result_cls=ImportIArgs,
+    args=[
+        ArgMetaConfig(
+            name="path",
+            description="Path to the file. Format by the extension: csv, json, jsonl",
+            required=True,
+            allow_input_on_empty=True,
+            parser_func=lambda x: pathlib.Path(x).expanduser(),
+        ),
+        ArgMetaConfig(
+            name="workers",
+            description="Amount of processes for the validation. By default, the amount of CPUs",
+            type_=ArgType.INT,
+        ),
+    ],
+)
+
+
+def render_import_result(
+    *,
+    console: Console,
+    result: ImportResult,
+    plural_name: str,
+) -> None:
+    if result.errors:
+        table = Table(title="Bad Rows", title_justify="left")
+        table.add_column("Row", justify="right")
+        table.add_column("Error")
+
+        for error in result.errors:
+            table.add_row(str(error.row), error.message)
+
+        console.print(table)
+
+    if result.errors_amount:
+        shown = "" if result.errors_amount == len(result.errors) else f" First {len(result.errors)} are shown."
+        render_error(console, f"Skipped rows: {result.errors_amount}.{shown}", title="Bad Rows")
+
+    render_good_message(console, f"Imported {plural_name.lower()}: {result.imported}.")
@@ -0,0 +1,91 @@
+import itertools
+import math
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+
+class ItemsPager[T]:
+    """Pages of items. For lazy items, only the current page is kept in memory.
+
+    Sequences are sliced. Other iterables are consumed forward.
+    Moves back start the iteration again, by the new iterable from the factory.
+    """
+
+    def __init__(
+        self,
+        items_factory: Callable[[], Iterable[T]],
+        page_size: int,
+    ) -> None:
+        if page_size < 1:
+            msg = f"Page size must be positive, got: {page_size}."
+            raise ValueError(msg)
+
+        self._items_factory = items_factory
+        self.page_size = page_size
+
+        items = items_factory()
+        self._sequence: Sequence[T] | None = items if isinstance(items, Sequence) else None
+        self._iterator: Iterator[T] | None = None if self._sequence is not None else iter(items)
+        # Note: Items, that were taken from the iterator, but not shown yet.
+        self._buffer: list[T] = []
+        self._position = 0
+
+        self.total: int | None = len(self._sequence) if self._sequence is not None else None
+        """Amount of items. Unknown for lazy items, until the end is reached."""
+
+    @property
+    def pages_amount(self) -> int | None:
+        if self.total is None:
+            return None
+
+        return max(1, math.ceil(self.total / self.page_size))
+
+    def get_page(self, page_number: int) -> tuple[list[T], bool]:
+        """Get items of the page and whether the next page exists.
+
+        Args:
+            page_number: Number of the page. From 0.
+
+        Returns:
+            Items of the page. Empty, if the page is after the end.
+            And whether the next page exists.
+        """
+        start = page_number * self.page_size
+
+        if self._sequence is not None:
+            page = list(self._sequence[start : start + self.page_size])
+            return page, start + self.page_size < len(self._sequence)
+
+        if self._iterator is None or start < self._position:
+            self._iterator = iter(self._items_factory())
+            self._buffer = []
+            self._position = 0
+
+        # Note: Skip by pages. So, the memory is bounded by the page size, even for far jumps.
+        while self._position < start:
+            if not self._take(min(start - self._position, self.page_size)):
+                break
+
+        page = self._take(self.page_size) if self._position == start else []
+
+        # Note: Read ahead by one item. To know, whether the next page exists.
+        if not self._buffer:
+            self._buffer = list(itertools.islice(self._iterator, 1))
+
+        if not self._buffer:
+            self.total = self._position
+
+        return page, bool(self._buffer)
+
+    def _take(self, amount: int) -> list[T]:
+        taken = self._buffer[:amount]
+        del self._buffer[:amount]
+
+        if self._iterator is not None:
+            taken.extend(itertools.islice(self._iterator, amount - len(taken)))
+
+        self._position += len(taken)
+        return taken
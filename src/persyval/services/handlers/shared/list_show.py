@@ -1,13 +1,16 @@
+import enum
+import sys
 from typing import TYPE_CHECKING, Any
 
-from prompt_toolkit import choice, print_formatted_text
+from prompt_toolkit import HTML, choice, print_formatted_text, prompt
 
 from persyval.services.console.add_option_i_to_main_menu import add_option_i_to_main_menu
+from persyval.services.handlers.shared.items_pager import ItemsPager
 from persyval.services.model_meta.model_meta_info import ModelProtocol
-from persyval.utils.format import render_canceled_message
+from persyval.utils.format import render_canceled_message, render_error
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
     from rich.console import Console
 
@@ -17,61 +20,188 @@ if TYPE_CHECKING:
     from persyval.services.handlers.shared.sort_and_filter import ListConfig
 
 
+@enum.unique
+class PageAction(enum.StrEnum):
+    PREVIOUS = enum.auto()
+    NEXT = enum.auto()
+    JUMP = enum.auto()
+
+
+PAGE_ACTION_TITLES: dict[PageAction, str] = {
+    PageAction.PREVIOUS: "<- Previous page",
+    PageAction.NEXT: "Next page ->",
+    PageAction.JUMP: "Jump to page",
+}
+
+
 def list_show[Uid, T: ModelProtocol[Any]](  # noqa: PLR0913
     *,
     list_config: ListConfig,
     data_storage: DataStorage,
-    list_callable: Callable[[DataStorage, ListConfig], list[T]],
+    list_callable: Callable[[DataStorage, ListConfig], Iterable[T]],
     next_action: Callable[[ExecutionQueue, Uid], None],
     #
     model: type[T],
     console: Console,
     execution_queue: ExecutionQueue,
     #
+    page_size: int | None = None,
     plain_render: bool = False,
     non_interactive: bool = False,
 ) -> None:
-    items = list_callable(
-        data_storage,
-        list_config,
+    items_show(
+        # Note: Called again on moves back by pages. Items can be lazy.
+        items_factory=lambda: list_callable(
+            data_storage,
+            list_config,
+        ),
+        next_action=next_action,
+        model=model,
+        console=console,
+        execution_queue=execution_queue,
+        page_size=page_size,
+        plain_render=plain_render,
+        non_interactive=non_interactive,
     )
 
-    if plain_render:
-        for item in items:
-            print(item.uid)
-        return
 
-    if non_interactive:
-        for item in items:
-            print_formatted_text(item.get_prompt_toolkit_output())
+def items_show[Uid, T: ModelProtocol[Any]](  # noqa: PLR0913
+    *,
+    items_factory: Callable[[], Iterable[T]],
+    next_action: Callable[[ExecutionQueue, Uid], None],
+    #
+    model: type[T],
+    console: Console,
+    execution_queue: ExecutionQueue,
+    #
+    page_size: int | None = None,
+    plain_render: bool = False,
+    non_interactive: bool = False,
+) -> None:
+    """Show items and pass the chosen one to the next action.
 
+    Interactive mode shows items by pages, if the page size is set. Other modes stream all items.
+    """
+    if plain_render or non_interactive:
+        stream_items(items_factory(), plain_render=plain_render)
         return
 
-    if not items:
-        render_canceled_message(
-            console,
-            f"No {model.get_meta_info().plural_name.lower()} found.",
-            title="Not found",
+    # Note: Without the page size, all items are on the single page.
+    pager = ItemsPager(items_factory, page_size or sys.maxsize)
+    page_number = 0
+
+    while True:
+        page, has_next = pager.get_page(page_number)
+
+        if not page:
+            if page_number == 0:
+                render_canceled_message(
+                    console,
+                    f"No {model.get_meta_info().plural_name.lower()} found.",
+                    title="Not found",
+                )
+                return
+
+            # Note: The jump after the end. The end is known now.
+            render_canceled_message(console, f"Page {page_number + 1} is empty.", title="Not found")
+            page_number = (pager.pages_amount or 1) - 1
+            continue
+
+        choice_by_list = choose_from_page(
+            pager=pager,
+            page=page,
+            page_number=page_number,
+            has_next=has_next,
+            model=model,
         )
-        return
 
-    options_list: list[tuple[Uid | None, PromptToolkitFormattedText]] = []
+        match choice_by_list:
+            case None:
+                return
+            case PageAction.PREVIOUS:
+                page_number -= 1
+            case PageAction.NEXT:
+                page_number += 1
+            case PageAction.JUMP:
+                page_number = ask_page_number(console, pager, page_number)
+            case _:
+                next_action(
+                    execution_queue,
+                    choice_by_list,
+                )
+                return
+
+
+def stream_items(
+    items: Iterable[ModelProtocol[Any]],
+    *,
+    plain_render: bool,
+) -> None:
+    for item in items:
+        if plain_render:
+            print(item.uid)
+        else:
+            print_formatted_text(item.get_prompt_toolkit_output())
+
+
+def choose_from_page[T: ModelProtocol[Any]](
+    *,
+    pager: ItemsPager[T],
+    page: list[T],
+    page_number: int,
+    has_next: bool,
+    model: type[T],
+) -> Any | None:  # noqa: ANN401
+    options_list: list[tuple[Any | None, PromptToolkitFormattedText]] = []
     add_option_i_to_main_menu(options_list)
 
-    options_list.extend([(item.uid, item.get_prompt_toolkit_output()) for item in items])  # pyright: ignore[reportArgumentType]
+    is_paginated = page_number > 0 or has_next
+    if page_number > 0:
+        options_list.append((PageAction.PREVIOUS, PAGE_ACTION_TITLES[PageAction.PREVIOUS]))
+    if has_next:
+        options_list.append((PageAction.NEXT, PAGE_ACTION_TITLES[PageAction.NEXT]))
+    if is_paginated:
+        options_list.append((PageAction.JUMP, PAGE_ACTION_TITLES[PageAction.JUMP]))
+
+    # Note: Only items of the current page are rendered.
+    options_list.extend([(item.uid, item.get_prompt_toolkit_output()) for item in page])
+
+    plural_name = model.get_meta_info().plural_name
+    if not is_paginated:
+        message = f"{plural_name} found: {len(page)}. \nChoose one to interact:"
+    elif pager.total is None:
+        message = f"{plural_name}. Page {page_number + 1}. \nChoose one to interact:"
+    else:
+        message = (
+            f"{plural_name} found: {pager.total}. Page {page_number + 1} of {pager.pages_amount}. "
+            "\nChoose one to interact:"
+        )
 
-    message_after_filter = f"{model.get_meta_info().plural_name} found: {len(items)}. \nChoose one to interact:"
-    choice_by_list = choice(
-        message=message_after_filter,
+    return choice(
+        message=message,
         options=options_list,
     )
 
-    if choice_by_list is None:
-        return
 
-    next_action(
-        execution_queue,
-        choice_by_list,
-    )
-
-    return
+def ask_page_number(
+    console: Console,
+    pager: ItemsPager[Any],
+    page_number: int,
+) -> int:
+    """Ask the number of the page to jump. The current page is kept on invalid input."""
+    pages_amount = pager.pages_amount
+    hint = f"1-{pages_amount}" if pages_amount is not None else "from 1"
+
+    raw = prompt(message=HTML(f"<b>Page</b> ({hint}): ")).strip()
+
+    try:
+        new_page_number = int(raw)
+    except ValueError:
+        render_error(console, f"Invalid page number: {raw!r}.")
+        return page_number
+
+    if new_page_number < 1 or (pages_amount is not None and new_page_number > pages_amount):
+        render_error(console, f"Page number must be {hint}, got: {new_page_number}.")
+        return page_number
+
+    return new_page_number - 1
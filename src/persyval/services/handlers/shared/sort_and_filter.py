@@ -1,13 +1,14 @@
-import datetime
 import enum
-from typing import TYPE_CHECKING, Any
+import functools
+import itertools
+from typing import TYPE_CHECKING, Any, Final, Protocol, runtime_checkable
 
 from prompt_toolkit import prompt
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SkipValidation
 
+from persyval.exceptions.main import InvalidCommandError
 from persyval.models.contact import Contact
 from persyval.models.note import Note
-from persyval.services.birthday.parse_and_format import format_birthday_for_edit_and_export
 from persyval.services.commands.args_config import (
     T_PARSE_RESULT_DICT,
     ArgMetaConfig,
@@ -16,11 +17,20 @@ from persyval.services.commands.args_config import (
     ValueInteractiveMode,
 )
 from persyval.services.execution_queue.execution_queue import HandlerArgsBase
-from persyval.services.model_meta.field_meta import FilterMode
+from persyval.services.model_meta.field_meta import normalize_field_value_for_filter
 from persyval.services.model_meta.model_meta_info import HaveMetaInfoProtocol
+from persyval.services.query_engine.filter_compiler import Predicate, compile_predicate
+from persyval.services.query_engine.query_planner import QueryPlan, plan_query
+from persyval.services.sort_engine.sort_engine import select_top, sort_items
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+
+FILTER_CACHE_SIZE: Final[int] = 128
+"""Amount of compiled filters, that are kept."""
+
+LIST_DEFAULT_PAGE_SIZE: Final[int] = 20
+"""Items on the page of the interactive list. Zero shows all items on the single page."""
 
 
 @enum.unique
@@ -33,6 +43,7 @@ class ListOrderModeEnum(enum.StrEnum):
 class ListFilterModeEnum(enum.StrEnum):
     ALL = enum.auto()
     FILTER = enum.auto()
+    QUERY = enum.auto()
 
 
 class ListModeMeta[T](BaseModel):
@@ -50,6 +61,9 @@ class ListIArgs(HandlerArgsBase):
 
     filter_mode: ListFilterModeEnum | None = None
     filter_query: dict[str, Any] | None = None
+    query: str | None = None
+
+    page_size: int | None = None
 
 
 LIST_FILTER_MODE_REGISTRY: dict[ListFilterModeEnum, ListFilterModeMeta] = {
@@ -63,6 +77,10 @@ LIST_FILTER_MODE_REGISTRY: dict[ListFilterModeEnum, ListFilterModeMeta] = {
             mode=ListFilterModeEnum.FILTER,
             title="Filter",
         ),
+        ListFilterModeMeta(
+            mode=ListFilterModeEnum.QUERY,
+            title="Query (AND/OR/NOT, ranges, regex)",
+        ),
     ]
 }
 
@@ -121,6 +139,43 @@ def validate_filter_query_i_wrapper(model: type[HaveMetaInfoProtocol]) -> Callab
     return validator
 
 
+def value_interactive_custom_i_query_i_wrapper(
+    model: type[HaveMetaInfoProtocol],
+) -> Callable[[T_PARSE_RESULT_DICT], str]:
+    def handler(parsed: T_PARSE_RESULT_DICT) -> str:
+        if parsed.get("filter_mode") != ListFilterModeEnum.QUERY:
+            return ""
+
+        field_names = model.get_meta_info().fields_meta_config.get_field_names_for_filtering()
+
+        message = (
+            "Enter the query. \n"
+            "Conditions: key=value, key~regex, key>value, key>=value, key<value, key<=value, has:key, missing:key \n"
+            "Combine them with AND, OR, NOT and parentheses. AND is implicit between conditions. \n"
+            'Quote values with spaces or parentheses: key~"^(a|b)" \n'
+            "Example: (name=ann OR name=bob) AND birthday>=1990-01-01 AND NOT missing:email \n"
+            f"Allowed keys: {', '.join(sorted(field_names))}\n"
+        )
+        return prompt(
+            message=message,
+        )
+
+    return handler
+
+
+def validate_query_i_wrapper(model: type[HaveMetaInfoProtocol]) -> Callable[[str | None], str | None]:
+    def validator(value: str | None) -> str | None:
+        if not value or value == "''":
+            return None
+
+        # Note: Invalid queries are rejected before the list is shown. The plan is cached for the list.
+        get_query_plan(model, value)
+
+        return value
+
+    return validator
+
+
 def value_interactive_custom_i_order_query_i_wrapper(
     model: type[HaveMetaInfoProtocol],
 ) -> Callable[[T_PARSE_RESULT_DICT], str]:
@@ -170,6 +225,14 @@ def validate_order_query_i_wrapper(model: type[HaveMetaInfoProtocol]) -> Callabl
     return validator
 
 
+def validate_page_size(value: int) -> int:
+    if value < 0:
+        msg = f"Page size can't be negative: {value}."
+        raise InvalidCommandError(msg)
+
+    return value
+
+
 def collect_args_config_i_for_model(
     model: type[HaveMetaInfoProtocol],
 ) -> ArgsConfig[ListIArgs]:
@@ -210,6 +273,20 @@ def collect_args_config_i_for_model(
                 value_interactive_custom_handler=value_interactive_custom_i_filter_query_i_wrapper(model),
                 validator_func=validate_filter_query_i_wrapper(model),
             ),
+            ArgMetaConfig(
+                name="query",
+                allow_input_on_empty=True,
+                value_interactive_mode=ValueInteractiveMode.CUSTOM,
+                #
+                value_interactive_custom_handler=value_interactive_custom_i_query_i_wrapper(model),
+                validator_func=validate_query_i_wrapper(model),
+            ),
+            ArgMetaConfig(
+                name="page_size",
+                type_=ArgType.INT,
+                default=LIST_DEFAULT_PAGE_SIZE,
+                validator_func=validate_page_size,
+            ),
         ],
     )
 
@@ -225,15 +302,27 @@ class ListConfig(BaseModel):
 
     filter_mode: ListFilterModeEnum | None = None
     filter_query: dict[str, str] = Field(default_factory=dict)
+    query: str | None = None
+    """Query of the query language. Used by the `QUERY` filter mode."""
+
+    limit: int | None = Field(default=None, ge=0)
+    """Max amount of items in the result. All items, if not set."""
+    offset: int = Field(default=0, ge=0)
+    """Amount of first items to skip. After the ordering."""
+
+    def get_stop(self) -> int | None:
+        """Position of the item after the last one in the result. Or `None`, if there is no limit."""
+        return self.offset + self.limit if self.limit is not None else None
 
 
 def validate_filter_query_in_data_action(
     model: HaveMetaInfoProtocol,
     filter_query: dict[str, Any],
-) -> dict[str, Any]:
+) -> dict[str, str]:
     meta_config = model.get_meta_info().fields_meta_config
+    fields_meta_registry = meta_config.get_fields_meta_registry()
 
-    new_dict: dict[str, Any] = {}
+    new_dict: dict[str, str] = {}
     for key, val in filter_query.items():
         try:
             fact_name = meta_config.get_field_name_fact(key)
@@ -241,116 +330,196 @@ def validate_filter_query_in_data_action(
             msg = f"Filtering by '{key}' is not allowed."
             raise KeyError(msg) from None
 
-        parse_func = None
-        for field in meta_config.fields:
-            if field.name == fact_name:
-                parse_func = field.parse_func
-                break
+        parse_func = fields_meta_registry[fact_name].parse_func
 
-        val_fact = parse_func(val) if parse_func is not None else val.lower()
+        val_fact = parse_func(val) if parse_func is not None else val
 
-        new_dict[fact_name] = val_fact
+        new_dict[fact_name] = normalize_field_value_for_filter(val_fact) or ""
 
     return new_dict
 
 
-def filter_iterable[T: HaveMetaInfoProtocol](  # noqa: C901, PLR0912
-    iterable: Iterable[T],
+class CompiledFilter(BaseModel):
+    filter_query: dict[str, str]
+    """Normalized filter query. For indexes."""
+    predicate: SkipValidation[Predicate]
+
+
+def compile_filter(
+    model: type[HaveMetaInfoProtocol],
+    filter_query: Mapping[str, Any],
+) -> CompiledFilter:
+    """Compile the filter query of the model. Compiled filters are cached by the query.
+
+    So, repeated list commands don't validate the query and build the predicate again.
+    """
+    return compile_filter_cached(model, tuple(filter_query.items()))
+
+
+@functools.lru_cache(maxsize=FILTER_CACHE_SIZE)
+def compile_filter_cached(
+    model: type[HaveMetaInfoProtocol],
+    filter_query_items: tuple[tuple[str, Any], ...],
+) -> CompiledFilter:
+    filter_query = validate_filter_query_in_data_action(
+        model=model,
+        filter_query=dict(filter_query_items),
+    )
+
+    return CompiledFilter(
+        filter_query=filter_query,
+        predicate=compile_predicate(
+            model.get_meta_info().fields_meta_config.get_fields_meta_registry(),
+            filter_query,
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=FILTER_CACHE_SIZE)
+def get_query_plan(
+    model: type[HaveMetaInfoProtocol],
+    query: str,
+) -> QueryPlan:
+    """Parse and plan the query of the model. Plans are cached by the query."""
+    return plan_query(model, query)
+
+
+def get_list_query_plan(
+    model: type[HaveMetaInfoProtocol],
+    list_config: ListConfig,
+) -> QueryPlan:
+    if not list_config.query:
+        msg = "Query is not specified."
+        raise InvalidCommandError(msg)
+
+    return get_query_plan(model, list_config.query)
+
+
+@runtime_checkable
+class SupportsFilterCandidates[T](Protocol):
+    """Collection, that can narrow the items to check by the filter.
+
+    For example, by indexes.
+    """
+
+    def get_filter_candidates(self, filter_query: dict[str, str]) -> Iterable[T]:
+        """Get items, that can match the normalized filter query.
+
+        Items must be in the same order as in the full iteration.
+        """
+        ...
+
+    def get_filter_candidates_i_any(self, filter_queries: list[dict[str, str]]) -> Iterable[T]:
+        """Get items, that can match any of the normalized filter queries. Each item once.
+
+        Items must be in the same order as in the full iteration.
+        """
+        ...
+
+
+def get_section_candidates[T: HaveMetaInfoProtocol](
+    section: Mapping[Any, T],
     model: type[T],
     list_config: ListConfig,
-) -> list[Any]:
-    filter_mode = list_config.filter_mode
+) -> Iterable[T]:
+    if not isinstance(section, SupportsFilterCandidates):
+        return section.values()
 
-    result: list[T]
-    match filter_mode:
-        case ListFilterModeEnum.ALL:
-            result = list(iterable)
+    match list_config.filter_mode:
         case ListFilterModeEnum.FILTER:
-            filter_query = validate_filter_query_in_data_action(
-                model=model,
-                filter_query=list_config.filter_query,
+            return section.get_filter_candidates(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+                compile_filter(model, list_config.filter_query).filter_query,
             )
+        case ListFilterModeEnum.QUERY:
+            candidate_queries = get_list_query_plan(model, list_config).candidate_queries
+            if candidate_queries is None:
+                return section.values()
 
-            fields_meta_registry = model.get_meta_info().fields_meta_config.get_fields_meta_registry()
-
-            result = []
-            for item in iterable:
-                is_good = True
-                for field_name, filter_value in filter_query.items():
-                    field_meta = fields_meta_registry[field_name]
-
-                    field_value = getattr(item, field_meta.name)
+            if len(candidate_queries) == 1:
+                return section.get_filter_candidates(candidate_queries[0])  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
 
-                    if field_value is None:
-                        is_good = False
-                        break
+            return section.get_filter_candidates_i_any(candidate_queries)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        case _:
+            return section.values()
 
-                    match field_meta.filter_mode:
-                        case FilterMode.EXACT:
-                            if field_meta.is_list_based:
-                                if not any(filter_value == str(item).lower() for item in field_value):
-                                    is_good = False
-                                    break
 
-                            elif filter_value != str(field_value).lower():
-                                is_good = False
-                                break
-                            continue
+def filter_section[T: HaveMetaInfoProtocol](
+    section: Mapping[Any, T],
+    model: type[T],
+    list_config: ListConfig,
+) -> list[Any]:
+    return filter_iterable(
+        iterable=get_section_candidates(section, model, list_config),  # pyright: ignore[reportUnknownArgumentType]
+        model=model,
+        list_config=list_config,
+    )
 
-                        case FilterMode.PARTIAL:
-                            if field_meta.is_list_based:
-                                if not any(filter_value in str(item).lower() for item in field_value):
-                                    is_good = False
-                                    break
 
-                            elif filter_value not in str(field_value).lower():
-                                is_good = False
-                                break
+def iterate_section[T: HaveMetaInfoProtocol](
+    section: Mapping[Any, T],
+    model: type[T],
+    list_config: ListConfig,
+) -> Iterable[T]:
+    """Like `filter_section`, but lazy, if the order is default. So, the first items are ready without a full scan.
+
+    The custom order needs all items. So, the sorted list is returned.
+    """
+    if list_config.order_mode == ListOrderModeEnum.CUSTOM:
+        return filter_section(section, model, list_config)
+
+    return itertools.islice(
+        iterate_filtered(
+            iterable=get_section_candidates(section, model, list_config),  # pyright: ignore[reportUnknownArgumentType]
+            model=model,
+            list_config=list_config,
+        ),
+        list_config.offset,
+        list_config.get_stop(),
+    )
 
-                    continue
 
-                if is_good:
-                    result.append(item)
+def iterate_filtered[T: HaveMetaInfoProtocol](
+    iterable: Iterable[T],
+    model: type[T],
+    list_config: ListConfig,
+) -> Iterator[T]:
+    filter_mode = list_config.filter_mode
 
+    match filter_mode:
+        case ListFilterModeEnum.ALL:
+            return iter(iterable)
+        case ListFilterModeEnum.FILTER:
+            return filter(compile_filter(model, list_config.filter_query).predicate, iterable)
+        case ListFilterModeEnum.QUERY:
+            return filter(get_list_query_plan(model, list_config).predicate, iterable)
         case None:
             msg = "Filter mode is not specified."
             raise ValueError(msg)
 
+
+def filter_iterable[T: HaveMetaInfoProtocol](
+    iterable: Iterable[T],
+    model: type[T],
+    list_config: ListConfig,
+) -> list[Any]:
+    filtered = iterate_filtered(iterable, model, list_config)
+    offset = list_config.offset
+    stop = list_config.get_stop()
+
     order_mode = list_config.order_mode
     match order_mode:
         case ListOrderModeEnum.DEFAULT:
-            return result
+            # Note: Streamed. Items after the limit are not even checked by the filter.
+            return list(itertools.islice(filtered, offset, stop))
         case ListOrderModeEnum.CUSTOM:
             order_query = list_config.order_query
 
-            # Sort by lower() if the field is str
-
-            for order_field in reversed(order_query):
-                is_descending = order_field.startswith("-")
-                field_name = order_field.lstrip("-")
+            if stop is not None:
+                return select_top(filtered, order_query, stop)[offset:]
 
-                result.sort(
-                    key=lambda item: normalize_sort_value(getattr(item, field_name)),
-                    reverse=is_descending,
-                )
+            # Note: Sorted once. By keys, computed once per item.
+            return sort_items(filtered, order_query)[offset:]
 
         case None:
             msg = "Order mode is not specified."
             raise ValueError(msg)
-
-    return result
-
-
-def normalize_sort_value(
-    value: Any,  # noqa: ANN401
-) -> Any:  # noqa: ANN401
-    if isinstance(value, str):
-        return value.lower()
-
-    if value is None:
-        return ""
-
-    if isinstance(value, datetime.date):
-        return format_birthday_for_edit_and_export(value)
-
-    return value
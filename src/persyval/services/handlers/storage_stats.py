@@ -1,9 +1,10 @@
+import asyncio
 from typing import TYPE_CHECKING
 
 from rich.table import Table
 
 from persyval.services.handlers.shared.args_i_empty import ARGS_CONFIG_I_EMPTY, ArgsIEmpty
-from persyval.services.handlers_base.handler_base import HandlerBase
+from persyval.services.handlers_base.async_handler_base import AsyncHandlerBase
 
 if TYPE_CHECKING:
     from persyval.services.commands.args_config import ArgsConfig
@@ -11,12 +12,12 @@ if TYPE_CHECKING:
 
 
 class StorageStatsIHandler(
-    HandlerBase[ArgsIEmpty],
+    AsyncHandlerBase[ArgsIEmpty],
 ):
     def _get_args_config(self) -> ArgsConfig[ArgsIEmpty]:
         return ARGS_CONFIG_I_EMPTY
 
-    def _make_action(
+    async def _make_action_async(
         self,
         parsed_args: ArgsIEmpty,  # noqa: ARG002
     ) -> HandlerOutput | None:
@@ -24,7 +25,8 @@ class StorageStatsIHandler(
         table.add_column("Name")
         table.add_column("Amount")
 
-        for info in self.data_storage.get_stats():
+        # Note: Stats of the SQLite storage are queries. So, off the event loop.
+        for info in await asyncio.to_thread(self.data_storage.get_stats):
             table.add_row(
                 info.name,
                 str(info.amount),
@@ -0,0 +1,39 @@
+import abc
+import asyncio
+from typing import TYPE_CHECKING, override
+
+from persyval.services.handlers_base.handler_base import HandlerBase
+
+if TYPE_CHECKING:
+    from persyval.services.handlers_base.handler_output import HandlerOutput
+    from persyval.services.parse_input.parse_input import T_ARGS
+
+
+class AsyncHandlerBase[HandlerArgs](HandlerBase[HandlerArgs]):
+    """Base class for async handlers.
+
+    The action is run on the event loop. So, blocking work (IO, saves, heavy computations) must be moved off the loop.
+    For example, by `asyncio.to_thread`.
+    """
+
+    @abc.abstractmethod
+    async def _make_action_async(self, parsed_args: HandlerArgs) -> HandlerOutput | None:
+        """Make action with parsed arguments. Like `_make_action`, but async."""
+
+    @override
+    def _make_action(self, parsed_args: HandlerArgs) -> HandlerOutput | None:
+        # Note: For sync callers, without the event loop. For example, the storage server.
+        return asyncio.run(self._make_action_async(parsed_args))
+
+    @override
+    async def run_async(
+        self,
+        args: T_ARGS | None,
+        parsed_args: HandlerArgs | None = None,
+    ) -> HandlerOutput | None:
+        try:
+            # Note: Parsing can prompt for missing arguments. Prompts are blocking.
+            reparsed_args = await asyncio.to_thread(self._handle_parsed_args, args, parsed_args)
+            return await self._make_action_async(reparsed_args)
+        except Exception as exc:  # noqa: BLE001
+            return self._handle_exception(exc)
@@ -1,8 +1,9 @@
 import abc
+import asyncio
 import sys
 from typing import TYPE_CHECKING, Annotated
 
-import rich
+import rich.console
 from pydantic import BaseModel, ConfigDict, Field
 
 from persyval.exceptions.main import AlreadyExistsError, InvalidCommandError, InvalidDataError, NotFoundError
@@ -126,6 +127,17 @@ class HandlerBase[HandlerArgs](abc.ABC, BaseModel):
 
         return result
 
+    async def run_async(
+        self,
+        args: T_ARGS | None,
+        parsed_args: HandlerArgs | None = None,
+    ) -> HandlerOutput | None:
+        """Run from the event loop.
+
+        Sync handlers block on prompts and on saves of the storage. So, they are run in the worker thread.
+        """
+        return await asyncio.to_thread(self.run, args, parsed_args)
+
     def _handle_exception(self, exc: Exception) -> HandlerOutput | None:
         error_name = type(exc).__name__
         msg = str(exc)
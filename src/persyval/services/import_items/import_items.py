@@ -0,0 +1,343 @@
+"""Import of items from files. The inverse of the export.
+
+Files are parsed as a stream. Records are validated in chunks. Chunks are validated in the process pool,
+because validators of some fields (phones, emails) are CPU-bound.
+Bad records are reported and skipped. Good ones are added to the storage and persisted at once, on the end.
+"""
+
+import collections
+import contextlib
+import csv
+import enum
+import itertools
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Final
+
+from pydantic import BaseModel, Field, SkipValidation, ValidationError
+
+from persyval.exceptions.main import InvalidDataError, NotFoundError
+from persyval.services.model_meta.field_meta import UID_FIELD_NAME
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable, Iterator, Mapping
+    from concurrent.futures import Future
+    from typing import TextIO
+
+    from persyval.services.data_storage.data_storage import DataStorage
+    from persyval.services.model_meta.field_meta import FieldsMetaConfig
+
+IMPORT_CHUNK_SIZE: Final[int] = 5_000
+"""Amount of records in the chunk. Big enough to amortize the transfer between processes."""
+
+IMPORT_PENDING_CHUNKS_PER_WORKER: Final[int] = 2
+"""Chunks, that are parsed ahead of validation. Bounds the memory usage."""
+
+IMPORT_READ_SIZE: Final[int] = 1024 * 1024
+"""Characters. Size of the read from the JSON file."""
+
+IMPORT_ERRORS_LIMIT: Final[int] = 100
+"""Errors, that are kept for the report. Others are only counted."""
+
+CSV_NONE_VALUES: Final[frozenset[str]] = frozenset({"", "None"})
+"""Values, that are written to CSV for `None` by the export."""
+
+CSV_LIST_SEPARATOR: Final[str] = ","
+
+PATTERN_I_JSON_WHITESPACE: Final[re.Pattern[str]] = re.compile(r"\s*")
+
+
+@enum.unique
+class ImportFormat(enum.StrEnum):
+    CSV = "csv"
+    JSON = "json"
+    JSONL = "jsonl"
+
+
+IMPORT_FORMAT_BY_SUFFIX: Final[dict[str, ImportFormat]] = {
+    ".csv": ImportFormat.CSV,
+    ".json": ImportFormat.JSON,
+    ".jsonl": ImportFormat.JSONL,
+    ".ndjson": ImportFormat.JSONL,
+}
+
+type ImportRecord = tuple[int, Any]
+"""Row number and raw data of the record. Raw data depends on the format."""
+
+
+class ImportRowError(BaseModel):
+    row: int
+    message: str
+
+
+class ImportChunk(BaseModel):
+    model: type[BaseModel]
+    import_format: ImportFormat
+    list_fields: frozenset[str]
+    # Note: Raw data. It is validated by the model later.
+    records: SkipValidation[list[ImportRecord]]
+
+
+class ImportChunkResult(BaseModel):
+    items: SkipValidation[list[tuple[int, BaseModel]]]
+    errors: list[ImportRowError]
+
+
+class ImportResult(BaseModel):
+    imported: int = 0
+    errors_amount: int = 0
+    errors: list[ImportRowError] = Field(default_factory=list)
+
+    def add_error(self, error: ImportRowError) -> None:
+        self.errors_amount += 1
+        if len(self.errors) < IMPORT_ERRORS_LIMIT:
+            self.errors.append(error)
+
+
+def detect_import_format(path: pathlib.Path) -> ImportFormat:
+    import_format = IMPORT_FORMAT_BY_SUFFIX.get(path.suffix.lower())
+    if import_format is None:
+        msg = f"Unknown format of the file: {path.name}. Supported extensions: {', '.join(IMPORT_FORMAT_BY_SUFFIX)}."
+        raise InvalidDataError(msg)
+
+    return import_format
+
+
+def adapt_fields_from_csv(
+    row: Mapping[str | None, Any],
+    list_fields: frozenset[str],
+) -> dict[str, Any]:
+    """Inverse of `adapt_fields_to_csv`. Lists are split by comma. Empty values are skipped, so defaults are used."""
+    item: dict[str, Any] = {}
+
+    for key, value in row.items():
+        # Note: Values of extra columns are under the `None` key.
+        if key is None or value is None or value in CSV_NONE_VALUES:
+            continue
+
+        if key in list_fields:
+            item[key] = [part for part in value.split(CSV_LIST_SEPARATOR) if part]
+        else:
+            item[key] = value
+
+    return item
+
+
+def format_validation_error(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}" for error in exc.errors()
+    )
+
+
+def iterate_csv_records(file: TextIO) -> Iterator[ImportRecord]:
+    reader = csv.DictReader(file)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def iterate_jsonl_records(file: TextIO) -> Iterator[ImportRecord]:
+    for line_number, line in enumerate(file, start=1):
+        # Note: Parsed by the model in the worker. Not here.
+        if line.strip():
+            yield line_number, line
+
+
+def iterate_json_array(file: TextIO) -> Iterator[Any]:  # noqa: C901
+    """Parse the JSON array item by item. Only the current part of the file is kept in memory.
+
+    Raises:
+        InvalidDataError: If the file is not the JSON array.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    is_file_ended = False
+    is_started = False
+    is_item_expected = True
+
+    while True:
+        position = PATTERN_I_JSON_WHITESPACE.match(buffer, position).end()  # type: ignore[union-attr]  # pyright: ignore[reportOptionalMemberAccess]
+
+        if position == len(buffer) and not is_file_ended:
+            buffer = file.read(IMPORT_READ_SIZE)
+            position = 0
+            is_file_ended = not buffer
+            continue
+
+        if position == len(buffer):
+            msg = "Unexpected end of the JSON array."
+            raise InvalidDataError(msg)
+
+        symbol = buffer[position]
+        if not is_started:
+            if symbol != "[":
+                msg = "JSON file must contain the array of items."
+                raise InvalidDataError(msg)
+
+            is_started = True
+            position += 1
+            continue
+
+        if symbol == "]":
+            return
+
+        if not is_item_expected:
+            if symbol != ",":
+                msg = f"Expected ',' or ']' in the JSON array, got: {symbol!r}."
+                raise InvalidDataError(msg)
+
+            is_item_expected = True
+            position += 1
+            continue
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as exc:
+            if is_file_ended:
+                msg = f"Invalid JSON: {exc}"
+                raise InvalidDataError(msg) from exc
+            end = len(buffer)
+
+        # Note: The item can be cut by the end of the read. So, read more and parse it again.
+        if end == len(buffer) and not is_file_ended:
+            chunk = file.read(IMPORT_READ_SIZE)
+            buffer = buffer[position:] + chunk
+            position = 0
+            is_file_ended = not chunk
+            continue
+
+        yield item
+        position = end
+        is_item_expected = False
+
+
+def iterate_json_records(file: TextIO) -> Iterator[ImportRecord]:
+    yield from enumerate(iterate_json_array(file), start=1)
+
+
+def validate_import_chunk(chunk: ImportChunk) -> ImportChunkResult:
+    items: list[tuple[int, BaseModel]] = []
+    errors: list[ImportRowError] = []
+
+    for row, raw in chunk.records:
+        try:
+            match chunk.import_format:
+                case ImportFormat.CSV:
+                    item = chunk.model.model_validate(adapt_fields_from_csv(raw, chunk.list_fields))
+                case ImportFormat.JSON:
+                    item = chunk.model.model_validate(raw)
+                case ImportFormat.JSONL:
+                    item = chunk.model.model_validate_json(raw)
+        except ValidationError as exc:
+            errors.append(ImportRowError(row=row, message=format_validation_error(exc)))
+        except InvalidDataError as exc:
+            # Note: Raised by validators of fields as is. Not wrapped by pydantic.
+            errors.append(ImportRowError(row=row, message=str(exc)))
+        else:
+            items.append((row, item))
+
+    return ImportChunkResult(items=items, errors=errors)
+
+
+def iterate_validated_chunks(
+    chunks: Iterator[ImportChunk],
+    workers: int,
+) -> Iterator[ImportChunkResult]:
+    """Validate chunks in the process pool. Results are in the order of chunks.
+
+    The pool is not started for the single chunk. Its start costs more, than the validation of a small file.
+    """
+    first_chunks = list(itertools.islice(chunks, 2))
+    if workers <= 1 or len(first_chunks) <= 1:
+        yield from map(validate_import_chunk, itertools.chain(first_chunks, chunks))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Note: Not `executor.map`. It reads all chunks at once.
+        pending: collections.deque[Future[ImportChunkResult]] = collections.deque()
+        for chunk in itertools.chain(first_chunks, chunks):
+            pending.append(executor.submit(validate_import_chunk, chunk))
+            if len(pending) >= workers * IMPORT_PENDING_CHUNKS_PER_WORKER:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def import_items[T: BaseModel](  # noqa: PLR0913
+    *,
+    data_storage: DataStorage,
+    path: pathlib.Path,
+    model: type[T],
+    fields_meta_config: FieldsMetaConfig,
+    section: Mapping[Any, T],
+    add_many: Callable[[list[T]], object],
+    workers: int | None = None,
+) -> ImportResult:
+    """Import items from the file. The format is detected by the extension.
+
+    Items with uids, that already exist, are reported as bad rows. Like other invalid records.
+
+    Args:
+        data_storage: Storage to import to.
+        path: File to import from.
+        model: Model of items.
+        fields_meta_config: Fields of the model. Used for parsing of CSV.
+        section: Section of the storage with items of the model.
+        add_many: Data action, that adds items to the section.
+        workers: Amount of processes for the validation. By default, the amount of CPUs.
+
+    Raises:
+        NotFoundError: If the file doesn't exist.
+        InvalidDataError: If the file has unknown format or is broken as a whole.
+    """
+    import_format = detect_import_format(path)
+    if not path.is_file():
+        msg = f"File not found: {path}"
+        raise NotFoundError(msg)
+
+    list_fields = frozenset(field.name for field in fields_meta_config.fields if field.is_list_based)
+    result = ImportResult()
+
+    with contextlib.ExitStack() as stack:
+        file = stack.enter_context(
+            path.open(encoding="utf-8", newline="" if import_format == ImportFormat.CSV else None),
+        )
+
+        match import_format:
+            case ImportFormat.CSV:
+                records = iterate_csv_records(file)
+            case ImportFormat.JSON:
+                records = iterate_json_records(file)
+            case ImportFormat.JSONL:
+                records = iterate_jsonl_records(file)
+
+        chunks = (
+            ImportChunk(model=model, import_format=import_format, list_fields=list_fields, records=list(batch))
+            for batch in itertools.batched(records, IMPORT_CHUNK_SIZE, strict=False)
+        )
+
+        # Note: Persist all chunks at once. Not on each added chunk.
+        with data_storage.transaction():
+            for chunk_result in iterate_validated_chunks(chunks, workers or os.process_cpu_count() or 1):
+                for error in chunk_result.errors:
+                    result.add_error(error)
+
+                items: dict[Any, T] = {}
+                for row, item in chunk_result.items:
+                    uid = getattr(item, UID_FIELD_NAME)
+                    # Note: Items of previous chunks are already in the section.
+                    if uid in items or uid in section:
+                        result.add_error(ImportRowError(row=row, message=f"Item with uid {uid} already exists."))
+                        continue
+
+                    items[uid] = item  # type: ignore[assignment]  # pyright: ignore[reportArgumentType]
+
+                if items:
+                    add_many(list(items.values()))
+                    result.imported += len(items)
+
+    return result
@@ -1,9 +1,11 @@
 import enum
 from collections.abc import Callable
-from typing import Annotated, Any
+from typing import Annotated, Any, Final
 
 from pydantic import BaseModel, Field
 
+UID_FIELD_NAME: Final[str] = "uid"
+
 
 @enum.unique
 class FilterMode(enum.StrEnum):
@@ -11,6 +13,16 @@ class FilterMode(enum.StrEnum):
     PARTIAL = "partial"
 
 
+def normalize_field_value_for_filter(
+    value: Any,  # noqa: ANN401
+) -> str | None:
+    """Normalize the field value (or the filter value) for comparison in filters."""
+    if value is None:
+        return None
+
+    return str(value).lower()
+
+
 class FieldItemMetaConfig(BaseModel):
     name: Annotated[str, Field(description="The name of the field.")]
     aliases: list[str] = Field(default_factory=list, description="List of aliases for the field.")
@@ -32,6 +44,14 @@ class FieldItemMetaConfig(BaseModel):
         default=FilterMode.PARTIAL,
         description="The filtering mode for the field.",
     )
+    is_trigram_indexed: bool = Field(
+        default=False,
+        description="Indicates if the field has a trigram index for the partial filtering. Costs memory.",
+    )
+    is_calendar_indexed: bool = Field(
+        default=False,
+        description="Indicates if the date field has a day-of-year index. For anniversaries lookup.",
+    )
 
     is_sortable: bool = Field(
         default=True,
@@ -0,0 +1,36 @@
+"""Validation context for the trusted data.
+
+Data, that is written by persyval itself, was already validated before the write.
+So, expensive validators (phones, emails, etc.) can be skipped, when such data is loaded.
+Types are still parsed by pydantic as usual.
+"""
+
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pydantic import ValidationInfo
+
+TRUSTED_CONTEXT_KEY: Final[str] = "is_trusted"
+
+
+def get_trusted_context() -> dict[str, Any]:
+    return {TRUSTED_CONTEXT_KEY: True}
+
+
+def is_trusted_context(info: ValidationInfo) -> bool:
+    context = info.context
+    return isinstance(context, dict) and context.get(TRUSTED_CONTEXT_KEY) is True
+
+
+def skip_for_trusted[T](func: Callable[[T], T]) -> Callable[[T, ValidationInfo], T]:
+    """Wrap the validator. So, it is skipped for the trusted data."""
+
+    def validator(value: T, info: ValidationInfo) -> T:
+        if is_trusted_context(info):
+            return value
+
+        return func(value)
+
+    return validator
@@ -0,0 +1,223 @@
+"""Full-text search index for notes.
+
+Inverted index over tokenized title, content and tags. Ranking is done by BM25.
+"""
+
+import bisect
+import heapq
+import math
+from collections import Counter
+from typing import TYPE_CHECKING, Final
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from persyval.models.note import Note, NoteUid
+from persyval.services.data_storage.data_change import DataChange, DataChangeKind
+from persyval.services.notes_search.tokenizer import parse_search_query, tokenize
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterable
+
+BM25_K1: Final[float] = 1.2
+BM25_B: Final[float] = 0.75
+
+TITLE_WEIGHT: Final[int] = 2
+TAGS_WEIGHT: Final[int] = 2
+CONTENT_WEIGHT: Final[int] = 1
+
+
+def get_note_term_frequencies(note: Note) -> Counter[str]:
+    """Get weighted term frequencies of the note. Matches in the title and tags are more important."""
+    frequencies: Counter[str] = Counter()
+
+    for token in tokenize(note.content):
+        frequencies[token] += CONTENT_WEIGHT
+
+    if note.title:
+        for token in tokenize(note.title):
+            frequencies[token] += TITLE_WEIGHT
+
+    for tag in note.tags or []:
+        for token in tokenize(tag):
+            frequencies[token] += TAGS_WEIGHT
+
+    return frequencies
+
+
+class NotesSearchHit(BaseModel):
+    uid: NoteUid
+    score: float
+
+
+class NotesSearchIndex(BaseModel):
+    """Inverted index of notes.
+
+    Notes are identified by the internal ids. So, postings are compact.
+    """
+
+    source_fingerprint: str | None = Field(
+        default=None,
+        description="Fingerprint of the data, that the persisted index corresponds to.",
+    )
+    journal_offset: int = Field(
+        default=0,
+        description="Size of the data journal, that is already applied to the persisted index.",
+    )
+
+    doc_ids: dict[NoteUid, int] = Field(default_factory=dict)
+    doc_lengths: dict[int, int] = Field(default_factory=dict)
+    doc_terms: dict[int, list[str]] = Field(
+        default_factory=dict,
+        description="Forward index. For removal of the outdated postings.",
+    )
+    postings: dict[str, dict[int, int]] = Field(
+        default_factory=dict,
+        description="Term -> document id -> weighted term frequency.",
+    )
+
+    next_doc_id: int = 0
+    total_length: int = 0
+
+    _uids: dict[int, NoteUid] = PrivateAttr(default_factory=dict)
+    _sorted_terms: list[str] | None = PrivateAttr(default=None)
+
+    def model_post_init(self, context: object, /) -> None:
+        del context
+        self._uids = {doc_id: uid for uid, doc_id in self.doc_ids.items()}
+
+    @classmethod
+    def create(cls, notes: Iterable[Note]) -> NotesSearchIndex:
+        index = cls()
+        for note in notes:
+            index.add(note)
+
+        return index
+
+    def add(self, note: Note) -> None:
+        self.remove(note.uid)
+
+        doc_id = self.next_doc_id
+        self.next_doc_id += 1
+
+        frequencies = get_note_term_frequencies(note)
+        for term, frequency in frequencies.items():
+            term_postings = self.postings.get(term)
+            if term_postings is None:
+                self.postings[term] = {doc_id: frequency}
+                if self._sorted_terms is not None:
+                    bisect.insort(self._sorted_terms, term)
+            else:
+                term_postings[doc_id] = frequency
+
+        length = sum(frequencies.values())
+
+        self.doc_ids[note.uid] = doc_id
+        self._uids[doc_id] = note.uid
+        self.doc_lengths[doc_id] = length
+        self.doc_terms[doc_id] = list(frequencies)
+        self.total_length += length
+
+    def remove(self, uid: NoteUid) -> None:
+        doc_id = self.doc_ids.pop(uid, None)
+        if doc_id is None:
+            return
+
+        del self._uids[doc_id]
+        self.total_length -= self.doc_lengths.pop(doc_id)
+
+        for term in self.doc_terms.pop(doc_id):
+            term_postings = self.postings[term]
+            del term_postings[doc_id]
+            if not term_postings:
+                del self.postings[term]
+                if self._sorted_terms is not None:
+                    del self._sorted_terms[bisect.bisect_left(self._sorted_terms, term)]
+
+    def clear(self) -> None:
+        self.doc_ids.clear()
+        self.doc_lengths.clear()
+        self.doc_terms.clear()
+        self.postings.clear()
+        self.total_length = 0
+
+        self._uids.clear()
+        self._sorted_terms = None
+
+    def apply_data_change(self, change: DataChange) -> None:
+        match change.kind:
+            case DataChangeKind.NOTE_PUT:
+                if change.note is not None:
+                    self.add(change.note)
+
+            case DataChangeKind.NOTE_DELETE:
+                if change.uid is not None:
+                    self.remove(NoteUid(change.uid))
+
+            case DataChangeKind.CLEAR:
+                self.clear()
+
+            case DataChangeKind.CONTACT_PUT | DataChangeKind.CONTACT_DELETE:
+                pass
+
+    def expand_prefix(self, prefix: str) -> list[str]:
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self.postings)
+
+        terms: list[str] = []
+        for position in range(bisect.bisect_left(self._sorted_terms, prefix), len(self._sorted_terms)):
+            term = self._sorted_terms[position]
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+
+        return terms
+
+    def search(self, query: str, limit: int) -> list[NotesSearchHit]:
+        """Find notes by the query. Ranked by BM25.
+
+        Any term can match. Notes with more matched terms are ranked higher.
+        """
+        docs_amount = len(self.doc_ids)
+        if not docs_amount or limit <= 0:
+            return []
+
+        average_length = self.total_length / docs_amount
+
+        scores: dict[int, float] = {}
+        for query_term, is_prefix in parse_search_query(query):
+            terms = self.expand_prefix(query_term) if is_prefix else [query_term]
+
+            for term in terms:
+                term_postings = self.postings.get(term)
+                if not term_postings:
+                    continue
+
+                idf = math.log(1 + (docs_amount - len(term_postings) + 0.5) / (len(term_postings) + 0.5))
+                for doc_id, frequency in term_postings.items():
+                    length_norm = 1 - BM25_B + BM25_B * self.doc_lengths[doc_id] / average_length
+                    score = idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+                    scores[doc_id] = scores.get(doc_id, 0) + score
+
+        # Note: Top-K without the full sort. Older notes first on equal scores.
+        top = heapq.nlargest(limit, scores.items(), key=lambda pair: (pair[1], -pair[0]))
+
+        return [NotesSearchHit(uid=self._uids[doc_id], score=score) for doc_id, score in top]
+
+
+def load_notes_search_index(path: pathlib.Path) -> NotesSearchIndex | None:
+    try:
+        with path.open("r", encoding="utf-8") as file:
+            return NotesSearchIndex.model_validate_json(file.read())
+    except FileNotFoundError:
+        return None
+    except ValueError:
+        # Note: Broken index is not a problem. It can be rebuilt from the data.
+        return None
+
+
+def save_notes_search_index(path: pathlib.Path, index: NotesSearchIndex) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with path.open("w", encoding="utf-8") as file:
+        file.write(index.model_dump_json())
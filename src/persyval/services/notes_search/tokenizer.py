@@ -0,0 +1,31 @@
+import re
+from typing import Final
+
+TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(r"\w+")
+
+PREFIX_QUERY_MARKER: Final[str] = "*"
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def parse_search_query(query: str) -> list[tuple[str, bool]]:
+    """Parse the search query into terms.
+
+    A word, that ends with `*`, is a prefix query. For example, `pyth*` matches `python`.
+
+    Returns:
+        List of terms with the flag, if the term is a prefix.
+    """
+    terms: list[tuple[str, bool]] = []
+    for word in query.split():
+        is_prefix = word.endswith(PREFIX_QUERY_MARKER)
+        tokens = tokenize(word)
+        if not tokens:
+            continue
+
+        terms.extend((token, False) for token in tokens[:-1])
+        terms.append((tokens[-1], is_prefix))
+
+    return terms
@@ -2,8 +2,6 @@ import re
 from re import Pattern
 from typing import Final
 
-import phonenumbers
-
 from persyval.exceptions.main import EmptyDataError, InvalidDataError
 
 DEFAULT_REGION: Final[str] = "UA"
@@ -24,6 +22,9 @@ def validate_phone(phone: str) -> str:
 
     user_phone = PATTERN_I_PHONE_I_CHARS_FOR_CLEANUP.sub("", user_phone)
 
+    # Note: Heavy library, because of the metadata. Import on the first use. Not on the start of CLI.
+    import phonenumbers  # noqa: PLC0415
+
     try:
         if user_phone.startswith("+"):
             parsed = phonenumbers.parse(user_phone, None)
@@ -0,0 +1,85 @@
+"""Compilation of filter queries to predicates.
+
+The query is interpreted once. The result is the single function, that checks items by direct attribute access.
+Filter values must be normalized. So, they are lowered once, not per item.
+"""
+
+import operator
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from persyval.services.model_meta.field_meta import FilterMode
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from persyval.services.model_meta.field_meta import FieldItemMetaConfig
+
+# Note: Not under `TYPE_CHECKING`. Used by pydantic models at runtime.
+type Predicate = Callable[[Any], bool]
+
+
+def compile_field_check(
+    field: FieldItemMetaConfig,
+    filter_value: str,
+) -> Predicate:
+    """Make the check of the single field. Missing values don't match."""
+    get_value = operator.attrgetter(field.name)
+
+    match field.filter_mode, field.is_list_based:
+        case FilterMode.EXACT, False:
+
+            def check_exact(item: Any) -> bool:  # noqa: ANN401
+                value = get_value(item)
+                return value is not None and str(value).lower() == filter_value
+
+            return check_exact
+
+        case FilterMode.PARTIAL, False:
+
+            def check_partial(item: Any) -> bool:  # noqa: ANN401
+                value = get_value(item)
+                return value is not None and filter_value in str(value).lower()
+
+            return check_partial
+
+        case FilterMode.EXACT, True:
+
+            def check_exact_i_list(item: Any) -> bool:  # noqa: ANN401
+                values = get_value(item)
+                return values is not None and any(filter_value == str(value).lower() for value in values)
+
+            return check_exact_i_list
+
+        case FilterMode.PARTIAL, True:
+
+            def check_partial_i_list(item: Any) -> bool:  # noqa: ANN401
+                values = get_value(item)
+                return values is not None and any(filter_value in str(value).lower() for value in values)
+
+            return check_partial_i_list
+
+        case _:
+            msg = f"Unknown filter mode: {field.filter_mode}"
+            raise NotImplementedError(msg)
+
+
+def compile_predicate(
+    fields_meta_registry: Mapping[str, FieldItemMetaConfig],
+    filter_query: Mapping[str, str],
+) -> Predicate:
+    """Make the predicate, that matches items with all fields of the normalized filter query."""
+    checks = tuple(
+        compile_field_check(fields_meta_registry[field_name], filter_value)
+        for field_name, filter_value in filter_query.items()
+    )
+
+    match checks:
+        case ():
+            return lambda _: True
+        case (check,):
+            return check
+        case (check_first, check_second):
+            return lambda item: check_first(item) and check_second(item)
+        case _:
+            return lambda item: all(check(item) for check in checks)
@@ -0,0 +1,237 @@
+r"""Parser of the query language for lists.
+
+Examples:
+- `name=ann birthday>=1990-01-01` - both conditions. `AND` is implicit;
+- `(tag=work OR tag=home) AND NOT has:email`;
+- `phone~"^\+380"` - the regex search.
+
+Operators of conditions:
+- `=` - the filter by the field. Exact or partial, like the simple filter;
+- `~` - the case-insensitive regex search;
+- `>`, `>=`, `<`, `<=` - ranges;
+- `has:field`, `missing:field` - presence of the value.
+
+Priority: `NOT`, then `AND`, then `OR`. Keywords are case-insensitive.
+The parser knows nothing about models. Fields are resolved by the planner.
+"""
+
+import enum
+import re
+from typing import Final
+
+from pydantic import BaseModel
+
+from persyval.exceptions.main import InvalidCommandError
+
+
+@enum.unique
+class QueryOperator(enum.StrEnum):
+    MATCH = "="
+    REGEX = "~"
+    GREATER = ">"
+    GREATER_OR_EQUAL = ">="
+    LESS = "<"
+    LESS_OR_EQUAL = "<="
+
+
+@enum.unique
+class QueryPresence(enum.StrEnum):
+    HAS = "has"
+    MISSING = "missing"
+
+
+@enum.unique
+class QueryKeyword(enum.StrEnum):
+    AND = "and"
+    OR = "or"
+    NOT = "not"
+
+
+PRESENCE_SEPARATOR: Final[str] = ":"
+
+PATTERN_I_TOKEN: Final[re.Pattern[str]] = re.compile(
+    r"""
+    \s*(?:
+        (?P<paren>[()])
+        |(?P<field>[^\s()"=~<>:]+)\s*(?P<operator>>=|<=|=|~|>|<|:)\s*(?P<value>"(?:[^"\\]|\\.)*"|[^\s()"]+)
+        |(?P<word>[^\s()]+)
+    )
+    """,
+    re.VERBOSE,
+)
+
+PATTERN_I_ESCAPE: Final[re.Pattern[str]] = re.compile(r'\\([\\"])')
+"""Only quotes and backslashes are escaped in quoted values. So, regexes like `\\d` are written as is."""
+
+
+class ConditionNode(BaseModel):
+    field: str
+    operator: QueryOperator
+    value: str
+
+
+class PresenceNode(BaseModel):
+    field: str
+    is_present: bool
+
+
+class NotNode(BaseModel):
+    child: QueryNode
+
+
+class AndNode(BaseModel):
+    children: list[QueryNode]
+
+
+class OrNode(BaseModel):
+    children: list[QueryNode]
+
+
+type QueryNode = ConditionNode | PresenceNode | NotNode | AndNode | OrNode
+
+
+class QueryToken(BaseModel):
+    text: str
+
+    keyword: QueryKeyword | None = None
+    node: ConditionNode | PresenceNode | None = None
+
+
+def unquote_value(value: str) -> str:
+    if len(value) >= 2 and value.startswith('"') and value.endswith('"'):  # noqa: PLR2004
+        return PATTERN_I_ESCAPE.sub(r"\1", value[1:-1])
+
+    return value
+
+
+def make_term_node(field: str, operator: str, value: str) -> ConditionNode | PresenceNode:
+    if operator != PRESENCE_SEPARATOR:
+        return ConditionNode(field=field, operator=QueryOperator(operator), value=value)
+
+    try:
+        presence = QueryPresence(field.lower())
+    except ValueError:
+        msg = f"Unknown predicate: '{field}'. Allowed: {', '.join(QueryPresence)}."
+        raise InvalidCommandError(msg) from None
+
+    return PresenceNode(field=value, is_present=presence == QueryPresence.HAS)
+
+
+def tokenize_query(query: str) -> list[QueryToken]:
+    tokens: list[QueryToken] = []
+
+    position = 0
+    while query[position:].strip():
+        match = PATTERN_I_TOKEN.match(query, position)
+        if match is None:
+            msg = f"Invalid query near: '{query[position:].strip()}'."
+            raise InvalidCommandError(msg)
+
+        position = match.end()
+
+        if (paren := match.group("paren")) is not None:
+            tokens.append(QueryToken(text=paren))
+        elif (word := match.group("word")) is not None:
+            try:
+                keyword = QueryKeyword(word.lower())
+            except ValueError:
+                msg = f"Unexpected word: '{word}'. Conditions look like: field=value."
+                raise InvalidCommandError(msg) from None
+
+            tokens.append(QueryToken(text=word, keyword=keyword))
+        else:
+            tokens.append(
+                QueryToken(
+                    text=match.group(0).strip(),
+                    node=make_term_node(
+                        field=match.group("field"),
+                        operator=match.group("operator"),
+                        value=unquote_value(match.group("value")),
+                    ),
+                ),
+            )
+
+    return tokens
+
+
+class QueryParser:
+    """Recursive descent parser. One method per the priority level."""
+
+    def __init__(self, tokens: list[QueryToken]) -> None:
+        self._tokens = tokens
+        self._position = 0
+
+    def parse(self) -> QueryNode:
+        if not self._tokens:
+            msg = "Query is empty."
+            raise InvalidCommandError(msg)
+
+        node = self._parse_or()
+
+        token = self._peek()
+        if token is not None:
+            msg = f"Unexpected '{token.text}' in the query."
+            raise InvalidCommandError(msg)
+
+        return node
+
+    def _peek(self) -> QueryToken | None:
+        return self._tokens[self._position] if self._position < len(self._tokens) else None
+
+    def _next(self) -> QueryToken:
+        token = self._peek()
+        if token is None:
+            msg = "Query ends unexpectedly."
+            raise InvalidCommandError(msg)
+
+        self._position += 1
+        return token
+
+    def _is_next_keyword(self, keyword: QueryKeyword) -> bool:
+        token = self._peek()
+        return token is not None and token.keyword == keyword
+
+    def _parse_or(self) -> QueryNode:
+        children = [self._parse_and()]
+        while self._is_next_keyword(QueryKeyword.OR):
+            self._next()
+            children.append(self._parse_and())
+
+        return children[0] if len(children) == 1 else OrNode(children=children)
+
+    def _parse_and(self) -> QueryNode:
+        children = [self._parse_not()]
+        while (token := self._peek()) is not None and token.keyword != QueryKeyword.OR and token.text != ")":
+            # Note: `AND` is optional between conditions.
+            if token.keyword == QueryKeyword.AND:
+                self._next()
+            children.append(self._parse_not())
+
+        return children[0] if len(children) == 1 else AndNode(children=children)
+
+    def _parse_not(self) -> QueryNode:
+        if self._is_next_keyword(QueryKeyword.NOT):
+            self._next()
+            return NotNode(child=self._parse_not())
+
+        return self._parse_atom()
+
+    def _parse_atom(self) -> QueryNode:
+        token = self._next()
+
+        if token.node is not None:
+            return token.node
+
+        if token.text == "(":
+            node = self._parse_or()
+            if self._next().text != ")":
+                msg = "Missing ')' in the query."
+                raise InvalidCommandError(msg)
+            return node
+
+        msg = f"Unexpected '{token.text}' in the query."
+        raise InvalidCommandError(msg)
+
+
+def parse_query(query: str) -> QueryNode:
+    return QueryParser(tokenize_query(query)).parse()
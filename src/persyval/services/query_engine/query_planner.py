@@ -0,0 +1,282 @@
+"""Planner of queries. Binds the parsed query to the model and chooses the access path.
+
+The result is the predicate for the whole query and candidate queries for indexes of the section.
+Candidate queries are normalized `=` conditions, like the simple filter has.
+Each matched item satisfies all conditions of at least one of them. So, candidates are the superset of the result:
+- conditions of `AND` are merged. So, the most selective index is chosen by the section;
+- branches of `OR` become the union of index lookups. If each branch has the index-backed condition;
+- `NOT`, ranges, regexes and presence checks are checked by the predicate only.
+
+If there are no candidate queries, the section is scanned fully.
+"""
+
+import enum
+import operator
+import re
+from typing import TYPE_CHECKING, Any, Final, cast
+
+from pydantic import BaseModel, SkipValidation, TypeAdapter, ValidationError
+
+from persyval.exceptions.main import InvalidCommandError
+from persyval.services.data_index.section_index import is_field_indexed
+from persyval.services.model_meta.field_meta import UID_FIELD_NAME, normalize_field_value_for_filter
+from persyval.services.query_engine.filter_compiler import Predicate, compile_field_check
+from persyval.services.query_engine.query_parser import (
+    AndNode,
+    ConditionNode,
+    NotNode,
+    OrNode,
+    PresenceNode,
+    QueryNode,
+    QueryOperator,
+    parse_query,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from persyval.services.model_meta.field_meta import FieldItemMetaConfig
+    from persyval.services.model_meta.model_meta_info import HaveMetaInfoProtocol
+
+MAX_CANDIDATE_QUERIES: Final[int] = 16
+"""Max amount of index lookups for the union. Bigger unions are slower than the full scan."""
+
+RANGE_OPERATORS: Final[dict[QueryOperator, Callable[[Any, Any], bool]]] = {
+    QueryOperator.GREATER: operator.gt,
+    QueryOperator.GREATER_OR_EQUAL: operator.ge,
+    QueryOperator.LESS: operator.lt,
+    QueryOperator.LESS_OR_EQUAL: operator.le,
+}
+
+
+@enum.unique
+class QueryAccessPath(enum.StrEnum):
+    FULL_SCAN = "full_scan"
+    INDEX = "index"
+    INDEX_UNION = "index_union"
+
+
+class NodePlan(BaseModel):
+    predicate: SkipValidation[Predicate]
+    candidate_queries: list[dict[str, str]] | None = None
+    cost: int = 0
+    """Relative cost of the predicate. Cheap checks of `AND` are first."""
+
+
+class QueryPlan(BaseModel):
+    query: str
+    predicate: SkipValidation[Predicate]
+    candidate_queries: list[dict[str, str]] | None = None
+    """Normalized filter queries for indexes. `None` means the full scan."""
+    access_path: QueryAccessPath
+
+
+def is_field_index_backed(field: FieldItemMetaConfig) -> bool:
+    return field.name == UID_FIELD_NAME or is_field_indexed(field)
+
+
+class QueryPlanner:
+    def __init__(self, model: type[HaveMetaInfoProtocol]) -> None:
+        self._meta_config = model.get_meta_info().fields_meta_config
+        self._fields_registry = self._meta_config.get_fields_meta_registry()
+        # Note: All models with the meta info are pydantic models.
+        self._model_fields = cast("type[BaseModel]", model).model_fields
+
+    def plan(self, query: str) -> QueryPlan:
+        node_plan = self.plan_node(parse_query(query))
+
+        return QueryPlan(
+            query=query,
+            predicate=node_plan.predicate,
+            candidate_queries=node_plan.candidate_queries,
+            access_path=self.get_access_path(node_plan.candidate_queries),
+        )
+
+    def get_access_path(self, candidate_queries: list[dict[str, str]] | None) -> QueryAccessPath:
+        if not candidate_queries or not all(map(self.is_index_backed, candidate_queries)):
+            return QueryAccessPath.FULL_SCAN
+
+        return QueryAccessPath.INDEX if len(candidate_queries) == 1 else QueryAccessPath.INDEX_UNION
+
+    def is_index_backed(self, candidate_query: dict[str, str]) -> bool:
+        return any(is_field_index_backed(self._fields_registry[field_name]) for field_name in candidate_query)
+
+    def resolve_field(self, field_name: str) -> FieldItemMetaConfig:
+        try:
+            field = self._fields_registry[self._meta_config.get_field_name_fact(field_name)]
+        except KeyError:
+            field = None
+
+        if field is None or not field.is_filterable:
+            msg = f"Filtering by '{field_name}' is not allowed."
+            raise InvalidCommandError(msg)
+
+        return field
+
+    def plan_node(self, node: QueryNode) -> NodePlan:  # noqa: PLR0911
+        match node:
+            case ConditionNode(operator=QueryOperator.MATCH):
+                return self.plan_match(node)
+            case ConditionNode(operator=QueryOperator.REGEX):
+                return self.plan_regex(node)
+            case ConditionNode():
+                return self.plan_range(node)
+            case PresenceNode():
+                return self.plan_presence(node)
+            case NotNode():
+                child = self.plan_node(node.child).predicate
+                return NodePlan(predicate=lambda item: not child(item), cost=1)
+            case AndNode():
+                return self.plan_and(node)
+            case OrNode():
+                return self.plan_or(node)
+
+    def plan_match(self, node: ConditionNode) -> NodePlan:
+        field = self.resolve_field(node.field)
+
+        try:
+            value = field.parse_func(node.value) if field.parse_func is not None else node.value
+        except (ValueError, ValidationError):
+            msg = f"Invalid value for '{field.name}': '{node.value}'."
+            raise InvalidCommandError(msg) from None
+
+        filter_value = normalize_field_value_for_filter(value) or ""
+
+        return NodePlan(
+            predicate=compile_field_check(field, filter_value),
+            candidate_queries=[{field.name: filter_value}],
+        )
+
+    def plan_regex(self, node: ConditionNode) -> NodePlan:
+        field = self.resolve_field(node.field)
+
+        try:
+            search = re.compile(node.value, re.IGNORECASE).search
+        except re.error as error:
+            msg = f"Invalid regex for '{field.name}': {error}."
+            raise InvalidCommandError(msg) from None
+
+        get_value = operator.attrgetter(field.name)
+
+        if field.is_list_based:
+
+            def check_regex_i_list(item: Any) -> bool:  # noqa: ANN401
+                values = get_value(item)
+                return values is not None and any(search(str(value)) for value in values)
+
+            return NodePlan(predicate=check_regex_i_list, cost=3)
+
+        def check_regex(item: Any) -> bool:  # noqa: ANN401
+            value = get_value(item)
+            return value is not None and search(str(value)) is not None
+
+        return NodePlan(predicate=check_regex, cost=3)
+
+    def parse_range_bound(self, field: FieldItemMetaConfig, value: str) -> Any:  # noqa: ANN401
+        """Parse the bound to the type of the field. Without validators of the field. So, any date can be the bound.
+
+        Strings are compared case-insensitive. Items of lists are compared as strings.
+        """
+        if field.is_list_based:
+            return value.lower()
+
+        try:
+            bound = TypeAdapter(self._model_fields[field.name].annotation or str).validate_python(value)
+        except ValidationError:
+            msg = f"Invalid value for '{field.name}': '{value}'."
+            raise InvalidCommandError(msg) from None
+
+        return bound.lower() if isinstance(bound, str) else bound
+
+    def plan_range(self, node: ConditionNode) -> NodePlan:
+        field = self.resolve_field(node.field)
+        bound = self.parse_range_bound(field, node.value)
+        compare = RANGE_OPERATORS[node.operator]
+        get_value = operator.attrgetter(field.name)
+
+        if field.is_list_based:
+
+            def check_range_i_list(item: Any) -> bool:  # noqa: ANN401
+                values = get_value(item)
+                return values is not None and any(compare(str(value).lower(), bound) for value in values)
+
+            return NodePlan(predicate=check_range_i_list, cost=2)
+
+        if isinstance(bound, str):
+
+            def check_range_i_str(item: Any) -> bool:  # noqa: ANN401
+                value = get_value(item)
+                return value is not None and compare(str(value).lower(), bound)
+
+            return NodePlan(predicate=check_range_i_str, cost=2)
+
+        def check_range(item: Any) -> bool:  # noqa: ANN401
+            value = get_value(item)
+            return value is not None and compare(value, bound)
+
+        return NodePlan(predicate=check_range, cost=1)
+
+    def plan_presence(self, node: PresenceNode) -> NodePlan:
+        field = self.resolve_field(node.field)
+        get_value = operator.attrgetter(field.name)
+        is_present = node.is_present
+
+        # Note: Empty strings and lists are missing values too.
+        def check_presence(item: Any) -> bool:  # noqa: ANN401
+            value = get_value(item)
+            return (value is not None and value not in ("", [])) == is_present
+
+        return NodePlan(predicate=check_presence)
+
+    def plan_and(self, node: AndNode) -> NodePlan:
+        plans = sorted(map(self.plan_node, node.children), key=operator.attrgetter("cost"))
+        predicates = tuple(plan.predicate for plan in plans)
+
+        conjunction: dict[str, str] = {}
+        unions: list[list[dict[str, str]]] = []
+        for plan in plans:
+            match plan.candidate_queries:
+                case None:
+                    continue
+                case [candidate_query]:
+                    for field_name, filter_value in candidate_query.items():
+                        conjunction.setdefault(field_name, filter_value)
+                case union:
+                    unions.append(union)
+
+        candidate_queries: list[dict[str, str]] | None = None
+        if unions:
+            # Note: Conditions of `AND` are needed for each branch of the smallest union.
+            candidate_queries = [{**candidate_query, **conjunction} for candidate_query in min(unions, key=len)]
+        elif conjunction:
+            candidate_queries = [conjunction]
+
+        return NodePlan(
+            predicate=lambda item: all(predicate(item) for predicate in predicates),
+            candidate_queries=candidate_queries,
+            cost=max(plan.cost for plan in plans),
+        )
+
+    def plan_or(self, node: OrNode) -> NodePlan:
+        plans = list(map(self.plan_node, node.children))
+        predicates = tuple(plan.predicate for plan in plans)
+
+        candidate_queries: list[dict[str, str]] | None = None
+        if all(plan.candidate_queries is not None for plan in plans):
+            candidate_queries = [candidate_query for plan in plans for candidate_query in plan.candidate_queries or []]
+
+            # Note: The union of scans is slower than the single scan. So, each branch must be narrowed by the index.
+            if len(candidate_queries) > MAX_CANDIDATE_QUERIES or not all(
+                map(self.is_index_backed, candidate_queries),
+            ):
+                candidate_queries = None
+
+        return NodePlan(
+            predicate=lambda item: any(predicate(item) for predicate in predicates),
+            candidate_queries=candidate_queries,
+            cost=max(plan.cost for plan in plans),
+        )
+
+
+def plan_query(model: type[HaveMetaInfoProtocol], query: str) -> QueryPlan:
+    return QueryPlanner(model).plan(query)
@@ -0,0 +1,49 @@
+"""Thin client of the storage server.
+
+Imports only the protocol. So, the command is not slowed down by the start of the whole app.
+"""
+
+import socket
+from typing import TYPE_CHECKING
+
+from persyval.services.server.protocol import ServerMessageKind, ServerRequest, encode_line, iterate_messages
+
+if TYPE_CHECKING:
+    import pathlib
+    from typing import TextIO
+
+
+def send_request(
+    *,
+    socket_path: pathlib.Path,
+    request: ServerRequest,
+    output: TextIO,
+) -> int:
+    """Send the request to the server and write its output, as it comes.
+
+    Returns:
+        Exit code of the command.
+
+    Raises:
+        ConnectionError: If the server is not running, or the connection is closed before the exit code.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+        try:
+            client_socket.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            msg = f"Server is not running on the socket: {socket_path}"
+            raise ConnectionError(msg) from e
+
+        client_socket.sendall(encode_line(request))
+
+        with client_socket.makefile("rb") as file:
+            for message in iterate_messages(file):
+                match message.kind:
+                    case ServerMessageKind.OUTPUT:
+                        output.write(message.text)
+                        output.flush()
+                    case ServerMessageKind.EXIT:
+                        return message.exit_code
+
+    msg = "Server closed the connection before the end of the command."
+    raise ConnectionError(msg)
@@ -0,0 +1,64 @@
+"""Protocol between the storage server and its client.
+
+Messages are JSON, one per line. The client sends the request. The server answers by the stream of messages:
+output chunks, as they are rendered, and then the exit code.
+
+Kept light on imports. So, the client starts fast.
+"""
+
+import enum
+from typing import TYPE_CHECKING, Annotated, Final
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterator
+    from typing import BinaryIO
+
+SERVER_SOCKET_FILE_NAME: Final[str] = "server.sock"
+
+EXIT_CODE_I_OK: Final[int] = 0
+EXIT_CODE_I_ERROR: Final[int] = 1
+
+
+class ServerRequest(BaseModel):
+    predefined_input: str
+    show_commands: bool = False
+    plain_render: bool = False
+    raise_sys_exit_on_error: bool = False
+
+    width: Annotated[int | None, Field(description="Width of the client terminal. `None`, if not a terminal.")] = None
+    is_terminal: Annotated[bool, Field(description="Render colors and styles, like for the terminal.")] = False
+
+
+@enum.unique
+class ServerMessageKind(enum.StrEnum):
+    OUTPUT = enum.auto()
+    EXIT = enum.auto()
+
+
+class ServerMessage(BaseModel):
+    kind: ServerMessageKind
+    text: str = ""
+    exit_code: int = EXIT_CODE_I_OK
+
+
+def encode_line(message: BaseModel) -> bytes:
+    return message.model_dump_json().encode() + b"\n"
+
+
+def iterate_messages(file: BinaryIO) -> Iterator[ServerMessage]:
+    for line in file:
+        yield ServerMessage.model_validate_json(line)
+
+
+def get_default_socket_path(storage_dir: pathlib.Path | None) -> pathlib.Path:
+    """Socket is next to the data. So, each storage directory has its own server."""
+    if storage_dir is None:
+        # Note: Import on use. It is not light.
+        from persyval.services.get_paths.get_app_dirs import get_data_dir_in_user_space  # noqa: PLC0415
+
+        storage_dir = get_data_dir_in_user_space()
+
+    return storage_dir / SERVER_SOCKET_FILE_NAME
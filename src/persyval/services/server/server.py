@@ -0,0 +1,218 @@
+"""Storage server. Keeps the storage loaded and runs commands of clients over the Unix socket.
+
+So, each command doesn't pay for the start of the app and the load of the storage.
+Commands are run one by one, in the order of connections. Like the sequence of separate CLI calls.
+"""
+
+import contextlib
+import io
+import os
+import socket
+import socketserver
+import sys
+from typing import TYPE_CHECKING, Final, TextIO, cast, override
+
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import DummyInput
+from prompt_toolkit.output import create_output
+from pydantic import ValidationError
+from rich.console import Console
+
+from persyval.services.chat.parse_input_and_make_action import parse_input_and_make_action
+from persyval.services.execution_queue.execution_queue import create_execution_queue
+from persyval.services.server.protocol import (
+    EXIT_CODE_I_ERROR,
+    EXIT_CODE_I_OK,
+    ServerMessage,
+    ServerMessageKind,
+    ServerRequest,
+    encode_line,
+)
+from persyval.utils.format import render_error
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable, Iterator
+
+    from persyval.services.data_storage.data_storage import DataStorage
+
+SOCKET_PERMISSIONS: Final[int] = 0o600
+"""Only the owner can send commands."""
+SOCKET_UMASK: Final[int] = 0o077
+"""Umask for the bind. So, the socket is never accessible by other users."""
+SOCKET_DIR_PERMISSIONS: Final[int] = 0o700
+"""Permissions of the created directory of the socket."""
+
+
+class ServerOutputStream(io.TextIOBase):
+    """Text stream, that sends each write to the client at once."""
+
+    def as_text_io(self) -> TextIO:
+        # Note: Text stream for libraries, that expect the file. Only writing is used.
+        return cast("TextIO", self)
+
+    def __init__(self, send: Callable[[bytes], None]) -> None:
+        self._send = send
+
+    @override
+    def writable(self) -> bool:
+        return True
+
+    @override
+    def write(self, text: str) -> int:
+        if text:
+            self._send(encode_line(ServerMessage(kind=ServerMessageKind.OUTPUT, text=text)))
+        return len(text)
+
+
+@contextlib.contextmanager
+def redirect_command_io(stream: ServerOutputStream) -> Iterator[None]:
+    """Commands of the server have no terminal. Input is empty. Output of plain prints goes to the client."""
+    stdin = sys.stdin
+    sys.stdin = io.StringIO()
+    try:
+        with (
+            contextlib.redirect_stdout(stream),
+            create_app_session(input=DummyInput(), output=create_output(stdout=stream.as_text_io())),
+        ):
+            yield
+    finally:
+        sys.stdin = stdin
+
+
+def run_request(
+    *,
+    data_storage: DataStorage,
+    request: ServerRequest,
+    stream: ServerOutputStream,
+) -> int:
+    """Run the command, like `chat run --non-interactive`.
+
+    Returns:
+        Exit code.
+    """
+    console = Console(
+        file=stream.as_text_io(),
+        width=request.width,
+        force_terminal=request.is_terminal,
+    )
+
+    execution_queue = create_execution_queue()
+    execution_queue.put(request.predefined_input)
+
+    with redirect_command_io(stream):
+        try:
+            parse_input_and_make_action(
+                console=console,
+                data_storage=data_storage,
+                #
+                execution_queue=execution_queue,
+                show_commands=request.show_commands,
+                #
+                non_interactive=True,
+                plain_render=request.plain_render,
+                terminal_simplified=True,
+                raise_sys_exit_on_error=request.raise_sys_exit_on_error,
+            )
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else EXIT_CODE_I_ERROR
+        except Exception as e:  # noqa: BLE001
+            # Note: The server must keep running. So, the error is only reported to the client.
+            render_error(console=console, message=str(e), title=type(e).__name__)
+            return EXIT_CODE_I_ERROR
+
+    return EXIT_CODE_I_OK
+
+
+class StorageServer(socketserver.UnixStreamServer):
+    def __init__(
+        self,
+        *,
+        socket_path: pathlib.Path,
+        data_storage: DataStorage,
+    ) -> None:
+        self.data_storage = data_storage
+        super().__init__(str(socket_path), StorageRequestHandler)
+
+
+class StorageRequestHandler(socketserver.StreamRequestHandler):
+    server: StorageServer
+
+    @override
+    def handle(self) -> None:
+        is_disconnected = False
+
+        def send(chunk: bytes) -> None:
+            nonlocal is_disconnected
+            if is_disconnected:
+                return
+
+            try:
+                self.wfile.write(chunk)
+                self.wfile.flush()
+            except OSError:
+                # Note: The client is gone. For example, its output is closed. The command is still completed.
+                is_disconnected = True
+
+        stream = ServerOutputStream(send)
+
+        try:
+            request = ServerRequest.model_validate_json(self.rfile.readline())
+        except ValidationError as e:
+            stream.write(f"Invalid request: {e}\n")
+            exit_code = EXIT_CODE_I_ERROR
+        else:
+            exit_code = run_request(
+                data_storage=self.server.data_storage,
+                request=request,
+                stream=stream,
+            )
+
+        send(encode_line(ServerMessage(kind=ServerMessageKind.EXIT, exit_code=exit_code)))
+
+
+def is_socket_in_use(socket_path: pathlib.Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            return False
+
+    return True
+
+
+@contextlib.contextmanager
+def open_storage_server(
+    *,
+    socket_path: pathlib.Path,
+    data_storage: DataStorage,
+) -> Iterator[StorageServer]:
+    """Open the server on the socket. The socket is removed on exit.
+
+    Raises:
+        FileExistsError: If another server is already running on the socket.
+    """
+    if socket_path.exists():
+        if is_socket_in_use(socket_path):
+            msg = f"Another server is already running on the socket: {socket_path}"
+            raise FileExistsError(msg)
+
+        # Note: Left after the crash of the previous server.
+        socket_path.unlink()
+
+    socket_path.parent.mkdir(mode=SOCKET_DIR_PERMISSIONS, parents=True, exist_ok=True)
+
+    # Note: The socket is created by the bind with permissions by the umask. So, the umask is restricted around it.
+    # Otherwise, other users can connect before the chmod.
+    umask = os.umask(SOCKET_UMASK)
+    try:
+        server = StorageServer(socket_path=socket_path, data_storage=data_storage)
+    finally:
+        os.umask(umask)
+
+    try:
+        socket_path.chmod(SOCKET_PERMISSIONS)
+        yield server
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
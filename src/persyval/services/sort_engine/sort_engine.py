@@ -0,0 +1,247 @@
+"""Sorting of items by several fields. In the single pass.
+
+Sort keys are computed once per item. Descending fields get inverted keys.
+So, all fields are compared natively, as parts of the one tuple.
+"""
+
+import datetime
+import heapq
+import operator
+from typing import TYPE_CHECKING, Any, Final
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+type SortKey = tuple[Any, ...]
+
+PRESENT: Final[int] = 1
+MISSING: Final[int] = 0
+"""Flags before values in keys. Missing values are the smallest. And are not compared with present ones."""
+
+
+class SortField(BaseModel):
+    name: str
+    is_descending: bool = False
+
+
+def parse_order_query(order_query: list[str]) -> list[SortField]:
+    """Parse fields like `name` or `-name`. The minus means the descending order."""
+    return [
+        SortField(name=order_field.lstrip("-"), is_descending=order_field.startswith("-"))
+        for order_field in order_query
+    ]
+
+
+def normalize_sort_value(
+    value: Any,  # noqa: ANN401
+) -> Any:  # noqa: ANN401
+    """Normalize the field value for comparison. Strings are compared case-insensitive. Other values as is."""
+    if isinstance(value, str):
+        return value.lower()
+
+    if isinstance(value, list):
+        return [normalize_sort_value(item) for item in value]  # pyright: ignore[reportUnknownVariableType]
+
+    return value
+
+
+LIST_SEPARATOR: Final[str] = "\x00"
+"""Less than any other symbol. So, joined lists are compared like lists: item by item. Shorter first."""
+
+MISSING_STR_KEY: Final[str] = ""
+PRESENT_STR_PREFIX: Final[str] = "\x00"
+"""Prefix of present strings. So, missing values are before all of them, even before empty ones."""
+
+
+def encode_column(  # noqa: PLR0911
+    values: list[Any],
+    *,
+    is_descending: bool,
+) -> list[Any]:
+    """Encode values of the field to keys, that are compared natively. In the order of the direction.
+
+    Values of the field have the same type. Or are `None`. So, the type is checked once.
+
+    Dates become ordinals. Descending strings and other values become negated ranks among unique values.
+    Missing values become keys before all others. Or after them, for the descending order.
+    If it's not possible, `None` is kept as is.
+    """
+    first = next((value for value in values if value is not None), None)
+
+    match first:
+        case None:
+            return values
+        case datetime.date():
+            return encode_dates(values, is_descending=is_descending)
+        case int() | float() if is_descending:
+            return [None if value is None else -value for value in values]
+        case str() if is_descending:
+            return encode_by_ranks(lower_strings(values))
+        case str():
+            return encode_strings(values)
+        case list():
+            return encode_column(encode_lists(values), is_descending=is_descending)
+        case _ if is_descending:
+            return encode_by_ranks(values)
+        case _:
+            return values
+
+
+def encode_dates(
+    values: list[datetime.date | None],
+    *,
+    is_descending: bool,
+) -> list[int]:
+    # Note: Ordinals are positive.
+    if is_descending:
+        return [1 if value is None else -value.toordinal() for value in values]
+    return [0 if value is None else value.toordinal() for value in values]
+
+
+def lower_strings(values: list[str | None]) -> list[str | None]:
+    if None not in values:
+        return list(map(str.lower, values))  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+    return [None if value is None else value.lower() for value in values]
+
+
+def encode_strings(values: list[str | None]) -> list[str]:
+    if None not in values:
+        return list(map(str.lower, values))  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+    return [MISSING_STR_KEY if value is None else PRESENT_STR_PREFIX + value.lower() for value in values]
+
+
+def encode_lists(values: list[list[Any] | None]) -> list[str | tuple[Any, ...] | None]:
+    """Encode lists of strings as strings. They are compared faster. And in the same order. Then, they are lowercased.
+
+    Other lists become tuples. Tuples are hashable. Needed for ranks.
+    """
+    try:
+        return [None if value is None else LIST_SEPARATOR.join(value) for value in values]
+    except TypeError:
+        return [None if value is None else tuple(value) for value in values]
+
+
+def encode_by_ranks(values: list[Any]) -> list[int]:
+    """Replace values by negated ranks among unique values. So, they are sorted in the reversed order."""
+    ranks = {value: -rank for rank, value in enumerate(sorted({value for value in values if value is not None}))}
+
+    if None not in values:
+        return list(map(ranks.__getitem__, values))
+    # Note: Negated ranks are not positive. So, `1` is after all of them.
+    return [1 if value is None else ranks[value] for value in values]
+
+
+def build_sort_keys(
+    items: Sequence[Any],
+    sort_fields: list[SortField],
+) -> list[Any]:
+    """Compute keys for all items. Column by column. Fields are read and normalized once per item.
+
+    Keys are tuples. Or plain values, if the single column is enough.
+    """
+    columns: list[list[Any]] = []
+
+    for sort_field in sort_fields:
+        values = encode_column(
+            list(map(operator.attrgetter(sort_field.name), items)),
+            is_descending=sort_field.is_descending,
+        )
+
+        if None not in values:
+            columns.append(values)
+            continue
+
+        # Note: Missing values are last in the descending order.
+        missing, present = (PRESENT, MISSING) if sort_field.is_descending else (MISSING, PRESENT)
+        columns.append([missing if value is None else present for value in values])
+        # Note: Flags are different for missing and present values. So, `0` is never compared with them.
+        columns.append([0 if value is None else value for value in values])
+
+    if len(columns) == 1:
+        return columns[0]
+
+    return list(zip(*columns, strict=True)) if columns else [() for _ in items]
+
+
+def sort_items[T](
+    items: Iterable[T],
+    order_query: list[str],
+) -> list[T]:
+    """Sort items by fields of the order query. Stable.
+
+    The same order, as stable sorts by each field from the last one. But keys are computed once and sorted once.
+    """
+    items_list = list(items)
+    sort_fields = parse_order_query(order_query)
+    if not sort_fields:
+        return items_list
+
+    keys = build_sort_keys(items_list, sort_fields)
+
+    order = sorted(range(len(items_list)), key=keys.__getitem__)
+    return list(map(items_list.__getitem__, order))
+
+
+def get_sort_key_parts(value: Any) -> SortKey:  # noqa: ANN401
+    normalized = normalize_sort_value(value)
+    return (MISSING, 0) if normalized is None else (PRESENT, normalized)
+
+
+def select_top[T](
+    items: Iterable[T],
+    order_query: list[str],
+    amount: int,
+) -> list[T]:
+    """Get first items in the order. Without the sort of all items.
+
+    The same result, as `sort_items` and the slice. But the memory is bounded by the amount.
+    """
+    sort_fields = parse_order_query(order_query)
+    directions = {sort_field.is_descending for sort_field in sort_fields}
+
+    # Note: Ranks for inverted keys need all items. So, tuples of plain keys are used, if possible.
+    if len(directions) <= 1:
+
+        def key_plain(item: T) -> SortKey:
+            return tuple(get_sort_key_parts(getattr(item, sort_field.name)) for sort_field in sort_fields)
+
+        if directions == {True}:
+            return heapq.nlargest(amount, items, key=key_plain)
+        return heapq.nsmallest(amount, items, key=key_plain)
+
+    descending = tuple(sort_field.is_descending for sort_field in sort_fields)
+
+    def key_composite(item: T) -> CompositeSortKey:
+        return CompositeSortKey(
+            values=tuple(get_sort_key_parts(getattr(item, sort_field.name)) for sort_field in sort_fields),
+            descending=descending,
+        )
+
+    return heapq.nsmallest(amount, items, key=key_composite)
+
+
+class CompositeSortKey:
+    """Sort key by several fields. Each field has own direction."""
+
+    __slots__ = ("descending", "values")
+
+    def __init__(self, values: SortKey, descending: tuple[bool, ...]) -> None:
+        self.values = values
+        self.descending = descending
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompositeSortKey):
+            return NotImplemented
+        return self.values == other.values
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __lt__(self, other: CompositeSortKey) -> bool:
+        for value, other_value, is_descending in zip(self.values, other.values, self.descending, strict=True):
+            if value == other_value:
+                continue
+            return bool(value > other_value) if is_descending else bool(value < other_value)
+
+        return False
@@ -0,0 +1,143 @@
+"""Timer of benchmarks with the baseline comparison.
+
+Results are stored in JSON. So, the baseline can be saved on one run and compared with on the next runs.
+Baselines are machine-specific. So, they are not committed.
+"""
+
+import os
+import pathlib
+import platform
+import statistics
+import time
+from typing import TYPE_CHECKING, Final
+
+import pytest
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+BENCHMARK_ENV: Final[str] = "PERSYVAL_I_BENCHMARK"
+BENCHMARK_SAVE_ENV: Final[str] = "PERSYVAL_I_BENCHMARK_SAVE"
+BENCHMARK_BASELINE_ENV: Final[str] = "PERSYVAL_I_BENCHMARK_BASELINE"
+BENCHMARK_THRESHOLD_ENV: Final[str] = "PERSYVAL_I_BENCHMARK_THRESHOLD"
+
+DEFAULT_BASELINE_PATH: Final[pathlib.Path] = pathlib.Path(".benchmarks") / "baseline.json"
+LATEST_RESULTS_FILE_NAME: Final[str] = "latest.json"
+
+DEFAULT_THRESHOLD: Final[float] = 0.5
+"""Allowed slowdown relative to the baseline. `0.5` means 50% slower."""
+
+DEFAULT_ROUNDS: Final[int] = 5
+DEFAULT_WARMUP_ROUNDS: Final[int] = 1
+
+
+def is_env_flag_set(name: str) -> bool:
+    return os.environ.get(name, "").lower() in {"1", "true", "yes"}
+
+
+class BenchmarkSettings(BaseModel):
+    is_enabled: bool
+    is_save: bool
+    baseline_path: pathlib.Path
+    threshold: float = Field(ge=0)
+
+    @classmethod
+    def from_env(cls) -> BenchmarkSettings:
+        return cls(
+            is_enabled=is_env_flag_set(BENCHMARK_ENV),
+            is_save=is_env_flag_set(BENCHMARK_SAVE_ENV),
+            baseline_path=pathlib.Path(os.environ.get(BENCHMARK_BASELINE_ENV) or DEFAULT_BASELINE_PATH),
+            threshold=float(os.environ.get(BENCHMARK_THRESHOLD_ENV) or DEFAULT_THRESHOLD),
+        )
+
+
+class BenchmarkResult(BaseModel):
+    rounds: int
+    min: float
+    median: float
+    """Compared with the baseline. Less sensitive to outliers, than the mean."""
+
+
+class BenchmarkResults(BaseModel):
+    python_version: str = Field(default_factory=platform.python_version)
+    machine: str = Field(default_factory=platform.machine)
+    results: dict[str, BenchmarkResult] = Field(default_factory=dict)
+
+    @classmethod
+    def read(cls, path: pathlib.Path) -> BenchmarkResults | None:
+        if not path.exists():
+            return None
+
+        return cls.model_validate_json(path.read_text(encoding="utf-8"))
+
+    def write(self, path: pathlib.Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.model_dump_json(indent=4), encoding="utf-8")
+
+
+def measure(
+    func: Callable[[], object],
+    *,
+    rounds: int = DEFAULT_ROUNDS,
+    warmup_rounds: int = DEFAULT_WARMUP_ROUNDS,
+) -> BenchmarkResult:
+    for _ in range(warmup_rounds):
+        func()
+
+    timings: list[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return BenchmarkResult(
+        rounds=rounds,
+        min=min(timings),
+        median=statistics.median(timings),
+    )
+
+
+class BenchmarkTimer:
+    """Measure the function and compare the result with the baseline.
+
+    Fails the test, if the median is slower than the baseline more than the threshold.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        settings: BenchmarkSettings,
+        baseline: BenchmarkResults | None,
+        results: BenchmarkResults,
+    ) -> None:
+        self._name = name
+        self._settings = settings
+        self._baseline = baseline
+        self._results = results
+
+    def __call__(
+        self,
+        func: Callable[[], object],
+        *,
+        rounds: int = DEFAULT_ROUNDS,
+        warmup_rounds: int = DEFAULT_WARMUP_ROUNDS,
+    ) -> BenchmarkResult:
+        result = measure(func, rounds=rounds, warmup_rounds=warmup_rounds)
+        self._results.results[self._name] = result
+
+        baseline_result = None if self._baseline is None else self._baseline.results.get(self._name)
+        # Note: Don't compare with the baseline, that is being replaced.
+        if baseline_result is None or self._settings.is_save:
+            return result
+
+        limit = baseline_result.median * (1 + self._settings.threshold)
+        if result.median > limit:
+            pytest.fail(
+                f"Benchmark `{self._name}` regressed: "
+                f"median {result.median:.6f}s > {limit:.6f}s "
+                f"(baseline {baseline_result.median:.6f}s, threshold {self._settings.threshold:.0%}).",
+            )
+
+        return result
@@ -0,0 +1,118 @@
+"""Performance benchmarks.
+
+Benchmarks are slow and machine-specific. So, they are skipped by default.
+
+Environment variables:
+- `PERSYVAL_I_BENCHMARK=1` - run benchmarks;
+- `PERSYVAL_I_BENCHMARK_SAVE=1` - save results as the new baseline;
+- `PERSYVAL_I_BENCHMARK_BASELINE` - path of the baseline file. Default: `.benchmarks/baseline.json`;
+- `PERSYVAL_I_BENCHMARK_THRESHOLD` - allowed slowdown relative to the baseline. Default: `0.5` (50%).
+
+Results of the last run are written next to the baseline, to `latest.json`.
+"""
+
+import functools
+import pathlib
+from typing import TYPE_CHECKING, Final
+
+import pytest
+
+from persyval.services.data_storage.convert_data_format import convert_data_format
+from persyval.services.data_storage.data_storage import DataFileFormat, DataStorage
+from persyval.services.data_storage_filler.data_storage_filler import fill_data_storage_by_path
+from persyval.tests.benchmarks.benchmark_timer import (
+    BENCHMARK_ENV,
+    LATEST_RESULTS_FILE_NAME,
+    BenchmarkResults,
+    BenchmarkSettings,
+    BenchmarkTimer,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+BENCHMARKS_DIR: Final[pathlib.Path] = pathlib.Path(__file__).parent
+
+BENCHMARK_SEED: Final[int] = 42
+"""The same data on each run. So, results are comparable."""
+
+BENCHMARK_SIZES: Final[tuple[int, ...]] = (1_000, 10_000)
+BENCHMARK_QUERY_SIZE: Final[int] = 10_000
+"""Size of the dataset for filtering, birthdays and export."""
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    if BenchmarkSettings.from_env().is_enabled:
+        return
+
+    skip = pytest.mark.skip(reason=f"Benchmarks are disabled. Set `{BENCHMARK_ENV}=1` to run them.")
+    for item in items:
+        if item.path.is_relative_to(BENCHMARKS_DIR):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def benchmark_results() -> Generator[BenchmarkResults]:
+    settings = BenchmarkSettings.from_env()
+
+    results = BenchmarkResults()
+    yield results
+
+    if not results.results:
+        return
+
+    results.write(settings.baseline_path.with_name(LATEST_RESULTS_FILE_NAME))
+
+    if settings.is_save:
+        # Note: Keep results of benchmarks, that are not run this time. For example, with `-k`.
+        baseline = BenchmarkResults.read(settings.baseline_path) or BenchmarkResults()
+        baseline.results.update(results.results)
+        results.model_copy(update={"results": baseline.results}).write(settings.baseline_path)
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline() -> BenchmarkResults | None:
+    return BenchmarkResults.read(BenchmarkSettings.from_env().baseline_path)
+
+
+@pytest.fixture
+def benchmark_timer(
+    request: pytest.FixtureRequest,
+    benchmark_results: BenchmarkResults,
+    benchmark_baseline: BenchmarkResults | None,
+) -> BenchmarkTimer:
+    return BenchmarkTimer(
+        name=request.node.name,
+        settings=BenchmarkSettings.from_env(),
+        baseline=benchmark_baseline,
+        results=benchmark_results,
+    )
+
+
+@pytest.fixture(scope="session")
+def storage_dir_factory(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[int, DataFileFormat], pathlib.Path]:
+    """Get the storage directory, filled with the seeded data. Created once per session."""
+
+    @functools.cache
+    def factory(amount: int, data_format: DataFileFormat) -> pathlib.Path:
+        dir_path = tmp_path_factory.mktemp(f"storage-{amount}-{data_format}")
+        fill_data_storage_by_path(
+            storage_dir=dir_path,
+            amount=amount,
+            seed=BENCHMARK_SEED,
+        )
+        if data_format != DataFileFormat.JSON:
+            convert_data_format(dir_path, data_format)
+        return dir_path
+
+    return factory
+
+
+@pytest.fixture(scope="session")
+def query_data_storage(
+    storage_dir_factory: Callable[[int, DataFileFormat], pathlib.Path],
+) -> Generator[DataStorage]:
+    with DataStorage.load(dir_path=storage_dir_factory(BENCHMARK_QUERY_SIZE, DataFileFormat.JSON)) as data_storage:
+        yield data_storage
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from persyval.services.data_storage.data_storage import DataFileFormat
+from persyval.tests.benchmarks.conftest import BENCHMARK_SIZES
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable
+
+    from persyval.tests.benchmarks.benchmark_timer import BenchmarkTimer
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        pytest.param("storage_stats", id="storage-stats"),
+        pytest.param("contacts_list default '' filter name=an", id="contacts-list-i-filter"),
+    ],
+)
+@pytest.mark.parametrize("amount", BENCHMARK_SIZES)
+def test_benchmark_chat_run_non_interactive(
+    benchmark_timer: BenchmarkTimer,
+    storage_dir_factory: Callable[[int, DataFileFormat], pathlib.Path],
+    amount: int,
+    command: str,
+) -> None:
+    """End-to-end latency of the command. Includes the start of the interpreter and the load of the storage."""
+    args = [
+        sys.executable,
+        "-m",
+        "persyval",
+        "chat",
+        "run",
+        "--storage-dir",
+        str(storage_dir_factory(amount, DataFileFormat.JSON)),
+        "--non-interactive",
+        "--raise-sys-exit-on-error",
+        "--hide-intro",
+        "--plain-render",
+        command,
+    ]
+
+    benchmark_timer(
+        lambda: subprocess.run(args, check=True, capture_output=True),  # noqa: S603
+        rounds=3,
+    )
@@ -0,0 +1,41 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from persyval.services.data_storage.data_storage import DataFileFormat, DataStorage
+from persyval.tests.benchmarks.conftest import BENCHMARK_SIZES
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable
+
+    from persyval.tests.benchmarks.benchmark_timer import BenchmarkTimer
+
+
+@pytest.mark.parametrize("data_format", list(DataFileFormat))
+@pytest.mark.parametrize("amount", BENCHMARK_SIZES)
+def test_benchmark_data_storage_load(
+    benchmark_timer: BenchmarkTimer,
+    storage_dir_factory: Callable[[int, DataFileFormat], pathlib.Path],
+    amount: int,
+    data_format: DataFileFormat,
+) -> None:
+    dir_path = storage_dir_factory(amount, data_format)
+
+    def load() -> None:
+        with DataStorage.load(dir_path=dir_path) as data_storage:
+            assert len(data_storage.data.contacts) == amount
+
+    benchmark_timer(load)
+
+
+@pytest.mark.parametrize("data_format", list(DataFileFormat))
+@pytest.mark.parametrize("amount", BENCHMARK_SIZES)
+def test_benchmark_data_storage_save(
+    benchmark_timer: BenchmarkTimer,
+    storage_dir_factory: Callable[[int, DataFileFormat], pathlib.Path],
+    amount: int,
+    data_format: DataFileFormat,
+) -> None:
+    with DataStorage.load(dir_path=storage_dir_factory(amount, data_format)) as data_storage:
+        benchmark_timer(data_storage.save)
@@ -0,0 +1,36 @@
+from typing import TYPE_CHECKING
+
+from persyval.services.export.export_items import write_to_csv, write_to_json, write_to_jsonl
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from persyval.services.data_storage.data_storage import DataStorage
+    from persyval.tests.benchmarks.benchmark_timer import BenchmarkTimer
+
+
+def test_benchmark_write_to_csv(
+    benchmark_timer: BenchmarkTimer,
+    query_data_storage: DataStorage,
+    tmp_path: pathlib.Path,
+) -> None:
+    path = tmp_path / "contacts.csv"
+    benchmark_timer(lambda: write_to_csv(items=query_data_storage.data.contacts.values(), path=path))
+
+
+def test_benchmark_write_to_json(
+    benchmark_timer: BenchmarkTimer,
+    query_data_storage: DataStorage,
+    tmp_path: pathlib.Path,
+) -> None:
+    path = tmp_path / "contacts.json"
+    benchmark_timer(lambda: write_to_json(items=query_data_storage.data.contacts.values(), path=path))
+
+
+def test_benchmark_write_to_jsonl(
+    benchmark_timer: BenchmarkTimer,
+    query_data_storage: DataStorage,
+    tmp_path: pathlib.Path,
+) -> None:
+    path = tmp_path / "contacts.jsonl"
+    benchmark_timer(lambda: write_to_jsonl(items=query_data_storage.data.contacts.values(), path=path))
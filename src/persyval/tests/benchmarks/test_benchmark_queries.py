@@ -0,0 +1,110 @@
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from persyval.models.contact import Contact
+from persyval.services.birthday.parse_and_format import format_birthday_for_edit_and_export
+from persyval.services.data_actions.contacts_get_upcoming_birthdays import contacts_get_upcoming_birthdays
+from persyval.services.handlers.shared.sort_and_filter import (
+    ListConfig,
+    ListFilterModeEnum,
+    ListOrderModeEnum,
+    filter_iterable,
+)
+
+if TYPE_CHECKING:
+    from persyval.services.data_storage.data_storage import DataStorage
+    from persyval.tests.benchmarks.benchmark_timer import BenchmarkTimer
+
+
+def get_first_birthday(data_storage: DataStorage) -> str:
+    for contact in data_storage.data.contacts.values():
+        if contact.birthday is not None:
+            return format_birthday_for_edit_and_export(contact.birthday)
+
+    msg = "There are no contacts with birthdays."
+    raise ValueError(msg)
+
+
+@pytest.mark.parametrize(
+    ("filter_query", "order_query"),
+    [
+        pytest.param({}, ["name"], id="all-i-sort-name"),
+        pytest.param({}, ["birthday", "-name"], id="all-i-sort-multi"),
+        pytest.param({"name": "an"}, [], id="partial-i-name"),
+        pytest.param({"phones": "55"}, [], id="partial-i-list-phones"),
+        pytest.param({"emails": "example"}, ["-name", "address"], id="partial-i-list-emails-i-sort-multi"),
+        pytest.param({}, ["-birthday", "name", "-address", "phones", "-emails"], id="all-i-sort-five"),
+    ],
+)
+def test_benchmark_filter_iterable(
+    benchmark_timer: BenchmarkTimer,
+    query_data_storage: DataStorage,
+    filter_query: dict[str, Any],
+    order_query: list[str],
+) -> None:
+    benchmark_filter_iterable(benchmark_timer, query_data_storage, filter_query, order_query)
+
+
+def test_benchmark_filter_iterable_i_exact(
+    benchmark_timer: BenchmarkTimer,
+    query_data_storage: DataStorage,
+) -> None:
+    # Note: Generated birthdays depend on the seed. So, take the real one.
+    filter_query = {"birthday": get_first_birthday(query_data_storage)}
+    benchmark_filter_iterable(benchmark_timer, query_data_storage, filter_query, [])
+
+
+@pytest.mark.parametrize(
+    "order_query",
+    [
+        pytest.param(["name"], id="sort-name"),
+        pytest.param(["birthday", "-name"], id="sort-multi"),
+    ],
+)
+def test_benchmark_filter_iterable_i_limit(
+    benchmark_timer: BenchmarkTimer,
+    query_data_storage: DataStorage,
+    order_query: list[str],
+) -> None:
+    benchmark_filter_iterable(benchmark_timer, query_data_storage, {}, order_query, limit=20)
+
+
+def benchmark_filter_iterable(
+    benchmark_timer: BenchmarkTimer,
+    data_storage: DataStorage,
+    filter_query: dict[str, Any],
+    order_query: list[str],
+    *,
+    limit: int | None = None,
+) -> None:
+    list_config = ListConfig(
+        filter_mode=ListFilterModeEnum.FILTER if filter_query else ListFilterModeEnum.ALL,
+        filter_query=filter_query,
+        order_mode=ListOrderModeEnum.CUSTOM if order_query else ListOrderModeEnum.DEFAULT,
+        order_query=order_query,
+        limit=limit,
+    )
+
+    benchmark_timer(
+        lambda: filter_iterable(
+            iterable=data_storage.data.contacts.values(),
+            model=Contact,
+            list_config=list_config,
+        ),
+    )
+
+
+@pytest.mark.parametrize("target_days", [7, 365])
+def test_benchmark_contacts_get_upcoming_birthdays(
+    benchmark_timer: BenchmarkTimer,
+    query_data_storage: DataStorage,
+    target_days: int,
+) -> None:
+    benchmark_timer(
+        lambda: contacts_get_upcoming_birthdays(
+            data_storage=query_data_storage,
+            target_days=target_days,
+            sort=True,
+        ),
+    )
@@ -0,0 +1,51 @@
+"""Shared fixtures and references of tests for lists: sort, filter and queries."""
+
+import datetime
+import uuid
+from typing import TYPE_CHECKING, Any, Final
+
+import pytest
+
+from persyval.services.data_storage.data_storage import DataStorage
+from persyval.services.data_storage_filler.data_storage_filler import fill_data_storage
+
+if TYPE_CHECKING:
+    from persyval.models.contact import Contact
+
+CONTACTS_SEEDS: Final[tuple[int, ...]] = (1, 2)
+CONTACTS_AMOUNT: Final[int] = 200
+
+
+@pytest.fixture(scope="session", params=CONTACTS_SEEDS, ids=lambda seed: f"seed-{seed}")
+def contacts_fixture(request: pytest.FixtureRequest) -> list[Contact]:
+    with DataStorage.load(dir_path=None) as data_storage:
+        fill_data_storage(data_storage=data_storage, amount=CONTACTS_AMOUNT, seed=request.param)
+        contacts = list(data_storage.data.contacts.values())
+
+    # Note: Copies have equal values in all fields, except uids. To check, that the order of equal items is kept.
+    return [*contacts, *(contact.model_copy(update={"uid": uuid.uuid7()}) for contact in contacts[::4])]
+
+
+def normalize_sort_value_i_reference(value: Any) -> Any:  # noqa: ANN401
+    """Normalization of the previous multi-pass sort. Dates were compared as formatted strings."""
+    if isinstance(value, str):
+        return value.lower()
+    if value is None:
+        return ""
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, list):
+        return [normalize_sort_value_i_reference(item) for item in value]  # pyright: ignore[reportUnknownVariableType]
+    return value
+
+
+def sort_items_i_reference(items: list[Contact], order_query: list[str]) -> list[Contact]:
+    """The previous multi-pass sort. One stable sort per field, from the last one."""
+    result = list(items)
+    for order_field in reversed(order_query):
+        field_name = order_field.lstrip("-")
+        result.sort(
+            key=lambda item: normalize_sort_value_i_reference(getattr(item, field_name)),
+            reverse=order_field.startswith("-"),
+        )
+    return result
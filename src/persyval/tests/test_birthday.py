@@ -2,7 +2,10 @@ import datetime
 from typing import cast
 
 import pytest
+from freezegun import freeze_time
 
+from persyval.models.contact import Contact
+from persyval.services.birthday.birthday_calendar import LEAP_MONTH_DAY, get_celebrated_month_days
 from persyval.services.birthday.get_nearest_anniversary import (
     birthday_in_year,
     get_nearest_anniversary,
@@ -15,6 +18,10 @@ from persyval.services.birthday.parse_and_format import (
     parse_birthday,
 )
 from persyval.services.birthday.validate_birthday import validate_birthday
+from persyval.services.data_actions.contact_add import contact_add
+from persyval.services.data_actions.contact_delete import contact_delete
+from persyval.services.data_actions.contacts_get_upcoming_birthdays import contacts_get_upcoming_birthdays
+from persyval.services.data_storage.data_storage import DataStorage, DataStorageMode
 
 DAYS_IN_YEAR = 365
 
@@ -239,3 +246,78 @@ def test_handle_weekend_birthday_invalid(invalid_input: object) -> None:
 )
 def test_validate_birthday_valid(birthday: object, expected: object) -> None:
     assert validate_birthday(cast("datetime.date | None", birthday)) == expected
+
+
+# Region: birthday calendar tests
+@pytest.mark.parametrize(
+    ("date", "expected"),
+    [
+        (datetime.date(2025, 2, 28), [(2, 28), LEAP_MONTH_DAY]),
+        (datetime.date(2024, 2, 28), [(2, 28)]),
+        (datetime.date(2024, 2, 29), [LEAP_MONTH_DAY]),
+        (datetime.date(2025, 3, 1), [(3, 1)]),
+    ],
+)
+def test_get_celebrated_month_days(date: datetime.date, expected: list[tuple[int, int]]) -> None:
+    assert get_celebrated_month_days(date) == expected
+
+
+@freeze_time("2025-02-25")
+@pytest.mark.parametrize("mode", [DataStorageMode.SNAPSHOT, DataStorageMode.SQLITE])
+def test_contacts_get_upcoming_birthdays(mode: DataStorageMode) -> None:
+    with DataStorage.load(dir_path=None, mode=mode) as data_storage:
+        for name, birthday in [
+            ("Before", datetime.date(1990, 2, 24)),
+            ("March", datetime.date(1990, 3, 1)),
+            ("Regular", datetime.date(1990, 2, 28)),
+            ("Leap", datetime.date(2000, 2, 29)),
+            ("Later", datetime.date(1990, 3, 10)),
+            ("Moved", datetime.date(1990, 2, 26)),
+            ("Unknown", None),
+        ]:
+            contact_add(data_storage, Contact(name=name, birthday=birthday))
+
+        # Note: Build indexes before mutations to check the incremental updates.
+        assert len(contacts_get_upcoming_birthdays(data_storage, 7)) == 4  # noqa: PLR2004
+
+        moved = next(contact for contact in data_storage.data.contacts.values() if contact.name == "Moved")
+        contact_delete(data_storage, moved.uid)
+
+        result = contacts_get_upcoming_birthdays(data_storage, 7)
+
+    assert [(item.name, item.congratulation_date, item.non_weekend_congratulation_date) for item in result] == [
+        ("Regular", datetime.date(2025, 2, 28), datetime.date(2025, 2, 28)),
+        ("Leap", datetime.date(2025, 2, 28), datetime.date(2025, 2, 28)),
+        ("March", datetime.date(2025, 3, 1), datetime.date(2025, 3, 3)),
+    ]
+
+
+@pytest.mark.parametrize("mode", [DataStorageMode.SNAPSHOT, DataStorageMode.SQLITE])
+@pytest.mark.parametrize("days", [365, 366])
+@pytest.mark.parametrize("current_date", [datetime.date(2026, 3, 2), datetime.date(2027, 2, 28)])
+def test_contacts_get_upcoming_birthdays_i_year_window(
+    mode: DataStorageMode,
+    days: int,
+    current_date: datetime.date,
+) -> None:
+    birthdays = {
+        "Today": datetime.date(1990, 3, 2),
+        "Yesterday": datetime.date(1990, 3, 1),
+        "Leap": datetime.date(2000, 2, 29),
+        "Regular": datetime.date(1990, 2, 28),
+    }
+
+    with freeze_time(current_date), DataStorage.load(dir_path=None, mode=mode) as data_storage:
+        for name, birthday in birthdays.items():
+            contact_add(data_storage, Contact(name=name, birthday=birthday))
+
+        result = contacts_get_upcoming_birthdays(data_storage, days, sort=True)
+
+    # Note: Each contact once. On the nearest anniversary, even if the window reaches the next one.
+    expected = sorted(
+        (name, anniversary)
+        for name, birthday in birthdays.items()
+        if ((anniversary := get_nearest_anniversary(birthday, current_date)) - current_date).days <= days
+    )
+    assert sorted((item.name, item.congratulation_date) for item in result) == expected
+    assert len(result) == len(birthdays)
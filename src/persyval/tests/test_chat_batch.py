@@ -0,0 +1,76 @@
+import io
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from rich.console import Console
+
+from persyval.services.chat.batch import BatchCommandStatus, main_batch, parse_batch_lines
+from persyval.services.data_storage.data_storage import DataStorage, DataStorageMode
+
+if TYPE_CHECKING:
+    import pathlib
+
+SCRIPT = """
+# Comment
+contact_add A1
+wrong_command
+
+contact_add A2
+exit true
+contact_add A3
+"""
+
+
+def test_parse_batch_lines() -> None:
+    commands = parse_batch_lines(SCRIPT.splitlines())
+
+    assert [(command.line_number, command.user_input) for command in commands] == [
+        (3, "contact_add A1"),
+        (4, "wrong_command"),
+        (6, "contact_add A2"),
+        (7, "exit true"),
+        (8, "contact_add A3"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("stop_on_error", "statuses", "names"),
+    [
+        (
+            False,
+            ["ok", "error", "ok", "ok", "skipped"],
+            ["A1", "A2"],
+        ),
+        (
+            True,
+            ["ok", "error", "skipped", "skipped", "skipped"],
+            ["A1"],
+        ),
+    ],
+)
+@pytest.mark.parametrize("storage_mode", [DataStorageMode.SNAPSHOT, DataStorageMode.JOURNAL, DataStorageMode.SQLITE])
+def test_main_batch(
+    tmp_path: pathlib.Path,
+    storage_mode: DataStorageMode,
+    stop_on_error: bool,  # noqa: FBT001
+    statuses: list[str],
+    names: list[str],
+) -> None:
+    with mock.patch.object(DataStorage, "save", autospec=True, side_effect=DataStorage.save) as save:
+        batch_result = main_batch(
+            lines=SCRIPT.splitlines(),
+            console=Console(file=io.StringIO()),
+            stop_on_error=stop_on_error,
+            storage_dir=tmp_path,
+            storage_mode=storage_mode,
+        )
+
+    assert [result.status for result in batch_result.results] == [BatchCommandStatus(status) for status in statuses]
+    assert not batch_result.is_successful
+
+    # Note: Once on the end of the batch. Not again on exit. The journal mode appends records instead.
+    assert save.call_count == (0 if storage_mode == DataStorageMode.JOURNAL else 1)
+
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        assert sorted(contact.name for contact in data_storage.data.contacts.values()) == names
@@ -0,0 +1,71 @@
+import asyncio
+import io
+from typing import TYPE_CHECKING
+
+import pytest
+from rich.console import Console
+
+from persyval.services.chat.parse_input_and_make_action import LoopAction, parse_input_and_make_action_async
+from persyval.services.data_storage.data_storage import DataStorage, DataStorageMode
+from persyval.services.data_storage_filler.data_storage_filler import fill_data_storage
+from persyval.services.execution_queue.execution_queue import create_execution_queue
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture(params=[DataStorageMode.SNAPSHOT, DataStorageMode.SQLITE])
+def data_storage_fixture(request: pytest.FixtureRequest) -> Generator[DataStorage]:
+    with DataStorage.load(dir_path=None, mode=request.param) as data_storage:
+        yield data_storage
+
+
+def run_command(data_storage: DataStorage, user_input: str) -> tuple[LoopAction, str]:
+    output = io.StringIO()
+    console = Console(file=output, width=120)
+
+    execution_queue = create_execution_queue()
+    execution_queue.put(user_input)
+
+    loop_action = asyncio.run(
+        parse_input_and_make_action_async(
+            console=console,
+            data_storage=data_storage,
+            execution_queue=execution_queue,
+            non_interactive=True,
+            plain_render=True,
+            terminal_simplified=True,
+        ),
+    )
+    return loop_action, output.getvalue()
+
+
+def test_chat_engine_i_async_handler(data_storage_fixture: DataStorage) -> None:
+    amount = 3
+    fill_data_storage(data_storage=data_storage_fixture, amount=amount, seed=1)
+
+    loop_action, output = run_command(data_storage_fixture, "storage_stats")
+
+    assert loop_action == LoopAction.CONTINUE
+    assert f"Contacts │ {amount}" in output
+
+
+def test_chat_engine_i_sync_handler(
+    data_storage_fixture: DataStorage,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    fill_data_storage(data_storage=data_storage_fixture, amount=3, seed=1)
+    capsys.readouterr()
+
+    loop_action, _ = run_command(data_storage_fixture, "contacts_list default '' all ''")
+
+    assert loop_action == LoopAction.CONTINUE
+    # Note: Plain render is printed to stdout. From the worker thread.
+    assert capsys.readouterr().out.split() == [str(uid) for uid in data_storage_fixture.data.contacts]
+
+
+def test_chat_engine_i_invalid_command(data_storage_fixture: DataStorage) -> None:
+    loop_action, output = run_command(data_storage_fixture, "wrong_command")
+
+    assert loop_action == LoopAction.CONTINUE
+    assert "InvalidCommandError" in output
@@ -1,5 +1,7 @@
+from persyval.services.commands.args_config import ArgsConfig
 from persyval.services.commands.commands_enum import COMMANDS_ORDER, Command
 from persyval.services.commands.commands_meta_registry import COMMANDS_META_REGISTRY
+from persyval.services.handlers_base.handler_base import HandlerBase
 
 
 def test_command_registry_add_command() -> None:
@@ -16,3 +18,10 @@ def test_commands_order() -> None:
 
     difference = all_keys - used_keys
     assert len(difference) == 0, [str(item) for item in difference]
+
+
+def test_commands_meta_registry_i_paths_resolve() -> None:
+    for command_meta in COMMANDS_META_REGISTRY.values():
+        assert issubclass(command_meta.get_handler(), HandlerBase), command_meta.handler_path
+        if command_meta.args_config_path is not None:
+            assert isinstance(command_meta.get_args_config(), ArgsConfig), command_meta.args_config_path
@@ -1,4 +1,5 @@
 import copy
+import datetime
 from typing import TYPE_CHECKING
 
 import pytest
@@ -10,17 +11,17 @@ from persyval.services.data_actions.contact_delete import contact_delete
 from persyval.services.data_actions.contact_get import contact_get
 from persyval.services.data_actions.contact_update import contact_update
 from persyval.services.data_actions.contacts_list import contacts_list
-from persyval.services.data_storage.data_storage import DataStorage
+from persyval.services.data_storage.data_storage import DataStorage, DataStorageMode
 from persyval.services.handlers.shared.sort_and_filter import ListConfig, ListFilterModeEnum, ListOrderModeEnum
 
 if TYPE_CHECKING:
     from collections.abc import Generator
 
 
-@pytest.fixture
-def data_storage_fixture() -> Generator[DataStorage]:
+@pytest.fixture(params=[DataStorageMode.SNAPSHOT, DataStorageMode.SQLITE])
+def data_storage_fixture(request: pytest.FixtureRequest) -> Generator[DataStorage]:
     # https://docs.pytest.org/en/stable/how-to/fixtures.html#yield-fixtures-recommended
-    with DataStorage.load(dir_path=None) as data_storage:
+    with DataStorage.load(dir_path=None, mode=request.param) as data_storage:
         yield data_storage
 
 
@@ -153,3 +154,92 @@ def test_contact_i_add_i_get_i_remove(
         ),
     )
     assert contacts_amount_end == contacts_amount_after_add_all - 1
+
+
+@pytest.mark.parametrize(
+    ("filter_query", "expected_names"),
+    [
+        ({"name": "ali"}, ["Alice", "Alina"]),
+        ({"name": "li"}, ["Alice", "Alina"]),
+        ({"name": "ALINA"}, ["Alina"]),
+        ({"name": "lic"}, ["Alice"]),
+        ({"name": "alic", "address": "lviv"}, []),
+        ({"phone": "73"}, ["Alice", "Alina"]),
+        ({"email": "bob@"}, ["Bob"]),
+        ({"birthday": "1990-01-01"}, ["Alice"]),
+        ({"name": "ali", "address": "kyiv"}, ["Alina"]),
+        ({"name": "nobody"}, []),
+        ({"address": "yi"}, ["Alina"]),
+    ],
+)
+def test_contacts_list_i_filter(
+    data_storage_fixture: DataStorage,
+    filter_query: dict[str, str],
+    expected_names: list[str],
+) -> None:
+    for contact in [
+        Contact(name="Alice", birthday=datetime.date(1990, 1, 1), phones=["+380730000001"]),
+        Contact(name="Bob", address="Lviv", emails=["bob@example.com"]),
+        Contact(name="Alina", address="Kyiv", phones=["+380731111111"]),
+    ]:
+        contact_add(data_storage=data_storage_fixture, contact=contact)
+
+    contacts = contacts_list(
+        data_storage=data_storage_fixture,
+        list_config=ListConfig(
+            order_mode=ListOrderModeEnum.DEFAULT,
+            filter_mode=ListFilterModeEnum.FILTER,
+            filter_query=filter_query,
+        ),
+    )
+
+    assert [contact.name for contact in contacts] == expected_names
+
+
+def test_contacts_list_i_filter_by_uid(
+    data_storage_fixture: DataStorage,
+) -> None:
+    contact = contact_add(data_storage=data_storage_fixture, contact=Contact(name="Unique"))
+    contact_add(data_storage=data_storage_fixture, contact=Contact(name="Other"))
+
+    contacts = contacts_list(
+        data_storage=data_storage_fixture,
+        list_config=ListConfig(
+            order_mode=ListOrderModeEnum.DEFAULT,
+            filter_mode=ListFilterModeEnum.FILTER,
+            filter_query={"uid": str(contact.uid).upper()},
+        ),
+    )
+
+    assert contacts == [contact]
+
+
+def test_contacts_list_i_filter_i_after_update_and_delete(
+    data_storage_fixture: DataStorage,
+) -> None:
+    def get_names_by_phone(phone: str) -> list[str]:
+        contacts = contacts_list(
+            data_storage=data_storage_fixture,
+            list_config=ListConfig(
+                order_mode=ListOrderModeEnum.DEFAULT,
+                filter_mode=ListFilterModeEnum.FILTER,
+                filter_query={"phones": phone},
+            ),
+        )
+        return [contact.name for contact in contacts]
+
+    alice = contact_add(data_storage=data_storage_fixture, contact=Contact(name="Alice", phones=["+380730000001"]))
+    contact_add(data_storage=data_storage_fixture, contact=Contact(name="Bob", phones=["+380730000001"]))
+
+    assert get_names_by_phone("+380730000001") == ["Alice", "Bob"]
+
+    alice_updated = copy.deepcopy(alice)
+    alice_updated.phones = ["+380730000002"]
+    contact_update(data_storage=data_storage_fixture, contact=alice_updated)
+
+    assert get_names_by_phone("+380730000001") == ["Bob"]
+    assert get_names_by_phone("+380730000002") == ["Alice"]
+
+    contact_delete(data_storage=data_storage_fixture, contact_uid=alice.uid)
+
+    assert get_names_by_phone("+380730000002") == []
@@ -1,11 +1,41 @@
+import json
+import os
+import time
 from typing import TYPE_CHECKING
 
 import pytest
 
-from persyval.services.data_storage.data_storage import DataStorage
-from persyval.services.data_storage_filler.data_storage_filler import fill_data_storage
+from persyval.exceptions.main import AlreadyExistsError, InvalidDataError
+from persyval.models.contact import Contact
+from persyval.models.note import Note
+from persyval.services.data_actions.contact_add import contact_add
+from persyval.services.data_actions.contact_delete import contact_delete
+from persyval.services.data_actions.contact_get import contact_get
+from persyval.services.data_actions.contacts_add_many import contacts_add_many
+from persyval.services.data_actions.note_add import note_add
+from persyval.services.data_actions.note_update import note_update
+from persyval.services.data_storage.binary_data_file import CONTACT_SCHEMA, SECTION_MODELS, validate_model_schema
+from persyval.services.data_storage.convert_data_format import convert_data_format
+from persyval.services.data_storage.data_file import DIGEST_SIZE
+from persyval.services.data_storage.data_storage import (
+    BINARY_DATA_FILE_NAME,
+    DATA_FILE_NAME,
+    JOURNAL_COMPACTION_MIN_RECORDS,
+    DataFileFormat,
+    DataStorage,
+    DataStorageMode,
+)
+from persyval.services.data_storage.debounced_writer import DebouncedWriter
+from persyval.services.data_storage.lazy_section import LazySection
+from persyval.services.data_storage_filler.data_storage_filler import (
+    COMMON_TAGS,
+    FillProfile,
+    fill_data_storage,
+    fill_data_storage_by_path,
+)
 
 if TYPE_CHECKING:
+    import pathlib
     from collections.abc import Generator
 
 
@@ -31,3 +61,354 @@ def test_data_storage_clear(
     data_storage_fixture.clear()
     assert len(data_storage_fixture.data.contacts) == 0
     assert len(data_storage_fixture.data.notes) == 0
+
+
+def test_data_storage_i_journal_mode(tmp_path: pathlib.Path) -> None:
+    with DataStorage.load(dir_path=tmp_path, mode=DataStorageMode.JOURNAL) as data_storage:
+        contact = contact_add(data_storage=data_storage, contact=Contact(name="Journal"))
+        note = note_add(data_storage=data_storage, note=Note(content="Journal note", tags=[]))
+        note_update(data_storage, note.uid, "Title", "Updated note", ["tag"])
+        contact_delete(data_storage=data_storage, contact_uid=contact.uid)
+
+        journal_path = data_storage.get_journal_path()
+
+    assert not (tmp_path / DATA_FILE_NAME).exists()
+    assert len(journal_path.read_text(encoding="utf-8").splitlines()) == 4  # noqa: PLR2004
+
+    # Note: Emulate a crash during the append.
+    with journal_path.open("a", encoding="utf-8") as file:
+        file.write('{"kind": "clear"')
+
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        assert not data_storage.data.contacts
+        assert data_storage.data.notes[note.uid].content == "Updated note"
+
+    # Snapshot mode folds the journal into the data file.
+    assert not journal_path.exists()
+
+    with DataStorage.load(dir_path=tmp_path, mode=DataStorageMode.JOURNAL) as data_storage:
+        assert data_storage.data.notes[note.uid].tags == ["tag"]
+
+
+@pytest.mark.parametrize(
+    ("field_name", "value"),
+    [
+        ("name", None),
+        ("phones", ["invalid"]),
+    ],
+)
+def test_data_storage_i_journal_mode_i_corrupted_record(
+    tmp_path: pathlib.Path,
+    field_name: str,
+    value: object,
+) -> None:
+    with DataStorage.load(dir_path=tmp_path, mode=DataStorageMode.JOURNAL) as data_storage:
+        for name in "ABCD":
+            contact_add(data_storage=data_storage, contact=Contact(name=name))
+
+        journal_path = data_storage.get_journal_path()
+
+    lines = journal_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    record = json.loads(lines[1])
+    record["contact"][field_name] = value
+    lines[1] = json.dumps(record) + "\n"
+    journal_text = "".join(lines)
+    journal_path.write_text(journal_text, encoding="utf-8")
+
+    with pytest.raises(InvalidDataError, match="Journal is corrupted"):
+        DataStorage.load(dir_path=tmp_path, mode=DataStorageMode.JOURNAL)
+
+    assert journal_path.read_text(encoding="utf-8") == journal_text
+
+
+def test_data_storage_i_journal_mode_i_compaction(tmp_path: pathlib.Path) -> None:
+    with DataStorage.load(dir_path=tmp_path, mode=DataStorageMode.JOURNAL) as data_storage:
+        for index in range(JOURNAL_COMPACTION_MIN_RECORDS):
+            note_add(data_storage=data_storage, note=Note(content=f"Note {index}", tags=[]))
+
+        journal_path = data_storage.get_journal_path()
+
+    assert not journal_path.exists()
+
+    with DataStorage.load(dir_path=tmp_path, mode=DataStorageMode.JOURNAL) as data_storage:
+        assert len(data_storage.data.notes) == JOURNAL_COMPACTION_MIN_RECORDS
+
+
+def test_data_storage_i_sqlite_mode(tmp_path: pathlib.Path) -> None:
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        contact = contact_add(data_storage=data_storage, contact=Contact(name="From JSON"))
+
+    with DataStorage.load(dir_path=tmp_path, mode=DataStorageMode.SQLITE) as data_storage:
+        assert data_storage.data.contacts[contact.uid] == contact
+
+        note = note_add(data_storage=data_storage, note=Note(content="SQLite note", tags=["a", "b"]))
+        note_update(data_storage, note.uid, "Title", "Updated note", ["c"])
+
+    # The mode is detected by the directory.
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        assert data_storage.mode == DataStorageMode.SQLITE
+        assert data_storage.data.notes[note.uid].tags == ["c"]
+        assert [item.name for item in data_storage.get_stats()] == ["Contacts", "Notes"]
+        assert [item.amount for item in data_storage.get_stats()] == [1, 1]
+
+        data_storage.clear()
+
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        assert not data_storage.data.contacts
+        assert not data_storage.data.notes
+
+    with pytest.raises(InvalidDataError):
+        DataStorage.load(dir_path=tmp_path, mode=DataStorageMode.SNAPSHOT)
+
+
+def test_data_storage_i_lazy_load(tmp_path: pathlib.Path) -> None:
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        fill_data_storage(data_storage=data_storage, amount=5)
+        contacts = list(data_storage.data.contacts.values())
+        notes = list(data_storage.data.notes.values())
+
+    data_path = tmp_path / DATA_FILE_NAME
+
+    with DataStorage.load(dir_path=tmp_path, lazy=True) as data_storage:
+        assert isinstance(data_storage.data.contacts, LazySection)
+        assert contact_get(data_storage=data_storage, uid=contacts[2].uid) == contacts[2]
+        assert list(data_storage.data.notes.values()) == notes
+
+    # Note: Nothing is changed. So, the data file is not rewritten.
+    mtime_ns = data_path.stat().st_mtime_ns
+    with DataStorage.load(dir_path=tmp_path, lazy=True) as data_storage:
+        assert len(data_storage.data.contacts) == len(contacts)
+    assert data_path.stat().st_mtime_ns == mtime_ns
+
+    with DataStorage.load(dir_path=tmp_path, lazy=True) as data_storage:
+        contact_delete(data_storage=data_storage, contact_uid=contacts[0].uid)
+        new_contact = contact_add(data_storage=data_storage, contact=Contact(name="Lazy"))
+        note_update(data_storage, notes[1].uid, "Title", "Updated lazily", [])
+        assert len(data_storage.data.contacts) == len(contacts)
+
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        assert list(data_storage.data.contacts.values()) == [*contacts[1:], new_contact]
+        assert data_storage.data.notes[notes[1].uid].content == "Updated lazily"
+
+
+def test_data_storage_i_trusted_load(tmp_path: pathlib.Path) -> None:
+    # Note: Invalid phone can't get into the data file in a usual way. So, it shows, that validation is skipped.
+    contact = Contact.model_construct(**{**Contact(name="Trusted").model_dump(), "phones": ["invalid"]})
+
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        data_storage.data.contacts[contact.uid] = contact
+
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        assert data_storage.data.contacts[contact.uid].phones == ["invalid"]
+
+    # Note: The data file is changed outside of persyval. So, it is validated.
+    data_path = tmp_path / DATA_FILE_NAME
+    data_path.write_text(data_path.read_text().replace("Trusted", "Foreign"))
+
+    with pytest.raises(InvalidDataError):
+        DataStorage.load(dir_path=tmp_path)
+
+
+@pytest.mark.parametrize(
+    ("mode", "lazy"),
+    [(DataStorageMode.SNAPSHOT, True), (DataStorageMode.SQLITE, False)],
+)
+def test_data_storage_i_trusted_read(tmp_path: pathlib.Path, mode: DataStorageMode, lazy: bool) -> None:  # noqa: FBT001
+    # Note: Invalid phone passes only if the validators are skipped. Items are read from the file, not from memory.
+    contact = Contact.model_construct(**{**Contact(name="Trusted").model_dump(), "phones": ["invalid"]})
+
+    with DataStorage.load(dir_path=tmp_path, mode=mode) as data_storage:
+        data_storage.data.contacts[contact.uid] = contact
+
+    with DataStorage.load(dir_path=tmp_path, mode=mode, lazy=lazy) as data_storage:
+        contacts = data_storage.data.contacts
+        assert isinstance(contacts, LazySection) == lazy
+
+        # Note: Before the access by the key. So, the lazy section reads the file, not the materialized item.
+        assert [item.phones for item in contacts.values()] == [["invalid"]]
+        assert contacts[contact.uid].phones == ["invalid"]
+
+
+def test_data_storage_i_lazy_load_i_edited_file(tmp_path: pathlib.Path) -> None:
+    contact = Contact.model_construct(**{**Contact(name="Trusted").model_dump(), "phones": ["invalid"]})
+
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        data_storage.data.contacts[contact.uid] = contact
+
+    # Note: The same size and mtime. So, only the digest shows, that the data file is changed outside of persyval.
+    data_path = tmp_path / DATA_FILE_NAME
+    stat = data_path.stat()
+    data_path.write_text(data_path.read_text().replace("Trusted", "Foreign"))
+    os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    with pytest.raises(InvalidDataError):
+        DataStorage.load(dir_path=tmp_path, lazy=True)
+
+
+def test_data_storage_i_background_save(tmp_path: pathlib.Path) -> None:
+    data_path = tmp_path / DATA_FILE_NAME
+
+    # Note: The window is longer than the test. So, only the exit writes the data.
+    with DataStorage.load(dir_path=tmp_path, save_window=60) as data_storage:
+        contacts = [contact_add(data_storage=data_storage, contact=Contact(name=f"Test {i}")) for i in range(3)]
+        assert not data_path.exists()
+
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        assert list(data_storage.data.contacts.values()) == contacts
+
+
+def test_debounced_writer() -> None:
+    writes: list[float] = []
+    writer = DebouncedWriter(write=lambda: writes.append(time.monotonic()), window=0.05)
+
+    for _ in range(3):
+        writer.request()
+
+    deadline = time.monotonic() + 5
+    while not writes and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert writer.stop() is False
+    assert len(writes) == 1
+
+
+def test_data_storage_i_binary_format(tmp_path: pathlib.Path) -> None:
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        fill_data_storage(data_storage=data_storage, amount=5)
+        note_add(data_storage=data_storage, note=Note(content="No tags", tags=None))
+        contacts = list(data_storage.data.contacts.values())
+        notes = list(data_storage.data.notes.values())
+
+    assert convert_data_format(tmp_path, DataFileFormat.BINARY)
+    assert not (tmp_path / DATA_FILE_NAME).exists()
+
+    with pytest.raises(InvalidDataError):
+        DataStorage.load(dir_path=tmp_path, data_format=DataFileFormat.JSON)
+
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        assert data_storage.data_format == DataFileFormat.BINARY
+        assert list(data_storage.data.contacts.values()) == contacts
+        assert list(data_storage.data.notes.values()) == notes
+
+        new_contact = contact_add(data_storage=data_storage, contact=Contact(name="Binary"))
+
+    assert convert_data_format(tmp_path, DataFileFormat.JSON)
+    assert not (tmp_path / BINARY_DATA_FILE_NAME).exists()
+
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        assert list(data_storage.data.contacts.values()) == [*contacts, new_contact]
+        assert list(data_storage.data.notes.values()) == notes
+
+
+def test_data_storage_i_binary_format_i_corrupted(tmp_path: pathlib.Path) -> None:
+    with DataStorage.load(dir_path=tmp_path, data_format=DataFileFormat.BINARY) as data_storage:
+        contact_add(data_storage=data_storage, contact=Contact(name="Binary"))
+
+    data_path = tmp_path / BINARY_DATA_FILE_NAME
+    content = bytearray(data_path.read_bytes())
+    content[-DIGEST_SIZE - 1] ^= 0xFF
+    data_path.write_bytes(content)
+
+    with pytest.raises(InvalidDataError):
+        DataStorage.load(dir_path=tmp_path)
+
+
+def test_data_storage_i_binary_format_i_truncated(tmp_path: pathlib.Path) -> None:
+    with DataStorage.load(dir_path=tmp_path, data_format=DataFileFormat.BINARY) as data_storage:
+        fill_data_storage(data_storage=data_storage, amount=5)
+
+    data_path = tmp_path / BINARY_DATA_FILE_NAME
+    content = data_path.read_bytes()
+    # Note: Without the part of the last item. So, its lengths point past the data.
+    data_path.write_bytes(content[: -DIGEST_SIZE - 10] + content[-DIGEST_SIZE:])
+
+    with pytest.raises(InvalidDataError, match="corrupted"):
+        DataStorage.load(dir_path=tmp_path)
+
+
+def test_binary_data_file_i_schemas_cover_models() -> None:
+    for model, schema in SECTION_MODELS:
+        assert [field_name for field_name, _ in schema] == list(model.model_fields)
+
+
+def test_binary_data_file_i_schema_drift() -> None:
+    # Note: Like the schema, that is not updated after the new field of the model.
+    schema = tuple((field_name, codec) for field_name, codec in CONTACT_SCHEMA if field_name != "birthday")
+
+    with pytest.raises(TypeError, match="doesn't match"):
+        validate_model_schema(Contact, schema)
+
+
+def test_data_storage_i_transaction(tmp_path: pathlib.Path) -> None:
+    data_path = tmp_path / DATA_FILE_NAME
+
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        with data_storage.transaction():
+            contacts = contacts_add_many(
+                data_storage=data_storage,
+                contacts=[Contact(name=f"Test {i}") for i in range(3)],
+            )
+            with data_storage.transaction():
+                note = note_add(data_storage=data_storage, note=Note(content="Test", tags=[]))
+
+            assert not data_path.exists()
+
+        assert data_path.exists()
+
+        with pytest.raises(AlreadyExistsError):
+            contacts_add_many(data_storage=data_storage, contacts=[Contact(name="New"), contacts[0]])
+
+        assert list(data_storage.data.contacts.values()) == contacts
+
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        assert list(data_storage.data.contacts.values()) == contacts
+        assert list(data_storage.data.notes.values()) == [note]
+
+
+def test_data_storage_i_transaction_i_rollback(tmp_path: pathlib.Path) -> None:
+    with DataStorage.load(dir_path=tmp_path, mode=DataStorageMode.SQLITE) as data_storage:
+        contact = contact_add(data_storage=data_storage, contact=Contact(name="Kept"))
+
+        def add_and_fail() -> None:
+            with data_storage.transaction():
+                contacts_add_many(data_storage=data_storage, contacts=[Contact(name="Discarded")])
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            add_and_fail()
+
+        assert list(data_storage.data.contacts.values()) == [contact]
+
+
+def test_fill_data_storage_i_workers() -> None:
+    def get_names(workers: int) -> tuple[list[str], list[str]]:
+        with DataStorage.load(dir_path=None) as data_storage:
+            fill_data_storage(data_storage=data_storage, amount=5, workers=workers, seed=42)
+            return (
+                [contact.name for contact in data_storage.data.contacts.values()],
+                [note.content for note in data_storage.data.notes.values()],
+            )
+
+    # Note: The same seed gives the same data. Regardless of the amount of workers.
+    assert get_names(workers=1) == get_names(workers=2)
+
+
+def test_fill_data_storage_i_seed_i_identical_data_file(tmp_path: pathlib.Path) -> None:
+    for dir_name in ("first", "second"):
+        fill_data_storage_by_path(storage_dir=tmp_path / dir_name, amount=5, seed=7)
+
+    assert (tmp_path / "first" / DATA_FILE_NAME).read_bytes() == (tmp_path / "second" / DATA_FILE_NAME).read_bytes()
+
+
+def test_fill_data_storage_i_profile() -> None:
+    with DataStorage.load(dir_path=None) as data_storage:
+        fill_data_storage(
+            data_storage=data_storage,
+            amount=20,
+            seed=7,
+            profile=FillProfile(birthday_share=1, long_note_share=1, common_tag_share=1),
+        )
+
+        assert all(contact.birthday for contact in data_storage.data.contacts.values())
+        assert all(note.content.count("\n\n") for note in data_storage.data.notes.values())
+        assert {tag for note in data_storage.data.notes.values() for tag in note.tags or []} <= set(COMMON_TAGS)
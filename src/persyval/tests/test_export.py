@@ -0,0 +1,87 @@
+import csv
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from persyval.exceptions.main import NotFoundError
+from persyval.models.contact import Contact
+from persyval.services.data_storage.data_storage import DataStorage
+from persyval.services.data_storage.lazy_section import LazySection
+from persyval.services.data_storage_filler.data_storage_filler import fill_data_storage
+from persyval.services.export import export_items
+from persyval.services.export.export_items import write_to_csv, write_to_json, write_to_jsonl
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable, Iterator
+
+
+def iterate_contacts(amount: int) -> Iterator[Contact]:
+    """One-shot iterable. Like the scan of the storage."""
+    with DataStorage.load(dir_path=None) as data_storage:
+        fill_data_storage(data_storage=data_storage, amount=amount, seed=1)
+        yield from data_storage.data.contacts.values()
+
+
+@pytest.mark.parametrize("amount", [0, 1, 5])
+def test_write_to_json_i_same_as_dump_at_once(tmp_path: pathlib.Path, amount: int) -> None:
+    contacts = list(iterate_contacts(amount))
+    path = tmp_path / "contacts.json"
+
+    assert write_to_json(items=iter(contacts), path=path) == amount
+
+    expected = json.dumps([item.model_dump(mode="json") for item in contacts], indent=4, ensure_ascii=False)
+    assert path.read_text(encoding="utf-8") == expected
+
+
+def test_write_to_jsonl(tmp_path: pathlib.Path) -> None:
+    amount = 5
+    contacts = list(iterate_contacts(amount))
+    path = tmp_path / "contacts.jsonl"
+
+    assert write_to_jsonl(items=iter(contacts), path=path) == amount
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [Contact.model_validate_json(line) for line in lines] == contacts
+
+
+def test_write_to_csv(tmp_path: pathlib.Path) -> None:
+    amount = 5
+    path = tmp_path / "contacts.csv"
+
+    assert write_to_csv(iterate_contacts(amount), path) == amount
+
+    with path.open(encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == amount
+
+    with pytest.raises(NotFoundError):
+        write_to_csv(iterate_contacts(0), path)
+
+
+@pytest.mark.parametrize("writer", [write_to_json, write_to_jsonl, write_to_csv])
+def test_write_i_progress(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    writer: Callable[..., int],
+) -> None:
+    monkeypatch.setattr(export_items, "EXPORT_PROGRESS_STEP", 2)
+    amounts: list[int] = []
+
+    writer(items=iterate_contacts(5), path=tmp_path / "contacts", on_progress=amounts.append)
+
+    assert amounts == [2, 4, 5]
+
+
+def test_lazy_section_i_values_i_not_kept_in_memory(tmp_path: pathlib.Path) -> None:
+    amount = 5
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        fill_data_storage(data_storage=data_storage, amount=amount, seed=1)
+
+    with DataStorage.load(dir_path=tmp_path, lazy=True) as data_storage:
+        contacts = data_storage.data.contacts
+        assert isinstance(contacts, LazySection)
+
+        assert write_to_jsonl(items=contacts.values(), path=tmp_path / "contacts.jsonl") == amount
+        assert not contacts._materialized  # noqa: SLF001
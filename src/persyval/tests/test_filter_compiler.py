@@ -0,0 +1,82 @@
+from typing import Any
+
+import pytest
+
+from persyval.models.contact import Contact
+from persyval.services.handlers.shared.sort_and_filter import compile_filter, compile_filter_cached
+from persyval.services.model_meta.field_meta import FilterMode
+
+
+def matches_i_reference(item: Contact, filter_query: dict[str, str]) -> bool:
+    """Interpretation of the normalized query. Like the filter before the compilation."""
+    registry = Contact.get_meta_info().fields_meta_config.get_fields_meta_registry()
+    for field_name, filter_value in filter_query.items():
+        field = registry[field_name]
+        value = getattr(item, field_name)
+        if value is None:
+            return False
+
+        values = value if field.is_list_based else [value]
+        if field.filter_mode == FilterMode.EXACT:
+            is_good = any(filter_value == str(part).lower() for part in values)
+        else:
+            is_good = any(filter_value in str(part).lower() for part in values)
+
+        if not is_good:
+            return False
+
+    return True
+
+
+@pytest.mark.parametrize(
+    "filter_query",
+    [
+        {},
+        {"name": "An"},
+        {"name": "a", "address": "st"},
+        {"phone": "55"},
+        {"emails": "example", "name": "e", "address": "a"},
+    ],
+)
+def test_compile_filter_i_same_as_interpretation(
+    contacts_fixture: list[Contact],
+    filter_query: dict[str, Any],
+) -> None:
+    compiled = compile_filter(Contact, filter_query)
+
+    expected = [contact for contact in contacts_fixture if matches_i_reference(contact, compiled.filter_query)]
+    assert [contact for contact in contacts_fixture if compiled.predicate(contact)] == expected
+    assert expected
+
+
+def test_compile_filter_i_exact_uid(contacts_fixture: list[Contact]) -> None:
+    contact = contacts_fixture[5]
+
+    predicate = compile_filter(Contact, {"uid": str(contact.uid).upper()}).predicate
+
+    assert [item for item in contacts_fixture if predicate(item)] == [contact]
+
+
+def test_compile_filter_i_exact_birthday(contacts_fixture: list[Contact]) -> None:
+    birthday = next(contact.birthday for contact in contacts_fixture if contact.birthday is not None)
+
+    predicate = compile_filter(Contact, {"birthday": str(birthday)}).predicate
+
+    matched = [item for item in contacts_fixture if predicate(item)]
+    assert matched
+    assert all(item.birthday == birthday for item in matched)
+
+
+def test_compile_filter_i_cached() -> None:
+    compile_filter_cached.cache_clear()
+
+    compiled = compile_filter(Contact, {"name": "Test"})
+
+    assert compiled.filter_query == {"name": "test"}
+    assert compile_filter(Contact, {"name": "Test"}) is compiled
+    assert compile_filter_cached.cache_info().hits == 1
+
+
+def test_compile_filter_i_unknown_field() -> None:
+    with pytest.raises(KeyError, match="not allowed"):
+        compile_filter(Contact, {"unknown": "value"})
@@ -0,0 +1,142 @@
+import io
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from persyval.exceptions.main import InvalidDataError, NotFoundError
+from persyval.models.contact import Contact
+from persyval.services.data_actions.contacts_import import contacts_import
+from persyval.services.data_actions.notes_import import notes_import
+from persyval.services.data_storage.data_storage import DataStorage, DataStorageMode
+from persyval.services.data_storage_filler.data_storage_filler import fill_data_storage
+from persyval.services.export.export_items import write_to_csv, write_to_json, write_to_jsonl
+from persyval.services.import_items import import_items
+from persyval.services.import_items.import_items import iterate_json_array
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable
+
+WRITERS: dict[str, Callable[..., int]] = {
+    "csv": write_to_csv,
+    "json": write_to_json,
+    "jsonl": write_to_jsonl,
+}
+
+
+@pytest.fixture(params=[DataStorageMode.SNAPSHOT, DataStorageMode.SQLITE])
+def storage_mode(request: pytest.FixtureRequest) -> DataStorageMode:
+    return request.param  # type: ignore[no-any-return]
+
+
+@pytest.mark.parametrize("extension", list(WRITERS))
+@pytest.mark.parametrize("workers", [1, 2])
+def test_import_i_round_trip(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    storage_mode: DataStorageMode,
+    extension: str,
+    workers: int,
+) -> None:
+    # Note: Several chunks. So, the process pool is used.
+    monkeypatch.setattr(import_items, "IMPORT_CHUNK_SIZE", 3)
+    amount = 7
+
+    with DataStorage.load(dir_path=None) as source:
+        fill_data_storage(data_storage=source, amount=amount, seed=1)
+        contacts = list(source.data.contacts.values())
+        notes = list(source.data.notes.values())
+
+    contacts_path = tmp_path / f"contacts.{extension}"
+    notes_path = tmp_path / f"notes.{extension}"
+    WRITERS[extension](items=contacts, path=contacts_path)
+    WRITERS[extension](items=notes, path=notes_path)
+
+    storage_dir = tmp_path / "storage"
+    with DataStorage.load(dir_path=storage_dir, mode=storage_mode) as data_storage:
+        result = contacts_import(data_storage=data_storage, path=contacts_path, workers=workers)
+        assert result.imported == amount
+        assert not result.errors
+
+        assert notes_import(data_storage=data_storage, path=notes_path, workers=workers).imported == amount
+
+        # Note: The same file again. All items already exist.
+        result = contacts_import(data_storage=data_storage, path=contacts_path, workers=workers)
+        assert result.imported == 0
+        assert result.errors_amount == amount
+
+    with DataStorage.load(dir_path=storage_dir) as data_storage:
+        assert list(data_storage.data.contacts.values()) == contacts
+        assert list(data_storage.data.notes.values()) == notes
+
+
+def test_import_i_bad_rows(tmp_path: pathlib.Path) -> None:
+    good = Contact(name="Good", phones=["+380730000001"])
+    path = tmp_path / "contacts.jsonl"
+    path.write_text(
+        "\n".join(
+            [
+                good.model_dump_json(),
+                json.dumps({"name": "Bad phone", "phones": ["123"]}),
+                "",
+                json.dumps({"address": "No name"}),
+                "not a json",
+                good.model_dump_json(),
+            ],
+        ),
+        encoding="utf-8",
+    )
+
+    with DataStorage.load(dir_path=None) as data_storage:
+        result = contacts_import(data_storage=data_storage, path=path)
+
+        assert result.imported == 1
+        assert [error.row for error in result.errors] == [2, 4, 5, 6]
+        assert "123" in result.errors[0].message
+        assert "already exists" in result.errors[-1].message
+        assert list(data_storage.data.contacts.values()) == [good]
+
+
+def test_import_i_csv_i_empty_values(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "contacts.csv"
+    path.write_text("name,address,phones,birthday,extra\nTest,None,,,value\n", encoding="utf-8")
+
+    with DataStorage.load(dir_path=None) as data_storage:
+        assert contacts_import(data_storage=data_storage, path=path).imported == 1
+
+        (contact,) = data_storage.data.contacts.values()
+        assert contact.name == "Test"
+        assert contact.address is None
+        assert contact.phones == []
+        assert contact.birthday is None
+
+
+def test_import_i_wrong_file(tmp_path: pathlib.Path) -> None:
+    with DataStorage.load(dir_path=None) as data_storage:
+        with pytest.raises(InvalidDataError):
+            contacts_import(data_storage=data_storage, path=tmp_path / "contacts.txt")
+
+        with pytest.raises(NotFoundError):
+            contacts_import(data_storage=data_storage, path=tmp_path / "contacts.csv")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[]",
+        ' [ {"a": 1} , {"b": [1, 2]}, 123, "text", {"c": {"d": "]"}} ]\n',
+        json.dumps([{"key": "value" * 10} for _ in range(10)], indent=4),
+    ],
+)
+@pytest.mark.parametrize("read_size", [1, 7, 1024])
+def test_iterate_json_array(monkeypatch: pytest.MonkeyPatch, text: str, read_size: int) -> None:
+    monkeypatch.setattr(import_items, "IMPORT_READ_SIZE", read_size)
+
+    assert list(iterate_json_array(io.StringIO(text))) == json.loads(text)
+
+
+@pytest.mark.parametrize("text", ["", "{}", "[1 2]", "[1,", '[{"a": }]'])
+def test_iterate_json_array_i_invalid(text: str) -> None:
+    with pytest.raises(InvalidDataError):
+        list(iterate_json_array(io.StringIO(text)))
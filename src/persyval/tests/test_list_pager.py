@@ -0,0 +1,141 @@
+import io
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from rich.console import Console
+
+from persyval.models.contact import Contact
+from persyval.services.data_actions.contacts_iterate import contacts_iterate
+from persyval.services.data_actions.contacts_list import contacts_list
+from persyval.services.data_storage.data_storage import DataStorage, DataStorageMode
+from persyval.services.data_storage_filler.data_storage_filler import fill_data_storage
+from persyval.services.execution_queue.execution_queue import create_execution_queue
+from persyval.services.handlers.shared import list_show
+from persyval.services.handlers.shared.items_pager import ItemsPager
+from persyval.services.handlers.shared.list_show import PageAction, items_show
+from persyval.services.handlers.shared.sort_and_filter import ListConfig, ListFilterModeEnum, ListOrderModeEnum
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class CountingFactory:
+    """Lazy items. Counts starts of the iteration and taken items."""
+
+    def __init__(self, amount: int) -> None:
+        self.amount = amount
+        self.starts = 0
+        self.taken = 0
+
+    def __call__(self) -> Iterator[int]:
+        self.starts += 1
+        for item in range(self.amount):
+            self.taken += 1
+            yield item
+
+
+@pytest.mark.parametrize("is_lazy", [False, True])
+def test_items_pager(is_lazy: bool) -> None:  # noqa: FBT001
+    amount = 7
+    factory = CountingFactory(amount)
+    items_factory = factory if is_lazy else lambda: list(range(amount))
+
+    pager = ItemsPager[int](items_factory, page_size=3)
+    assert pager.total == (None if is_lazy else amount)
+
+    assert pager.get_page(0) == ([0, 1, 2], True)
+    assert pager.get_page(1) == ([3, 4, 5], True)
+    assert pager.get_page(2) == ([6], False)
+    assert pager.get_page(3) == ([], False)
+
+    assert pager.total == amount
+    assert pager.pages_amount == 3  # noqa: PLR2004
+
+    assert pager.get_page(1) == ([3, 4, 5], True)
+
+
+def test_items_pager_i_lazy_i_reads_only_needed_items() -> None:
+    factory = CountingFactory(1_000)
+    pager = ItemsPager[int](factory, page_size=10)
+
+    assert pager.get_page(0) == (list(range(10)), True)
+    # Note: Page and the read ahead item.
+    assert factory.taken == 11  # noqa: PLR2004
+
+    assert pager.get_page(5)[0] == list(range(50, 60))
+    assert factory.starts == 1
+
+    # Note: The move back starts the iteration again.
+    assert pager.get_page(2)[0] == list(range(20, 30))
+    assert factory.starts == 2  # noqa: PLR2004
+    assert pager.total is None
+
+
+def test_items_pager_i_empty() -> None:
+    pager = ItemsPager[int](list, page_size=5)
+
+    assert pager.get_page(0) == ([], False)
+    assert pager.pages_amount == 1
+
+    with pytest.raises(ValueError, match="positive"):
+        ItemsPager[int](list, page_size=0)
+
+
+@pytest.mark.parametrize("storage_mode", [DataStorageMode.SNAPSHOT, DataStorageMode.SQLITE])
+@pytest.mark.parametrize(
+    "list_config",
+    [
+        ListConfig(filter_mode=ListFilterModeEnum.ALL, order_mode=ListOrderModeEnum.DEFAULT),
+        ListConfig(
+            filter_mode=ListFilterModeEnum.FILTER,
+            filter_query={"name": "a"},
+            order_mode=ListOrderModeEnum.DEFAULT,
+        ),
+        ListConfig(
+            filter_mode=ListFilterModeEnum.FILTER,
+            filter_query={"name": "a"},
+            order_mode=ListOrderModeEnum.CUSTOM,
+            order_query=["-name"],
+        ),
+    ],
+)
+def test_contacts_iterate_i_same_as_list(storage_mode: DataStorageMode, list_config: ListConfig) -> None:
+    with DataStorage.load(dir_path=None, mode=storage_mode) as data_storage:
+        fill_data_storage(data_storage=data_storage, amount=30, seed=1)
+
+        items: Iterable[object] = contacts_iterate(data_storage=data_storage, list_config=list_config)
+        if list_config.order_mode == ListOrderModeEnum.DEFAULT:
+            assert not isinstance(items, list)
+
+        assert list(items) == contacts_list(data_storage=data_storage, list_config=list_config)
+
+
+def test_items_show_i_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    contacts = [Contact(name=f"Name {index}") for index in range(5)]
+    answers: list[Any] = [PageAction.NEXT, PageAction.NEXT, PageAction.PREVIOUS, contacts[3].uid]
+    shown: list[list[Any]] = []
+
+    def choice_mock(message: str, options: list[tuple[Any, Any]]) -> Any:  # noqa: ANN401, ARG001
+        shown.append([value for value, _ in options])
+        return answers.pop(0)
+
+    monkeypatch.setattr(list_show, "choice", choice_mock)
+    chosen: list[Any] = []
+
+    items_show(
+        items_factory=lambda: iter(contacts),
+        next_action=lambda _, uid: chosen.append(uid),
+        model=Contact,
+        console=Console(file=io.StringIO()),
+        execution_queue=create_execution_queue(),
+        page_size=2,
+    )
+
+    uids = [contact.uid for contact in contacts]
+    assert shown == [
+        [None, PageAction.NEXT, PageAction.JUMP, *uids[0:2]],
+        [None, PageAction.PREVIOUS, PageAction.NEXT, PageAction.JUMP, *uids[2:4]],
+        [None, PageAction.PREVIOUS, PageAction.JUMP, *uids[4:5]],
+        [None, PageAction.PREVIOUS, PageAction.NEXT, PageAction.JUMP, *uids[2:4]],
+    ]
+    assert chosen == [contacts[3].uid]
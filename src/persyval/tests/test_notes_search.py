@@ -0,0 +1,82 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from persyval.models.note import Note
+from persyval.services.data_actions.note_add import note_add
+from persyval.services.data_actions.note_delete import note_delete
+from persyval.services.data_actions.note_update import note_update
+from persyval.services.data_actions.notes_search import notes_search
+from persyval.services.data_storage.data_storage import DataStorage, DataStorageMode
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Generator
+
+
+@pytest.fixture
+def data_storage_fixture() -> Generator[DataStorage]:
+    # https://docs.pytest.org/en/stable/how-to/fixtures.html#yield-fixtures-recommended
+    with DataStorage.load(dir_path=None) as data_storage:
+        yield data_storage
+
+
+def test_notes_search_i_ranking_and_prefix(
+    data_storage_fixture: DataStorage,
+) -> None:
+    python_title = note_add(
+        data_storage_fixture,
+        Note(title="Python", content="Notes about the language.", tags=[]),
+    )
+    python_content = note_add(
+        data_storage_fixture,
+        Note(content="Buy milk. Then write some Python code. Then buy bread. Then sleep.", tags=[]),
+    )
+    note_add(data_storage_fixture, Note(content="Pythagorean theorem.", tags=["math"]))
+    note_add(data_storage_fixture, Note(content="Nothing here.", tags=[]))
+
+    assert notes_search(data_storage_fixture, "python") == [python_title, python_content]
+    assert len(notes_search(data_storage_fixture, "pyth*")) == 3  # noqa: PLR2004
+    assert len(notes_search(data_storage_fixture, "pyth*", limit=1)) == 1
+    assert notes_search(data_storage_fixture, "pyth") == []
+    assert notes_search(data_storage_fixture, "MATH")[0].tags == ["math"]
+
+
+def test_notes_search_i_incremental_updates(
+    data_storage_fixture: DataStorage,
+) -> None:
+    note = note_add(data_storage_fixture, Note(content="First version.", tags=[]))
+    assert notes_search(data_storage_fixture, "first") == [note]
+
+    note_update(data_storage_fixture, note.uid, "Renamed", "Second version.", ["draft"])
+    assert notes_search(data_storage_fixture, "first") == []
+    assert notes_search(data_storage_fixture, "second") == [note]
+    assert notes_search(data_storage_fixture, "draft") == [note]
+
+    note_delete(data_storage_fixture, note.uid)
+    assert notes_search(data_storage_fixture, "second") == []
+
+    note_add(data_storage_fixture, Note(content="Another one.", tags=[]))
+    data_storage_fixture.clear()
+    assert notes_search(data_storage_fixture, "another") == []
+
+
+@pytest.mark.parametrize("mode", list(DataStorageMode))
+def test_notes_search_i_persistence(
+    tmp_path: pathlib.Path,
+    mode: DataStorageMode,
+) -> None:
+    with DataStorage.load(dir_path=tmp_path, mode=mode) as data_storage:
+        note_first = note_add(data_storage, Note(content="Persisted index.", tags=[]))
+        assert notes_search(data_storage, "persisted") == [note_first]
+
+        index_path = data_storage.get_notes_search_index_path()
+
+    assert index_path.exists()
+
+    # Changes without the loaded index. The persisted index must catch up with them.
+    with DataStorage.load(dir_path=tmp_path, mode=mode) as data_storage:
+        note_second = note_add(data_storage, Note(content="Persisted later.", tags=[]))
+
+    with DataStorage.load(dir_path=tmp_path, mode=mode) as data_storage:
+        assert notes_search(data_storage, "persisted") == [note_first, note_second]
@@ -0,0 +1,163 @@
+import datetime
+import re
+from typing import TYPE_CHECKING
+
+import pytest
+
+from persyval.exceptions.main import InvalidCommandError
+from persyval.models.contact import Contact
+from persyval.services.data_actions.contacts_add_many import contacts_add_many
+from persyval.services.data_actions.contacts_list import contacts_list
+from persyval.services.data_storage.data_storage import DataStorage, DataStorageMode
+from persyval.services.handlers.shared.sort_and_filter import (
+    ListConfig,
+    ListFilterModeEnum,
+    ListOrderModeEnum,
+    filter_iterable,
+    get_query_plan,
+)
+from persyval.services.query_engine.query_parser import (
+    AndNode,
+    ConditionNode,
+    NotNode,
+    OrNode,
+    PresenceNode,
+    QueryOperator,
+    parse_query,
+)
+from persyval.services.query_engine.query_planner import QueryAccessPath
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+QUERIES_I_REFERENCE: list[tuple[str, Callable[[Contact], bool]]] = [
+    ("name~^a", lambda item: item.name.lower().startswith("a")),
+    ("name=a OR address=st", lambda item: "a" in item.name.lower() or "st" in (item.address or "").lower()),
+    (
+        "birthday>=1980-01-01 birthday<1990-01-01",
+        lambda item: (
+            item.birthday is not None and datetime.date(1980, 1, 1) <= item.birthday < datetime.date(1990, 1, 1)
+        ),
+    ),
+    ("missing:birthday", lambda item: item.birthday is None),
+    ("has:email AND NOT address=st", lambda item: bool(item.emails) and "st" not in (item.address or "").lower()),
+    (
+        "(name=an OR name=er) AND NOT missing:phone",
+        lambda item: ("an" in item.name.lower() or "er" in item.name.lower()) and bool(item.phones),
+    ),
+    ('phone~"^\\+38073\\d+9$"', lambda item: any(re.search(r"^\+38073\d+9$", phone) for phone in item.phones)),
+    ("name>=m", lambda item: item.name.lower() >= "m"),
+]
+
+
+def make_list_config(query: str) -> ListConfig:
+    return ListConfig(filter_mode=ListFilterModeEnum.QUERY, query=query, order_mode=ListOrderModeEnum.DEFAULT)
+
+
+def test_parse_query_i_priority() -> None:
+    assert parse_query("a=1 OR NOT b~2 c>=3") == OrNode(
+        children=[
+            ConditionNode(field="a", operator=QueryOperator.MATCH, value="1"),
+            AndNode(
+                children=[
+                    NotNode(child=ConditionNode(field="b", operator=QueryOperator.REGEX, value="2")),
+                    ConditionNode(field="c", operator=QueryOperator.GREATER_OR_EQUAL, value="3"),
+                ],
+            ),
+        ],
+    )
+
+
+def test_parse_query_i_parentheses_and_quotes() -> None:
+    assert parse_query('(a="x \\" y" or has:b)and missing:c') == AndNode(
+        children=[
+            OrNode(
+                children=[
+                    ConditionNode(field="a", operator=QueryOperator.MATCH, value='x " y'),
+                    PresenceNode(field="b", is_present=True),
+                ],
+            ),
+            PresenceNode(field="c", is_present=False),
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    ("query", "match"),
+    [
+        ("", "empty"),
+        ("name", "Unexpected word"),
+        ("(name=a", "ends unexpectedly"),
+        ("name=a)", "Unexpected"),
+        ("name=a AND", "ends unexpectedly"),
+        ("some:name", "Unknown predicate"),
+    ],
+)
+def test_parse_query_i_invalid(query: str, match: str) -> None:
+    with pytest.raises(InvalidCommandError, match=match):
+        parse_query(query)
+
+
+@pytest.mark.parametrize(
+    ("query", "match"),
+    [
+        ("unknown=a", "not allowed"),
+        ("birthday>=abc", "Invalid value"),
+        ('name~"("', "Invalid regex"),
+    ],
+)
+def test_query_plan_i_invalid(query: str, match: str) -> None:
+    with pytest.raises(InvalidCommandError, match=match):
+        get_query_plan(Contact, query)
+
+
+@pytest.mark.parametrize(("query", "reference"), QUERIES_I_REFERENCE)
+def test_query_i_same_as_reference(
+    contacts_fixture: list[Contact],
+    query: str,
+    reference: Callable[[Contact], bool],
+) -> None:
+    expected = [contact for contact in contacts_fixture if reference(contact)]
+
+    assert filter_iterable(contacts_fixture, Contact, make_list_config(query)) == expected
+    assert expected
+
+
+@pytest.mark.parametrize(
+    ("query", "candidate_queries", "access_path"),
+    [
+        ("name=Ann birthday>=1990-01-01", [{"name": "ann"}], QueryAccessPath.INDEX),
+        (
+            "(phone=1 OR email=x) AND name=bo",
+            [{"phones": "1", "name": "bo"}, {"emails": "x", "name": "bo"}],
+            QueryAccessPath.INDEX_UNION,
+        ),
+        ("name~^a OR name=b", None, QueryAccessPath.FULL_SCAN),
+        ("NOT name=a", None, QueryAccessPath.FULL_SCAN),
+        ("has:email", None, QueryAccessPath.FULL_SCAN),
+    ],
+)
+def test_query_plan_i_access_path(
+    query: str,
+    candidate_queries: list[dict[str, str]] | None,
+    access_path: QueryAccessPath,
+) -> None:
+    plan = get_query_plan(Contact, query)
+
+    assert plan.candidate_queries == candidate_queries
+    assert plan.access_path == access_path
+
+
+@pytest.mark.parametrize("storage_mode", [DataStorageMode.SNAPSHOT, DataStorageMode.SQLITE])
+def test_query_i_sections_same_as_scan(storage_mode: DataStorageMode, contacts_fixture: list[Contact]) -> None:
+    queries = [query for query, _ in QUERIES_I_REFERENCE]
+    queries.append(f"uid={contacts_fixture[7].uid} OR uid={contacts_fixture[3].uid}")
+
+    with DataStorage.load(dir_path=None, mode=storage_mode) as data_storage:
+        contacts_add_many(data_storage=data_storage, contacts=contacts_fixture)
+
+        for query in queries:
+            list_config = make_list_config(query)
+            expected = filter_iterable(contacts_fixture, Contact, list_config)
+
+            assert contacts_list(data_storage=data_storage, list_config=list_config) == expected, query
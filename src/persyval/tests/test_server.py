@@ -0,0 +1,75 @@
+import io
+import stat
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from persyval.services.data_storage.data_storage import DataStorage
+from persyval.services.data_storage_filler.data_storage_filler import fill_data_storage
+from persyval.services.server.client import send_request
+from persyval.services.server.protocol import EXIT_CODE_I_ERROR, EXIT_CODE_I_OK, ServerRequest
+from persyval.services.server.server import SOCKET_DIR_PERMISSIONS, SOCKET_PERMISSIONS, open_storage_server
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+def send(socket_path: pathlib.Path, request: ServerRequest) -> tuple[int, str]:
+    output = io.StringIO()
+    exit_code = send_request(socket_path=socket_path, request=request, output=output)
+    return exit_code, output.getvalue()
+
+
+def test_server(tmp_path: pathlib.Path) -> None:
+    socket_path = tmp_path / "server.sock"
+    amount = 3
+
+    with DataStorage.load(dir_path=tmp_path) as data_storage:
+        fill_data_storage(data_storage=data_storage, amount=amount, seed=1)
+
+        with open_storage_server(socket_path=socket_path, data_storage=data_storage) as server:
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+            try:
+                exit_code, output = send(socket_path, ServerRequest(predefined_input="storage_stats"))
+                assert exit_code == EXIT_CODE_I_OK
+                assert f"Contacts │ {amount}" in output
+
+                exit_code, output = send(
+                    socket_path,
+                    ServerRequest(predefined_input="contacts_list default '' all ''", plain_render=True),
+                )
+                assert exit_code == EXIT_CODE_I_OK
+                assert output.split() == [str(uid) for uid in data_storage.data.contacts]
+
+                exit_code, _ = send(
+                    socket_path,
+                    ServerRequest(predefined_input="wrong_command", raise_sys_exit_on_error=True),
+                )
+                assert exit_code == EXIT_CODE_I_ERROR
+
+                with (
+                    pytest.raises(FileExistsError),
+                    open_storage_server(socket_path=socket_path, data_storage=data_storage),
+                ):
+                    pass
+            finally:
+                server.shutdown()
+                thread.join()
+
+    assert not socket_path.exists()
+
+    with pytest.raises(ConnectionError):
+        send(socket_path, ServerRequest(predefined_input="storage_stats"))
+
+
+def test_server_i_permissions(tmp_path: pathlib.Path) -> None:
+    socket_path = tmp_path / "run" / "server.sock"
+
+    with (
+        DataStorage.load(dir_path=None) as data_storage,
+        open_storage_server(socket_path=socket_path, data_storage=data_storage),
+    ):
+        assert stat.S_IMODE(socket_path.stat().st_mode) == SOCKET_PERMISSIONS
+        assert stat.S_IMODE(socket_path.parent.stat().st_mode) == SOCKET_DIR_PERMISSIONS
@@ -0,0 +1,80 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from persyval.models.contact import Contact
+from persyval.services.handlers.shared.sort_and_filter import (
+    ListConfig,
+    ListFilterModeEnum,
+    ListOrderModeEnum,
+    filter_iterable,
+)
+from persyval.tests.conftest import sort_items_i_reference
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.mark.parametrize(
+    "order_query",
+    [
+        [],
+        ["name"],
+        ["-name"],
+        ["birthday", "-name"],
+        ["-birthday", "address", "-name"],
+    ],
+)
+@pytest.mark.parametrize(("offset", "limit"), [(0, 0), (0, 1), (0, 10), (5, 10), (240, 100), (300, 10)])
+def test_filter_iterable_i_limit_i_same_as_slice_of_all(
+    contacts_fixture: list[Contact],
+    order_query: list[str],
+    offset: int,
+    limit: int,
+) -> None:
+    list_config = ListConfig(
+        filter_mode=ListFilterModeEnum.FILTER,
+        filter_query={"name": "a"},
+        order_mode=ListOrderModeEnum.CUSTOM,
+        order_query=order_query,
+    )
+    expected = sort_items_i_reference([item for item in contacts_fixture if "a" in item.name.lower()], order_query)
+
+    list_config_limited = list_config.model_copy(update={"offset": offset, "limit": limit})
+
+    assert filter_iterable(contacts_fixture, Contact, list_config_limited) == expected[offset : offset + limit]
+
+
+def test_filter_iterable_i_offset_only(contacts_fixture: list[Contact]) -> None:
+    list_config = ListConfig(
+        filter_mode=ListFilterModeEnum.ALL,
+        order_mode=ListOrderModeEnum.CUSTOM,
+        order_query=["name"],
+    )
+    expected = filter_iterable(contacts_fixture, Contact, list_config)
+
+    assert filter_iterable(contacts_fixture, Contact, list_config.model_copy(update={"offset": 7})) == expected[7:]
+
+
+def test_filter_iterable_i_default_order_i_streamed(contacts_fixture: list[Contact]) -> None:
+    taken: list[Contact] = []
+
+    def iterate() -> Iterator[Contact]:
+        for contact in contacts_fixture:
+            taken.append(contact)
+            yield contact
+
+    list_config = ListConfig(
+        filter_mode=ListFilterModeEnum.ALL,
+        order_mode=ListOrderModeEnum.DEFAULT,
+        offset=3,
+        limit=5,
+    )
+
+    assert filter_iterable(iterate(), Contact, list_config) == contacts_fixture[3:8]
+    assert len(taken) == 8  # noqa: PLR2004
+
+
+def test_list_config_i_negative_limit() -> None:
+    with pytest.raises(ValueError, match="greater than or equal to 0"):
+        ListConfig(limit=-1)
@@ -0,0 +1,49 @@
+import datetime
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from persyval.services.sort_engine.sort_engine import encode_column, select_top, sort_items
+from persyval.tests.conftest import sort_items_i_reference
+
+if TYPE_CHECKING:
+    from persyval.models.contact import Contact
+
+
+@pytest.mark.parametrize(
+    "order_query",
+    [
+        [],
+        ["name"],
+        ["-name"],
+        ["birthday"],
+        ["-birthday"],
+        ["birthday", "-name"],
+        ["-address", "name"],
+        ["-birthday", "name", "-address", "phones", "-emails"],
+    ],
+)
+def test_sort_items_i_same_as_multi_pass(contacts_fixture: list[Contact], order_query: list[str]) -> None:
+    expected = sort_items_i_reference(contacts_fixture, order_query)
+
+    assert sort_items(contacts_fixture, order_query) == expected
+    assert select_top(contacts_fixture, order_query, 25) == expected[:25]
+
+
+@pytest.mark.parametrize(
+    ("values", "is_descending", "expected"),
+    [
+        ([datetime.date(2000, 1, 2), None, datetime.date(2000, 1, 1)], False, [730121, 0, 730120]),
+        ([datetime.date(2000, 1, 2), None, datetime.date(2000, 1, 1)], True, [-730121, 1, -730120]),
+        (["B", "a"], False, ["b", "a"]),
+        (["B", None, ""], False, ["\x00b", "", "\x00"]),
+        (["b", "a", None, "B"], True, [-1, 0, 1, -1]),
+        ([3, None, 1.5], True, [-3, None, -1.5]),
+        ([["b"], None, ["a", "c"], ["b"]], True, [-1, 1, 0, -1]),
+        ([["B", "c"], ["a"], ["b"]], False, ["b\x00c", "a", "b"]),
+        ([[1, 2], [1]], True, [-1, 0]),
+        ([None], True, [None]),
+    ],
+)
+def test_encode_column(values: list[Any], is_descending: bool, expected: list[Any]) -> None:  # noqa: FBT001
+    assert encode_column(values, is_descending=is_descending) == expected
@@ -0,0 +1,82 @@
+import os
+import re
+import subprocess
+import sys
+from typing import TYPE_CHECKING, Final
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import pathlib
+
+IMPORT_TIME_BUDGET_ENV: Final[str] = "PERSYVAL_I_IMPORT_TIME_BUDGET"
+DEFAULT_IMPORT_TIME_BUDGET: Final[float] = 1.5
+"""Seconds. With the margin for slow machines. Usual time is several times less."""
+
+PATTERN_I_IMPORT_TIME: Final[re.Pattern[str]] = re.compile(r"^import time:\s+(\d+) \|\s+\d+ \|\s+(\S+)$")
+
+HEAVY_MODULES: Final[tuple[str, ...]] = (
+    "faker",
+    "phonenumbers",
+    "email_validator",
+    "dateutil",
+)
+
+HANDLERS_PACKAGE: Final[str] = "persyval.services.handlers."
+HANDLERS_ALLOWED: Final[tuple[str, ...]] = (
+    f"{HANDLERS_PACKAGE}shared",
+    f"{HANDLERS_PACKAGE}storage_stats",
+)
+
+
+class ImportTimeReport(BaseModel):
+    total_seconds: float
+    modules: set[str]
+
+
+def run_with_import_time(args: list[str]) -> ImportTimeReport:
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-m", "persyval", *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    total_us = 0
+    modules: set[str] = set()
+    for line in completed.stderr.splitlines():
+        match = PATTERN_I_IMPORT_TIME.match(line)
+        if match is None:
+            continue
+
+        total_us += int(match.group(1))
+        modules.add(match.group(2))
+
+    return ImportTimeReport(total_seconds=total_us / 1_000_000, modules=modules)
+
+
+def test_startup_i_storage_stats_i_import_time(tmp_path: pathlib.Path) -> None:
+    report = run_with_import_time(
+        [
+            "chat",
+            "run",
+            "--storage-dir",
+            str(tmp_path),
+            "--non-interactive",
+            "--hide-intro",
+            "storage_stats",
+        ],
+    )
+
+    heavy = sorted(module for module in report.modules if module.split(".")[0] in HEAVY_MODULES)
+    assert not heavy, heavy
+
+    handlers = sorted(
+        module
+        for module in report.modules
+        if module.startswith(HANDLERS_PACKAGE) and not module.startswith(HANDLERS_ALLOWED)
+    )
+    assert not handlers, handlers
+
+    budget = float(os.environ.get(IMPORT_TIME_BUDGET_ENV) or DEFAULT_IMPORT_TIME_BUDGET)
+    assert report.total_seconds < budget, f"Import time {report.total_seconds:.3f}s exceeds the budget {budget}s."
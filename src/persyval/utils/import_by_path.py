@@ -0,0 +1,23 @@
+import functools
+import importlib
+from typing import Any
+
+
+@functools.cache
+def import_by_path(path: str) -> Any:  # noqa: ANN401
+    """Import the object by its dotted path. For example, `package.module.ClassName`.
+
+    Raises:
+        ImportError: If the module or the object is not found.
+    """
+    module_path, _, name = path.rpartition(".")
+    if not module_path:
+        msg = f"Not a dotted path: {path}"
+        raise ImportError(msg)
+
+    module = importlib.import_module(module_path)
+    try:
+        return getattr(module, name)
+    except AttributeError:
+        msg = f"Module `{module_path}` has no `{name}`."
+        raise ImportError(msg) from None